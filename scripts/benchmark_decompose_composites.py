@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+"""Benchmark the decomposition of composite glyphs, with and without the
+FontInstancer decomposed path cache. A composite-heavy test font is built
+from MutatorSans: every base letter is combined with every mark, and each
+of these composites is itself used in a number of nested composites.
+"""
+
+import argparse
+import asyncio
+import pathlib
+import tempfile
+import time
+from contextlib import aclosing
+from dataclasses import replace
+
+from fontra.backends import getFileSystemBackend, newFileSystemBackend
+from fontra.backends.copy import copyFont
+from fontra.core.classes import Component, Layer, VariableGlyph
+from fontra.core.instancer import FontInstancer
+from fontra.workflow.actions.glyph import decomposeComposites
+
+repoDir = pathlib.Path(__file__).resolve().parent.parent
+mutatorSansPath = repoDir / "test-common" / "fonts" / "MutatorSans.fontra"
+
+baseGlyphNames = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+markGlyphNames = ["acute", "dieresis"]
+
+
+def makeComposite(
+    templateGlyph: VariableGlyph, glyphName: str, components: list[Component]
+) -> VariableGlyph:
+    return replace(
+        templateGlyph,
+        name=glyphName,
+        layers={
+            layerName: Layer(
+                glyph=replace(
+                    layer.glyph, path=type(layer.glyph.path)(), components=components
+                )
+            )
+            for layerName, layer in templateGlyph.layers.items()
+        },
+    )
+
+
+async def buildTestFont(fontPath: pathlib.Path, numNestingCopies: int) -> list[str]:
+    source = getFileSystemBackend(mutatorSansPath)
+    dest = newFileSystemBackend(fontPath)
+    compositeNames = []
+    async with aclosing(source), aclosing(dest):
+        await copyFont(source, dest)
+        templateGlyph = await source.getGlyph("Aacute")
+        assert templateGlyph is not None
+        for baseName in baseGlyphNames:
+            for markName in markGlyphNames:
+                glyphName = f"{baseName}_{markName}"
+                glyph = makeComposite(
+                    templateGlyph,
+                    glyphName,
+                    [
+                        Component(name=baseName),
+                        Component(name=markName),
+                    ],
+                )
+                await dest.putGlyph(glyphName, glyph, [])
+                compositeNames.append(glyphName)
+                for i in range(numNestingCopies):
+                    nestedName = f"{glyphName}.alt{i}"
+                    nested = makeComposite(
+                        templateGlyph,
+                        nestedName,
+                        [Component(name=glyphName), Component(name=markName)],
+                    )
+                    await dest.putGlyph(nestedName, nested, [])
+                    compositeNames.append(nestedName)
+    return compositeNames
+
+
+async def decomposeAll(
+    fontPath: pathlib.Path, glyphNames: list[str], cacheSize: int
+) -> tuple[float, FontInstancer]:
+    backend = getFileSystemBackend(fontPath)
+    async with aclosing(backend):
+        fontInstancer = FontInstancer(backend, decomposedPathCacheSize=cacheSize)
+        t = time.perf_counter()
+        for glyphName in glyphNames:
+            instancer = await fontInstancer.getGlyphInstancer(glyphName)
+            await decomposeComposites(fontInstancer, instancer)
+        return time.perf_counter() - t, fontInstancer
+
+
+async def mainAsync(numNestingCopies: int, numRounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpDir:
+        fontPath = pathlib.Path(tmpDir) / "CompositeHeavy.fontra"
+        glyphNames = await buildTestFont(fontPath, numNestingCopies)
+        print(f"decomposing {len(glyphNames)} composite glyphs")
+
+        for label, cacheSize in [("uncached", 0), ("cached", 1000)]:
+            timings = []
+            for i in range(numRounds):
+                elapsed, fontInstancer = await decomposeAll(
+                    fontPath, glyphNames, cacheSize
+                )
+                timings.append(elapsed)
+            print(
+                f"{label:>9}: best of {numRounds}: {min(timings):.3f}s "
+                f"(path cache hits: {fontInstancer.decomposedPathCacheHits}, "
+                f"misses: {fontInstancer.decomposedPathCacheMisses})"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--nesting-copies",
+        type=int,
+        default=4,
+        help="The number of nested composites to create for each composite",
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(mainAsync(args.nesting_copies, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+"""Benchmark the .fontra glyph file formats, comparing the unpacked format (a
+dict per point) with the packed format (flat coordinate and point type lists).
+All glyphs of the given font are written to and read back from a temporary
+.fontra project in each format. The glyphs are loaded from the source font up
+front, so only the .fontra backend is measured.
+"""
+
+import argparse
+import asyncio
+import pathlib
+import tempfile
+import time
+
+from fontra.backends import getFileSystemBackend
+from fontra.backends.fontra import (
+    GLYPH_FORMAT_PACKED,
+    GLYPH_FORMAT_UNPACKED,
+    FontraBackend,
+)
+
+repoDir = pathlib.Path(__file__).resolve().parent.parent
+defaultFontPath = repoDir / "test-common" / "fonts" / "MutatorSans.fontra"
+
+
+async def loadGlyphs(fontPath):
+    backend = getFileSystemBackend(fontPath)
+    glyphMap = await backend.getGlyphMap()
+    glyphs = {}
+    for glyphName, codePoints in glyphMap.items():
+        glyph = await backend.getGlyph(glyphName)
+        if glyph is not None:
+            glyphs[glyphName] = (glyph, codePoints)
+    await backend.aclose()
+    return glyphs
+
+
+async def writeGlyphs(projectPath, glyphs, glyphFormatVersion):
+    backend = FontraBackend.createFromPath(projectPath)
+    backend.setGlyphFormatVersion(glyphFormatVersion)
+    for glyphName, (glyph, codePoints) in glyphs.items():
+        await backend.putGlyph(glyphName, glyph, codePoints)
+    await backend.aclose()
+
+
+async def readGlyphs(projectPath, glyphNames):
+    backend = FontraBackend.fromPath(projectPath)
+    glyphs = [await backend.getGlyph(glyphName) for glyphName in glyphNames]
+    await backend.aclose()
+    return glyphs
+
+
+async def timeIt(rounds, func, *args):
+    timings = []
+    for i in range(rounds):
+        t = time.perf_counter()
+        result = await func(*args)
+        timings.append(time.perf_counter() - t)
+    return min(timings), result
+
+
+async def mainAsync():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("font", nargs="?", type=pathlib.Path, default=defaultFontPath)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    glyphs = await loadGlyphs(args.font)
+    numGlyphs = len(glyphs)
+    print(f"writing and reading {numGlyphs} glyphs")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpDir:
+        for label, glyphFormatVersion in [
+            ("unpacked", GLYPH_FORMAT_UNPACKED),
+            ("packed", GLYPH_FORMAT_PACKED),
+        ]:
+            projectPath = pathlib.Path(tmpDir) / f"{label}.fontra"
+            writeTime, _ = await timeIt(
+                args.rounds, writeGlyphs, projectPath, glyphs, glyphFormatVersion
+            )
+            readTime, results[label] = await timeIt(
+                args.rounds, readGlyphs, projectPath, list(glyphs)
+            )
+            size = sum(
+                path.stat().st_size for path in (projectPath / "glyphs").iterdir()
+            )
+            print(
+                f"{label:>8}: write {writeTime:.3f}s "
+                f"({1_000_000 * writeTime / numGlyphs:.1f}µs per glyph), "
+                f"read {readTime:.3f}s "
+                f"({1_000_000 * readTime / numGlyphs:.1f}µs per glyph), "
+                f"glyph files {size / 1024:.1f} KiB"
+            )
+
+    if results["packed"] != results["unpacked"]:
+        print("WARNING: the results differ")
+
+
+def main():
+    asyncio.run(mainAsync())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""Benchmark reading .glif files into StaticGlyph objects, comparing the fast
+GLIF parser with glifLib and PackedPathPointPen. All glyphs of all layers of
+the given UFOs are read. The GLIF data is read from disk up front, so only
+parsing is measured.
+"""
+
+import argparse
+import pathlib
+import time
+
+from fontTools.ufoLib import UFOReaderWriter
+
+from fontra.backends.designspace import ufoLayerToStaticGlyph
+
+repoDir = pathlib.Path(__file__).resolve().parent.parent
+defaultUFOPaths = sorted((repoDir / "test-py" / "data" / "mutatorsans").glob("*.ufo"))
+
+
+class PreloadedGlyphSet:
+    # Provides the parts of the GlyphSet API used by ufoLayerToStaticGlyph,
+    # reading from memory instead of from disk
+
+    def __init__(self, glyphSet):
+        self.glyphSet = glyphSet
+        self.glifData = {
+            glyphName: glyphSet.getGLIF(glyphName) for glyphName in glyphSet.keys()
+        }
+
+    def getGLIF(self, glyphName):
+        return self.glifData[glyphName]
+
+    def readGlyph(self, glyphName, glyphObject=None, pointPen=None, validate=None):
+        from fontTools.ufoLib.glifLib import readGlyphFromString
+
+        readGlyphFromString(
+            self.glifData[glyphName], glyphObject, pointPen, validate=validate
+        )
+
+
+def loadGlyphSets(ufoPaths):
+    glyphSets = []
+    for ufoPath in ufoPaths:
+        reader = UFOReaderWriter(ufoPath)
+        for layerName in reader.getLayerNames():
+            glyphSet = reader.getGlyphSet(layerName, defaultLayer=False)
+            glyphSets.append(PreloadedGlyphSet(glyphSet))
+    return glyphSets
+
+
+def readAllGlyphs(glyphSets, useFastParser):
+    return [
+        ufoLayerToStaticGlyph(glyphSet, glyphName, useFastParser=useFastParser)
+        for glyphSet in glyphSets
+        for glyphName in glyphSet.glifData
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("ufos", nargs="*", type=pathlib.Path)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    glyphSets = loadGlyphSets(args.ufos or defaultUFOPaths)
+    numGlyphs = sum(len(glyphSet.glifData) for glyphSet in glyphSets)
+    print(f"parsing {numGlyphs} glyphs from {len(glyphSets)} layers")
+
+    results = {}
+    for label, useFastParser in [("glifLib", False), ("fast", True)]:
+        timings = []
+        for i in range(args.rounds):
+            t = time.perf_counter()
+            results[label] = readAllGlyphs(glyphSets, useFastParser)
+            timings.append(time.perf_counter() - t)
+        best = min(timings)
+        print(
+            f"{label:>8}: best of {args.rounds}: {best:.3f}s "
+            f"({1_000_000 * best / numGlyphs:.1f}µs per glyph)"
+        )
+
+    staticGlyphs = [staticGlyph for staticGlyph, _ in results["fast"]]
+    expectedStaticGlyphs = [staticGlyph for staticGlyph, _ in results["glifLib"]]
+    if staticGlyphs != expectedStaticGlyphs:
+        print("WARNING: the results differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+"""Benchmark opening binary fonts with the OpenType backend. For each font, the
+time to open it and to read one glyph, and the growth of the peak resident set
+size (RSS), are measured in a fresh process. The "eager" mode additionally sets
+up everything that used to be set up when opening a font (axes, glyph set,
+gvar, VARC and CFF2 data), for comparison. Without font arguments, a font with
+a large number of glyphs is generated.
+"""
+
+import argparse
+import asyncio
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from fontra.backends.opentype import OTFBackend
+
+
+def buildLargeFont(path, numGlyphs):
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    pen = TTGlyphPen(None)
+    pen.moveTo((100, 0))
+    pen.lineTo((100, 700))
+    pen.lineTo((500, 700))
+    pen.lineTo((500, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+
+    glyphOrder = [".notdef"] + [f"uni{0x4E00 + i:04X}" for i in range(numGlyphs - 1)]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyphOrder)
+    fb.setupCharacterMap(
+        {0x4E00 + i: glyphName for i, glyphName in enumerate(glyphOrder[1:])}
+    )
+    fb.setupGlyf({glyphName: glyph for glyphName in glyphOrder})
+    fb.setupHorizontalMetrics({glyphName: (600, 100) for glyphName in glyphOrder})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Large", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(path)
+
+
+async def openFont(path, eager):
+    backend = OTFBackend.fromPath(path)
+    glyphMap = await backend.getGlyphMap()
+    if eager:
+        for attrName in [
+            "axes",
+            "glyphSet",
+            "gvarVariations",
+            "varcTable",
+            "charStrings",
+        ]:
+            getattr(backend, attrName)
+    glyphName = next(iter(glyphMap))
+    await backend.getGlyph(glyphName)
+    return backend, len(glyphMap)
+
+
+def measure(path, eager):
+    rssBefore = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t = time.perf_counter()
+    backend, numGlyphs = asyncio.run(openFont(path, eager))
+    openTime = time.perf_counter() - t
+    rssAfter = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(
+        json.dumps(
+            dict(
+                numGlyphs=numGlyphs,
+                openTime=openTime,
+                # ru_maxrss is in KiB on Linux, but in bytes on macOS
+                rssGrowth=(rssAfter - rssBefore)
+                * (1 if sys.platform == "darwin" else 1024),
+            )
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("fonts", nargs="*", type=pathlib.Path)
+    parser.add_argument("--num-glyphs", type=int, default=65000)
+    parser.add_argument("--measure", choices=["eager", "lazy"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.fonts[0], args.measure == "eager")
+        return
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        fontPaths = args.fonts
+        if not fontPaths:
+            fontPath = pathlib.Path(tmpDir) / "Large.ttf"
+            print(f"generating a font with {args.num_glyphs} glyphs")
+            buildLargeFont(fontPath, args.num_glyphs)
+            fontPaths = [fontPath]
+
+        for fontPath in fontPaths:
+            for mode in ["eager", "lazy"]:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--measure", mode, fontPath],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result = json.loads(output)
+                print(
+                    f"{fontPath.name} ({result['numGlyphs']} glyphs), {mode:>5}: "
+                    f"{result['openTime']:.3f}s, "
+                    f"RSS +{result['rssGrowth'] / 2**20:.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
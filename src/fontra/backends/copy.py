@@ -1,17 +1,29 @@
 import argparse
 import asyncio
+import csv
+import hashlib
 import logging
+import multiprocessing.util
+import os
 import pathlib
 import shutil
-from contextlib import aclosing, asynccontextmanager
+import time
+from collections import defaultdict, deque
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from functools import partial
+from typing import Iterable
 
+from ..core.classes import VariableGlyph
 from ..core.protocols import (
     ReadableFontBackend,
     ReadBackgroundImage,
+    ReadGlyphs,
     WritableFontBackend,
     WriteBackgroundImage,
 )
+from ..core.subprocess import runInSubProcess
 from . import getFileSystemBackend, newFileSystemBackend
+from .fontra import GLYPH_FORMAT_PACKED, readJournal
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +36,18 @@ async def copyFont(
     numTasks=1,
     progressInterval=0,
     continueOnError=False,
+    glyphReader=None,
+    journal=None,
+    reportInterval=0,
 ) -> None:
+    """Copy the font data from `sourceBackend` to `destBackend`. If given,
+    `glyphReader` is used instead of `sourceBackend` to read the glyphs. It must
+    have `getGlyph()` and `getGlyphs()` methods, like `SubProcessGlyphReader`.
+
+    If a `CopyJournal` is given, glyphs that it records as copied are not written
+    again, unless the source glyph changed. Progress is logged every
+    `progressInterval` glyphs and every `reportInterval` seconds.
+    """
     if glyphNames is not None:
         from ..workflow.actions.subset import SubsetGlyphs
 
@@ -40,6 +63,9 @@ async def copyFont(
             numTasks=numTasks,
             progressInterval=progressInterval,
             continueOnError=continueOnError,
+            glyphReader=glyphReader,
+            journal=journal,
+            reportInterval=reportInterval,
         )
 
 
@@ -50,26 +76,46 @@ async def _copyFont(
     numTasks=1,
     progressInterval=0,
     continueOnError=False,
+    glyphReader=None,
+    journal=None,
+    reportInterval=0,
 ) -> None:
-    await destBackend.putUnitsPerEm(await sourceBackend.getUnitsPerEm())
-    await destBackend.putFontInfo(await sourceBackend.getFontInfo())
-    await destBackend.putAxes(await sourceBackend.getAxes())
-    await destBackend.putSources(await sourceBackend.getSources())
-    await destBackend.putCustomData(await sourceBackend.getCustomData())
+    statistics = CopyStatistics(progressInterval, reportInterval)
+    with statistics.timing("metadata"):
+        await destBackend.putUnitsPerEm(await sourceBackend.getUnitsPerEm())
+        await destBackend.putFontInfo(await sourceBackend.getFontInfo())
+        await destBackend.putAxes(await sourceBackend.getAxes())
+        await destBackend.putSources(await sourceBackend.getSources())
+        await destBackend.putCustomData(await sourceBackend.getCustomData())
     glyphMap = await sourceBackend.getGlyphMap()
-    glyphNamesToCopy = sorted(glyphMap)
+    if journal is not None:
+        # Only trust the journal for glyphs that made it to the destination
+        journal.retainGlyphs(await destBackend.getGlyphMap())
+    glyphNamesToCopy = deque(sorted(glyphMap))
     glyphNamesCopied: set[str] = set()
+    if glyphReader is None and isinstance(sourceBackend, ReadGlyphs):
+        glyphReader = sourceBackend
+    glyphSource: ReadableFontBackend | GlyphPrefetcher = (
+        GlyphPrefetcher(
+            glyphReader,
+            glyphNamesToCopy,
+            maxPendingBatches=getattr(glyphReader, "numProcesses", 1),
+        )
+        if glyphReader is not None
+        else sourceBackend
+    )
 
     tasks = [
         asyncio.create_task(
             copyGlyphs(
-                sourceBackend,
+                glyphSource,
                 destBackend,
                 glyphMap,
                 glyphNamesToCopy,
                 glyphNamesCopied,
-                progressInterval,
                 continueOnError,
+                statistics,
+                journal,
             )
         )
         for i in range(numTasks)
@@ -87,39 +133,312 @@ async def _copyFont(
         assert e is not None
         raise e
 
-    if isinstance(destBackend, WriteBackgroundImage):
-        backgroundImageIdentifiers = [info for t in done for info in t.result()]
-        if backgroundImageIdentifiers:
-            assert isinstance(sourceBackend, ReadBackgroundImage), type(sourceBackend)
-            for imageIdentifier in backgroundImageIdentifiers:
-                imageData = await sourceBackend.getBackgroundImage(imageIdentifier)
-                if imageData is not None:
-                    await destBackend.putBackgroundImage(imageIdentifier, imageData)
+    with statistics.timing("metadata"):
+        if isinstance(destBackend, WriteBackgroundImage):
+            backgroundImageIdentifiers = [info for t in done for info in t.result()]
+            if backgroundImageIdentifiers:
+                assert isinstance(sourceBackend, ReadBackgroundImage), type(
+                    sourceBackend
+                )
+                for imageIdentifier in backgroundImageIdentifiers:
+                    imageData = await sourceBackend.getBackgroundImage(imageIdentifier)
+                    if imageData is not None:
+                        await destBackend.putBackgroundImage(imageIdentifier, imageData)
+
+        await destBackend.putKerning(await sourceBackend.getKerning())
+        await destBackend.putFeatures(await sourceBackend.getFeatures())
+
+    # Some backends defer writes, make sure the copy is complete when we
+    # return, even if the caller doesn't close the backend
+    with statistics.timing("write"):
+        flushBackend(destBackend)
+    if journal is not None:
+        journal.commit()
+
+    statistics.logSummary()
+
+
+def flushBackend(backend) -> None:
+    if hasattr(backend, "flush"):
+        backend.flush()
+
+
+class GlyphPrefetcher:
+    """Read glyphs in batches from a backend that supports `getGlyphs()`.
+    When a glyph is requested that isn't already being read, it is read
+    together with the glyphs that are next in line in `upcomingGlyphNames`.
+    Up to `maxPendingBatches` batches of upcoming glyphs are read ahead, so a
+    backend that reads in parallel can be kept busy.
+    """
+
+    def __init__(
+        self,
+        backend,
+        upcomingGlyphNames: deque[str],
+        batchSize=64,
+        maxPendingBatches=1,
+    ):
+        self.backend = backend
+        self.upcomingGlyphNames = upcomingGlyphNames
+        self.batchSize = batchSize
+        self.maxPendingBatches = maxPendingBatches
+        self._batches: dict[str, asyncio.Task[dict[str, VariableGlyph | None]]] = {}
+        self._pendingBatches: set[asyncio.Task] = set()
+
+    async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
+        batch = self._batches.pop(glyphName, None)
+        if batch is None:
+            batch = self._startBatch([glyphName])
+        self._readAhead()
+        try:
+            glyphs = await batch
+        except Exception:
+            # Read the glyph by itself, so the error is attributed to the glyph
+            # that caused it
+            return await self.backend.getGlyph(glyphName)
+        return glyphs.get(glyphName)
+
+    def _startBatch(self, glyphNames: list[str]) -> asyncio.Task:
+        for upcomingGlyphName in self.upcomingGlyphNames:
+            if len(glyphNames) >= self.batchSize:
+                break
+            if (
+                upcomingGlyphName not in self._batches
+                and upcomingGlyphName not in glyphNames
+            ):
+                glyphNames.append(upcomingGlyphName)
+        batch = asyncio.create_task(self.backend.getGlyphs(glyphNames))
+        self._pendingBatches.add(batch)
+        batch.add_done_callback(self._pendingBatches.discard)
+        for glyphName in glyphNames:
+            self._batches.setdefault(glyphName, batch)
+        return batch
+
+    def _readAhead(self) -> None:
+        while len(self._pendingBatches) < self.maxPendingBatches:
+            if all(glyphName in self._batches for glyphName in self.upcomingGlyphNames):
+                break
+            self._startBatch([])
+
+
+class SubProcessGlyphReader:
+    """Read glyphs from the font at `path` in the worker processes of the shared
+    process pool. `copyFont()` reads up to `numProcesses` batches at a time.
+    Each worker process opens the font with its own backend, which stays open
+    for later requests, and is closed when the worker process exits.
+    """
+
+    def __init__(self, path: os.PathLike | str, numProcesses: int):
+        self.path = os.fspath(path)
+        self.numProcesses = numProcesses
+
+    async def aclose(self) -> None:
+        pass
+
+    async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
+        return (await self.getGlyphs([glyphName]))[glyphName]
+
+    async def getGlyphs(
+        self, glyphNames: Iterable[str]
+    ) -> dict[str, VariableGlyph | None]:
+        return await runInSubProcess(
+            partial(_readGlyphsInSubProcess, self.path, list(glyphNames))
+        )
+
+
+# State of the worker processes of SubProcessGlyphReader
+_subProcessBackends: dict[str, ReadableFontBackend] = {}
+_subProcessEventLoop: asyncio.AbstractEventLoop | None = None
+
+
+def _readGlyphsInSubProcess(
+    path: str, glyphNames: list[str]
+) -> dict[str, VariableGlyph | None]:
+    global _subProcessEventLoop
+
+    if _subProcessEventLoop is None:
+        _subProcessEventLoop = asyncio.new_event_loop()
+        # Pool workers don't run atexit handlers, but they do run
+        # multiprocessing finalizers when they exit
+        multiprocessing.util.Finalize(None, _closeSubProcessBackends, exitpriority=10)
+    return _subProcessEventLoop.run_until_complete(_readGlyphs(path, glyphNames))
+
+
+def _closeSubProcessBackends() -> None:
+    global _subProcessEventLoop
+
+    if _subProcessEventLoop is None:
+        return
+    for backend in _subProcessBackends.values():
+        try:
+            _subProcessEventLoop.run_until_complete(backend.aclose())
+        except Exception as e:
+            logger.warning(f"error closing {backend}: {e!r}")
+    _subProcessBackends.clear()
+    _subProcessEventLoop.close()
+    _subProcessEventLoop = None
+
+
+async def _readGlyphs(
+    path: str, glyphNames: list[str]
+) -> dict[str, VariableGlyph | None]:
+    backend = _subProcessBackends.get(path)
+    if backend is None:
+        backend = getFileSystemBackend(pathlib.Path(path))
+        _subProcessBackends[path] = backend
+    if isinstance(backend, ReadGlyphs):
+        return await backend.getGlyphs(glyphNames)
+    return {glyphName: await backend.getGlyph(glyphName) for glyphName in glyphNames}
+
+
+def hashGlyph(glyph: VariableGlyph, codePoints: list[int]) -> str:
+    # The dataclass repr is much cheaper than serializing to JSON, and just as
+    # deterministic for glyphs read from the same source
+    return hashlib.sha256(repr((glyph, codePoints)).encode("utf-8")).hexdigest()
+
+
+class CopyJournal:
+    """Record which glyphs have been copied, along with a hash of the source
+    glyph, in a CSV file next to the destination, so that an interrupted copy
+    can be resumed. Unless `resume` is true, an existing journal is discarded.
+
+    Destination backends may defer writes, so recorded glyphs are only written
+    to the journal by `commit()`, which must be called after the destination
+    has been flushed. `copyGlyphs()` does so every `maxPendingRows` glyphs.
+    Uncommitted rows are discarded by `close()`.
+    """
+
+    maxPendingRows = 256
+
+    def __init__(self, path: os.PathLike | str, resume: bool = False):
+        self.path = pathlib.Path(path)
+        self.glyphHashes: dict[str, str] = {}
+        if resume:
+            for row in readJournal(self.path):
+                if len(row) == 2:
+                    glyphName, glyphHash = row
+                    self.glyphHashes[glyphName] = glyphHash
+        else:
+            self.path.unlink(missing_ok=True)
+        self._file = self.path.open("a", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file, delimiter=";", lineterminator="\n")
+        self._pendingRows: list[tuple[str, str]] = []
+
+    def retainGlyphs(self, glyphNames: Iterable[str]) -> None:
+        glyphNames = set(glyphNames)
+        self.glyphHashes = {
+            glyphName: glyphHash
+            for glyphName, glyphHash in self.glyphHashes.items()
+            if glyphName in glyphNames
+        }
+
+    def isCopied(self, glyphName: str, glyphHash: str) -> bool:
+        return self.glyphHashes.get(glyphName) == glyphHash
+
+    @property
+    def numPendingRows(self) -> int:
+        return len(self._pendingRows)
+
+    def recordCopied(self, glyphName: str, glyphHash: str) -> None:
+        self.glyphHashes[glyphName] = glyphHash
+        self._pendingRows.append((glyphName, glyphHash))
+
+    def commit(self) -> None:
+        self._writer.writerows(self._pendingRows)
+        self._file.flush()
+        self._pendingRows = []
 
-    await destBackend.putKerning(await sourceBackend.getKerning())
-    await destBackend.putFeatures(await sourceBackend.getFeatures())
+    def close(self) -> None:
+        self._file.close()
+
+    def delete(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class CopyStatistics:
+    """Keep track of the number of copied glyphs and of the time spent per
+    phase, and log the progress. With several copy tasks, the phase timings
+    add up the time of all tasks.
+    """
+
+    def __init__(self, progressInterval: int = 0, reportInterval: float = 0):
+        self.progressInterval = progressInterval
+        self.reportInterval = reportInterval
+        self.numGlyphsCopied = 0
+        self.numGlyphsSkipped = 0
+        self.timings: dict[str, float] = defaultdict(float)
+        self.startTime = self.lastReportTime = time.perf_counter()
+
+    @contextmanager
+    def timing(self, phase: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] += time.perf_counter() - t
+
+    def logProgress(self, numGlyphsLeft: int) -> None:
+        now = time.perf_counter()
+        if not (
+            (self.progressInterval and not (numGlyphsLeft % self.progressInterval))
+            or (
+                self.reportInterval and now - self.lastReportTime >= self.reportInterval
+            )
+        ):
+            return
+        self.lastReportTime = now
+        numGlyphsDone = self.numGlyphsCopied + self.numGlyphsSkipped
+        elapsed = now - self.startTime
+        message = f"{numGlyphsLeft} glyphs left to copy"
+        if numGlyphsDone and elapsed > 0:
+            glyphsPerSecond = numGlyphsDone / elapsed
+            eta = formatDuration(numGlyphsLeft / glyphsPerSecond)
+            message += f", {glyphsPerSecond:.1f} glyphs/s, ETA {eta}"
+        logger.info(message)
+
+    def logSummary(self) -> None:
+        elapsed = time.perf_counter() - self.startTime
+        phases = ", ".join(
+            f"{phase} {duration:.2f}s" for phase, duration in self.timings.items()
+        )
+        skipped = (
+            f" ({self.numGlyphsSkipped} unchanged glyphs skipped)"
+            if self.numGlyphsSkipped
+            else ""
+        )
+        logger.info(
+            f"copied {self.numGlyphsCopied} glyphs{skipped} in {elapsed:.2f}s: {phases}"
+        )
+
+
+def formatDuration(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}"
 
 
 async def copyGlyphs(
-    sourceBackend: ReadableFontBackend,
+    sourceBackend: ReadableFontBackend | GlyphPrefetcher,
     destBackend: WritableFontBackend,
     glyphMap: dict[str, list[int]],
-    glyphNamesToCopy: list[str],
+    glyphNamesToCopy: deque[str],
     glyphNamesCopied: set[str],
-    progressInterval: int,
     continueOnError: bool,
+    statistics: CopyStatistics,
+    journal: CopyJournal | None = None,
 ) -> list:
     backgroundImageIdentifiers = []
 
     while glyphNamesToCopy:
         glyphNamesCopied.update(glyphNamesToCopy)
-        if progressInterval and not (len(glyphNamesToCopy) % progressInterval):
-            logger.info(f"{len(glyphNamesToCopy)} glyphs left to copy")
-        glyphName = glyphNamesToCopy.pop(0)
+        statistics.logProgress(len(glyphNamesToCopy))
+        glyphName = glyphNamesToCopy.popleft()
         logger.debug(f"reading {glyphName}")
 
         try:
-            glyph = await sourceBackend.getGlyph(glyphName)
+            with statistics.timing("read"):
+                glyph = await sourceBackend.getGlyph(glyphName)
         except Exception as e:
             if not continueOnError:
                 raise
@@ -145,7 +464,24 @@ async def copyGlyphs(
                     layer.glyph.backgroundImage.identifier
                 )
 
-        await destBackend.putGlyph(glyphName, glyph, glyphMap[glyphName])
+        if journal is not None:
+            with statistics.timing("hash"):
+                glyphHash = hashGlyph(glyph, glyphMap[glyphName])
+            if journal.isCopied(glyphName, glyphHash):
+                logger.debug(f"skipping {glyphName}, it was copied before")
+                statistics.numGlyphsSkipped += 1
+                continue
+
+        with statistics.timing("write"):
+            await destBackend.putGlyph(glyphName, glyph, glyphMap[glyphName])
+        if journal is not None:
+            journal.recordCopied(glyphName, glyphHash)
+            if journal.numPendingRows >= journal.maxPendingRows:
+                # Only commit the journal once the glyphs are written for real
+                with statistics.timing("write"):
+                    flushBackend(destBackend)
+                journal.commit()
+        statistics.numGlyphsCopied += 1
 
     return backgroundImageIdentifiers
 
@@ -193,13 +529,40 @@ async def mainAsync() -> None:
         help="A file containing a space-separated list glyph names",
     )
     parser.add_argument("--progress-interval", type=int, default=0)
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=30,
+        help="Log the throughput and the estimated time left every so many "
+        "seconds (default: 30). Use 0 to disable.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted copy: keep the destination, and don't "
+        "write glyphs again that were copied before and didn't change since.",
+    )
     parser.add_argument("--num-tasks", type=int, default=1)
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="The number of glyph batches to read at a time, in worker processes "
+        "(at most one per CPU). Each worker opens the source font by itself. "
+        "Writing happens in the main process.",
+    )
     parser.add_argument(
         "--continue-on-error",
         action="store_true",
         help="Continue copying if reading or processing a glyph causes an error. "
         "The error will be logged, but the glyph will not be present in the output.",
     )
+    parser.add_argument(
+        "--packed-glyph-paths",
+        action="store_true",
+        help="Write glyph outlines in the compact packed format, if the "
+        "destination format supports it (currently only .fontra)",
+    )
 
     args = parser.parse_args()
 
@@ -211,28 +574,68 @@ async def mainAsync() -> None:
 
     sourcePath = args.source
     destPath = args.destination
-
-    # Delete destination.
-    # TODO: move the destination to a tmp location, only delete when copy succeeds
-    if destPath.is_dir():
-        shutil.rmtree(destPath)
-    elif destPath.exists():
-        destPath.unlink()
+    journalPath = destPath.with_name(destPath.name + ".copy-journal.csv")
+    resume = args.resume and destPath.exists() and journalPath.exists()
+    if args.resume and not resume:
+        logger.info("nothing to resume, starting a new copy")
+
+    if not resume:
+        # Delete destination.
+        # TODO: move the destination to a tmp location, only delete when copy
+        # succeeds
+        if destPath.is_dir():
+            shutil.rmtree(destPath)
+        elif destPath.exists():
+            destPath.unlink()
 
     sourceBackend = getFileSystemBackend(sourcePath)
-    destBackend = newFileSystemBackend(destPath)
+    if resume:
+        destBackend = getFileSystemBackend(destPath)
+        assert isinstance(destBackend, WritableFontBackend)
+    else:
+        destBackend = newFileSystemBackend(destPath)
+    journal = CopyJournal(journalPath, resume=resume)
+    if args.packed_glyph_paths:
+        if hasattr(destBackend, "setGlyphFormatVersion"):
+            destBackend.setGlyphFormatVersion(GLYPH_FORMAT_PACKED)
+        else:
+            logger.warning("the destination format does not support packed paths")
 
     # TODO: determine numTasks based on whether either backend supports parallelism
 
-    async with aclosing(sourceBackend), aclosing(destBackend):
-        await copyFont(
-            sourceBackend,
-            destBackend,
-            glyphNames=glyphNames if glyphNames else None,
-            numTasks=args.num_tasks,
-            progressInterval=args.progress_interval,
-            continueOnError=args.continue_on_error,
-        )
+    glyphReader = (
+        SubProcessGlyphReader(sourcePath, args.processes)
+        if args.processes > 1
+        else None
+    )
+
+    try:
+        async with (
+            aclosing(sourceBackend),
+            aclosing(destBackend),
+            (
+                aclosing(glyphReader)
+                if glyphReader is not None
+                else async_nullcontext(None)
+            ),
+        ):
+            await copyFont(
+                sourceBackend,
+                destBackend,
+                glyphNames=glyphNames if glyphNames else None,
+                numTasks=args.num_tasks,
+                progressInterval=args.progress_interval,
+                continueOnError=args.continue_on_error,
+                glyphReader=glyphReader,
+                journal=journal,
+                reportInterval=args.report_interval,
+            )
+    except BaseException:
+        journal.close()
+        logger.error("the copy did not complete, run again with --resume to continue")
+        raise
+
+    journal.delete()
 
 
 @asynccontextmanager
@@ -5,6 +5,8 @@ import logging
 import os
 import pathlib
 import shutil
+import sqlite3
+import time
 import uuid
 from collections import defaultdict
 from copy import deepcopy
@@ -13,7 +15,7 @@ from datetime import datetime
 from functools import cache, cached_property, partial, singledispatch
 from os import PathLike
 from types import SimpleNamespace
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from fontTools.designspaceLib import (
     AxisDescriptor,
@@ -29,6 +31,7 @@ from fontTools.ufoLib import UFOLibError, UFOReaderWriter
 from fontTools.ufoLib.glifLib import GlyphSet
 
 from ..core.async_property import async_property
+from ..core.cachedir import getFontraCacheDir
 from ..core.classes import (
     Anchor,
     Axes,
@@ -53,13 +56,20 @@ from ..core.classes import (
     StaticGlyph,
     VariableGlyph,
 )
-from ..core.glyphdependencies import GlyphDependencies
+from ..core.glyphdependencies import (
+    GlyphDependencies,
+    getGlyphDependenciesCachePath,
+    readComponentInfoIncrementally,
+)
 from ..core.path import PackedPathPointPen
 from ..core.protocols import WritableFontBackend
+from ..core.scheduler import Scheduler
 from ..core.subprocess import runInSubProcess
+from ..core.threading import mapInThreads, runInThread
 from ..core.varutils import locationToTuple, makeDenseLocation, makeSparseLocation
 from .filewatcher import Change, FileWatcher
-from .ufo_utils import extractGlyphNameAndCodePoints
+from .glifcache import GlifCache, GlifStampType, getGlifStamp
+from .ufo_utils import extractGlyphNameAndCodePoints, readGlyphFast
 
 logger = logging.getLogger(__name__)
 
@@ -224,6 +234,14 @@ class DesignspaceBackend:
         self._backgroundTasksTask: asyncio.Task | None = None
         self._imageMapping = DoubleDict()
         self._imageDataToWrite: dict[str, ImageData] = {}
+        # contents.plist and layercontents.plist writes are deferred, so they
+        # happen only once when many glyphs are written in quick succession
+        self._scheduler = Scheduler()
+        self._glyphSetsToWriteContents: dict[GlyphSet, None] = {}
+        self._readersToWriteLayerContents: dict[UFOReaderWriter, None] = {}
+        # Optional persistent cache for parsed .glif files, see enableGlifCache()
+        self._glifCache: GlifCache | None = None
+        self._glifCacheCommitTask: asyncio.Task | None = None
         # Set this to true to set "public.truetype.overlap" in each writte .glif's lib:
         self.setOverlapSimpleFlag = False
         self._familyName: str | None = None
@@ -239,17 +257,31 @@ class DesignspaceBackend:
         self.dsDocModTime = (
             os.stat(self.dsDoc.path).st_mtime if self.dsDoc.path else None
         )
+        t0 = time.perf_counter()
         self.ufoManager = UFOManager()
         self.updateAxisInfo()
         self.loadUFOLayers()
-        self.buildGlyphFileNameMapping()
+        t1 = time.perf_counter()
+        # The glyph sets of the non-default layers are only read when needed.
+        # This includes the .glif file name mapping, see glifFileNames.
+        self._glifFileNames: dict[str, str] | None = None
         self.glyphMap = (
             {}
             if self.defaultDSSource is None
             else getGlyphMapFromGlyphSet(self.defaultDSSource.layer.glyphSet)
         )
+        t2 = time.perf_counter()
+        logger.info(
+            f"opened {os.path.basename(self._projectPath or '')!r}: "
+            f"{len(self.dsSources)} sources, {len(self.ufoLayers)} layers, "
+            f"{len(self.glyphMap)} glyphs; reading UFO metadata took {t1 - t0:.3f}s, "
+            f"reading the glyph map took {t2 - t1:.3f}s"
+        )
         self.savedGlyphModificationTimes: dict[str, set] = {}
         self.zombieDSSources: dict[str, DSSource] = {}
+        # The UFO kerning per source identifier, as last read or written, so
+        # putKerningValues() can tell which sources are affected by a change
+        self._ufoKerningPerSource: dict[str, dict[tuple[str, str], float]] | None = None
 
     def startOptionalBackgroundTasks(self) -> None:
         self._backgroundTasksTask = asyncio.create_task(self.glyphDependencies)
@@ -270,7 +302,11 @@ class DesignspaceBackend:
         if self._glyphDependenciesTask is None:
             self._glyphDependenciesTask = asyncio.create_task(
                 extractGlyphDependenciesFromUFO(
-                    self.defaultDSSource.layer.path, self.defaultDSSource.layer.name
+                    self.defaultDSSource.layer.path,
+                    self.defaultDSSource.layer.name,
+                    getGlyphDependenciesCachePath(
+                        self.defaultDSSource.layer.path, self.defaultDSSource.layer.name
+                    ),
                 )
             )
 
@@ -286,6 +322,7 @@ class DesignspaceBackend:
         return sorted((await self.glyphDependencies).usedBy.get(glyphName, []))
 
     def _reloadDesignSpaceFromFile(self):
+        self.flush()
         self._initialize(DesignSpaceDocument.fromfile(self.dsDoc.path))
 
     def updateAxisInfo(self):
@@ -315,6 +352,13 @@ class DesignspaceBackend:
         self.defaultLocation = defaultLocation
 
     async def aclose(self) -> None:
+        self.flush()
+        if self._glifCacheCommitTask is not None:
+            await self._glifCacheCommitTask
+            self._glifCacheCommitTask = None
+        if self._glifCache is not None:
+            await runInThread(self._glifCache.close)
+            self._glifCache = None
         if self.fileWatcher is not None:
             await self.fileWatcher.aclose()
         if self._glyphDependenciesTask is not None:
@@ -322,6 +366,24 @@ class DesignspaceBackend:
         if self._backgroundTasksTask is not None:
             self._backgroundTasksTask.cancel()
 
+    def flush(self) -> None:
+        self._scheduler.flush()
+
+    def enableGlifCache(self, cacheDir: PathLike | None = None) -> None:
+        """Store parsed .glif files in a persistent cache, so that glyphs can be
+        read much faster when the project is opened again. A cached .glif is used
+        only if its modification time and size did not change.
+        """
+        if cacheDir is None:
+            cacheDir = getFontraCacheDir() / "glifs"
+        projectPath = self._projectPath
+        if projectPath is None or self._glifCache is not None:
+            return
+        try:
+            self._glifCache = GlifCache.forProject(cacheDir, projectPath)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"can't open glif cache: {e!r}")
+
     @property
     def defaultDSSource(self):
         return self.dsSources.findItem(isDefault=True)
@@ -335,6 +397,13 @@ class DesignspaceBackend:
     def defaultReader(self):
         return self.defaultUFOLayer.reader
 
+    @property
+    def _projectPath(self) -> str | None:
+        if self.dsDoc.path is None and self.defaultDSSource is not None:
+            # A single UFO, see UFOBackend
+            return self.defaultUFOLayer.path
+        return self.dsDoc.path
+
     @property
     def ufoDir(self) -> pathlib.Path:
         return pathlib.Path(
@@ -356,14 +425,18 @@ class DesignspaceBackend:
         manager = self.ufoManager
         self.dsSources = ItemList()
         self.ufoLayers = ItemList()
+        self._glyphLayerIndex: dict[str, list[UFOLayer]] | None = None
+
+        ufoLayerNames = self._readUFOLayerNames(
+            os.path.normpath(source.path) for source in self.dsDoc.sources
+        )
 
         makeUniqueSourceName = uniqueNameMaker()
         for source in self.dsDoc.sources:
             if self._familyName is None and source.familyName:
                 self._familyName = source.familyName
             ufoPath = os.path.normpath(source.path)
-            reader = manager.getReader(ufoPath)
-            defaultLayerName = reader.getDefaultLayerName()
+            defaultLayerName, _ = ufoLayerNames[ufoPath]
             ufoLayerName = source.layerName or defaultLayerName
 
             sourceLayer = self.ufoLayers.findItem(path=ufoPath, name=ufoLayerName)
@@ -393,16 +466,39 @@ class DesignspaceBackend:
                 )
             )
 
-        self._addNonSourceLayers()
+        self._addNonSourceLayers(ufoLayerNames)
         self._updatePathsToWatch()
 
-    def _addNonSourceLayers(self) -> None:
+    def _readUFOLayerNames(
+        self, ufoPaths: Iterable[str]
+    ) -> dict[str, tuple[str, list[str]]]:
+        # Return the default layer name and all layer names for each UFO. The
+        # UFOs are opened concurrently, as with many sources the file system
+        # access adds up.
+        ufoPaths = list(dict.fromkeys(ufoPaths))
+        manager = self.ufoManager
+
+        def readLayerNames(ufoPath):
+            reader = manager.getReader(ufoPath)
+            return reader.getDefaultLayerName(), reader.getLayerNames()
+
+        return dict(zip(ufoPaths, mapInThreads(readLayerNames, ufoPaths)))
+
+    def _addNonSourceLayers(
+        self, ufoLayerNames: dict[str, tuple[str, list[str]]] | None = None
+    ) -> None:
         # Add remaining layers (background layers, variable glyph layers)
         manager = self.ufoManager
+        if ufoLayerNames is None:
+            # Make sure layers we created are on disk before we read them
+            self._writeLayerContents()
+            ufoLayerNames = self._readUFOLayerNames(
+                os.path.normpath(source.path) for source in self.dsDoc.sources
+            )
         for source in self.dsDoc.sources:
             ufoPath = os.path.normpath(source.path)
-            reader = manager.getReader(ufoPath)
-            for ufoLayerName in reader.getLayerNames():
+            _, layerNames = ufoLayerNames[ufoPath]
+            for ufoLayerName in layerNames:
                 layer = self.ufoLayers.findItem(path=ufoPath, name=ufoLayerName)
                 if layer is None:
                     fontraLayerName = self._getFontraLayerNameFromUFOLayerName(
@@ -416,6 +512,7 @@ class DesignspaceBackend:
                             fontraLayerName=fontraLayerName,
                         )
                     )
+        self._glyphLayerIndex = None
 
     def _getFontraLayerNameFromUFOLayerName(self, sourceIdentifier, ufoLayerName):
         fontraLayerName = f"{sourceIdentifier}^{ufoLayerName}"
@@ -427,19 +524,48 @@ class DesignspaceBackend:
                 fontraLayerName = ufoLayerName
         return fontraLayerName
 
+    @property
+    def glifFileNames(self) -> dict[str, str]:
+        # This needs the contents of all glyph sets, so it is built when first
+        # needed, which is when we start watching for external changes
+        if self._glifFileNames is None:
+            self.buildGlyphFileNameMapping()
+            assert self._glifFileNames is not None
+        return self._glifFileNames
+
     def buildGlyphFileNameMapping(self):
         glifFileNames = {}
         for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
             for glyphName, fileName in glyphSet.contents.items():
                 glifFileNames[fileName] = glyphName
-        self.glifFileNames = glifFileNames
+        self._glifFileNames = glifFileNames
 
     def updateGlyphSetContents(self, glyphSet):
-        glyphSet.writeContents()
-        glifFileNames = self.glifFileNames
+        self._scheduleWriteGlyphSetContents(glyphSet)
+        if self._glifFileNames is None:
+            return
+        glifFileNames = self._glifFileNames
         for glyphName, fileName in glyphSet.contents.items():
             glifFileNames[fileName] = glyphName
 
+    def _scheduleWriteGlyphSetContents(self, glyphSet):
+        self._glyphSetsToWriteContents[glyphSet] = None
+        self._scheduler.schedule(self._writeGlyphSetContents)
+
+    def _writeGlyphSetContents(self):
+        for glyphSet in self._glyphSetsToWriteContents:
+            glyphSet.writeContents()
+        self._glyphSetsToWriteContents = {}
+
+    def _scheduleWriteLayerContents(self, reader):
+        self._readersToWriteLayerContents[reader] = None
+        self._scheduler.schedule(self._writeLayerContents)
+
+    def _writeLayerContents(self):
+        for reader in self._readersToWriteLayerContents:
+            reader.writeLayerContents()
+        self._readersToWriteLayerContents = {}
+
     async def getGlyphMap(self) -> dict[str, list[int]]:
         return dict(self.glyphMap)
 
@@ -450,14 +576,126 @@ class DesignspaceBackend:
         if glyphName not in self.glyphMap:
             return None
 
+        # Parsing the .glif files is done in worker threads, one per layer,
+        # so we don't block the event loop for fonts with many sources
+        ufoLayers = self._getUFOLayersForGlyph(glyphName)
+        parsedLayers = await asyncio.gather(
+            *(
+                runInThread(
+                    readGlyphFromUFOLayers, [ufoLayer], glyphName, self._glifCache
+                )
+                for ufoLayer in ufoLayers
+            )
+        )
+        self._scheduleGlifCacheCommit()
+        return self._buildVariableGlyph(
+            glyphName,
+            {
+                ufoLayer: parsedLayer
+                for ufoLayer, [parsedLayer] in zip(ufoLayers, parsedLayers, strict=True)
+            },
+        )
+
+    async def getGlyphs(
+        self, glyphNames: Iterable[str]
+    ) -> dict[str, VariableGlyph | None]:
+        """Return a dict with the glyphs for `glyphNames`. Glyphs that don't
+        exist are None. This is faster than calling `getGlyph()` for each
+        glyph, as all glyphs are read concurrently by the thread pool.
+        """
+        glyphNames = list(glyphNames)
+        existingGlyphNames = [
+            glyphName for glyphName in glyphNames if glyphName in self.glyphMap
+        ]
+        layersPerGlyph = [
+            self._getUFOLayersForGlyph(glyphName) for glyphName in existingGlyphNames
+        ]
+        parsedLayersPerGlyph = await asyncio.gather(
+            *(
+                runInThread(
+                    readGlyphFromUFOLayers, ufoLayers, glyphName, self._glifCache
+                )
+                for glyphName, ufoLayers in zip(existingGlyphNames, layersPerGlyph)
+            )
+        )
+        self._scheduleGlifCacheCommit()
+        glyphs: dict[str, VariableGlyph | None] = dict.fromkeys(glyphNames)
+        for glyphName, ufoLayers, parsedLayers in zip(
+            existingGlyphNames, layersPerGlyph, parsedLayersPerGlyph, strict=True
+        ):
+            glyphs[glyphName] = self._buildVariableGlyph(
+                glyphName, dict(zip(ufoLayers, parsedLayers, strict=True))
+            )
+        return glyphs
+
+    def _getGlyphLayerIndex(self) -> dict[str, list[UFOLayer]]:
+        # Maps glyph names to the UFO layers that contain the glyph, in
+        # self.ufoLayers order. It is built on first use from the glyph sets'
+        # contents, and is kept up to date when glyphs are added to or deleted
+        # from UFO layers. When the list of layers changes, it is rebuilt.
+        if self._glyphLayerIndex is None:
+            glyphLayerIndex: dict[str, list[UFOLayer]] = defaultdict(list)
+            for ufoLayer in self.ufoLayers:
+                for glyphName in ufoLayer.glyphSet.contents:
+                    glyphLayerIndex[glyphName].append(ufoLayer)
+            self._glyphLayerIndex = dict(glyphLayerIndex)
+        return self._glyphLayerIndex
+
+    def _updateGlyphLayerIndex(self, glyphName: str) -> None:
+        # To be called when `glyphName` was added to or deleted from a UFO layer
+        if self._glyphLayerIndex is None:
+            return
+        glyphLayers = [
+            ufoLayer for ufoLayer in self.ufoLayers if glyphName in ufoLayer.glyphSet
+        ]
+        if glyphLayers:
+            self._glyphLayerIndex[glyphName] = glyphLayers
+        else:
+            self._glyphLayerIndex.pop(glyphName, None)
+
+    def _addUFOLayer(self, ufoLayer: UFOLayer) -> None:
+        self.ufoLayers.append(ufoLayer)
+        if self._glyphLayerIndex is not None:
+            for glyphName in ufoLayer.glyphSet.contents:
+                self._glyphLayerIndex.setdefault(glyphName, []).append(ufoLayer)
+
+    def _getUFOLayersForGlyph(self, glyphName: str) -> list[UFOLayer]:
+        # The default layer always comes first
+        defaultUFOLayer = self.defaultUFOLayer
+        return [defaultUFOLayer] + [
+            ufoLayer
+            for ufoLayer in self._getGlyphLayerIndex().get(glyphName, ())
+            if ufoLayer != defaultUFOLayer
+        ]
+
+    def _scheduleGlifCacheCommit(self) -> None:
+        if self._glifCache is not None:
+            self._scheduler.schedule(self._commitGlifCache)
+
+    def _commitGlifCache(self):
+        if self._glifCache is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._glifCache.commit()
+        else:
+            # Commit in a thread, so we don't block the event loop
+            self._glifCacheCommitTask = asyncio.create_task(
+                runInThread(self._glifCache.commit)
+            )
+
+    def _buildVariableGlyph(
+        self,
+        glyphName: str,
+        parsedLayers: dict[UFOLayer, tuple[StaticGlyph, UFOGlyph]],
+    ) -> VariableGlyph:
         axes = []
         sources = []
         localSources = []
         layers = {}
 
-        defaultStaticGlyph, defaultUFOGlyph = ufoLayerToStaticGlyph(
-            self.defaultUFOLayer.glyphSet, glyphName
-        )
+        defaultStaticGlyph, defaultUFOGlyph = parsedLayers[self.defaultUFOLayer]
 
         localDS = defaultUFOGlyph.lib.get(GLYPH_DESIGNSPACE_LIB_KEY)
         if localDS is not None:
@@ -476,15 +714,13 @@ class DesignspaceBackend:
         # per glyph source custom data, eg. status color code
         sourcesCustomData = {}
 
-        for ufoLayer in self.ufoLayers:
-            if glyphName not in ufoLayer.glyphSet:
+        glyphLayers = self._getGlyphLayerIndex().get(glyphName, [])
+        for ufoLayer in glyphLayers:
+            parsedLayer = parsedLayers.get(ufoLayer)
+            if parsedLayer is None:
                 continue
 
-            staticGlyph, ufoGlyph = (
-                (defaultStaticGlyph, defaultUFOGlyph)
-                if ufoLayer == self.defaultUFOLayer
-                else ufoLayerToStaticGlyph(ufoLayer.glyphSet, glyphName)
-            )
+            staticGlyph, ufoGlyph = parsedLayer
 
             layerName = layerNameMapping.get(
                 ufoLayer.fontraLayerName, ufoLayer.fontraLayerName
@@ -510,9 +746,9 @@ class DesignspaceBackend:
             if axis.name in self.defaultLocation
         }
 
+        glyphLayersSet = set(glyphLayers)
         for dsSource in self.dsSources:
-            glyphSet = dsSource.layer.glyphSet
-            if glyphName not in glyphSet:
+            if dsSource.layer not in glyphLayersSet:
                 continue
             sources.append(dsSource.asFontraGlyphSource(localDefaultOverride))
 
@@ -719,24 +955,24 @@ class DesignspaceBackend:
             )
             glyphSet.writeGlyph(glyphName, layerGlyph, drawPointsFunc=drawPointsFunc)
             if writeGlyphSetContents:
-                # FIXME: this is inefficient if we write many glyphs
                 self.updateGlyphSetContents(glyphSet)
+                self._updateGlyphLayerIndex(glyphName)
 
             modTimes.add(glyphSet.getGLIFModificationTime(glyphName))
 
         # Prune unused UFO layers
         relevantLayerNames = set(
             layer.fontraLayerName
-            for layer in self.ufoLayers
-            if glyphName in layer.glyphSet
+            for layer in self._getGlyphLayerIndex().get(glyphName, ())
         )
         layersToDelete = relevantLayerNames - usedLayers
         for layerName in layersToDelete:
             glyphSet = self.ufoLayers.findItem(fontraLayerName=layerName).glyphSet
             glyphSet.deleteGlyph(glyphName)
-            # FIXME: this is inefficient if we write many glyphs
             self.updateGlyphSetContents(glyphSet)
             modTimes.add(None)
+        if layersToDelete:
+            self._updateGlyphLayerIndex(glyphName)
 
         self.savedGlyphModificationTimes[glyphName] = modTimes
 
@@ -923,7 +1159,7 @@ class DesignspaceBackend:
             name=ufoLayerName,
             fontraLayerName=sourceIdentifier,
         )
-        self.ufoLayers.append(ufoLayer)
+        self._addUFOLayer(ufoLayer)
         self._updatePathsToWatch()
         return ufoLayer
 
@@ -948,9 +1184,9 @@ class DesignspaceBackend:
             ufoLayerName = f"{suggestedLayerName}#{count}"
 
         if ufoLayerName not in existingLayerNames:
-            reader.writeLayerContents()
+            self._scheduleWriteLayerContents(reader)
             glyphSet = self.ufoManager.getGlyphSet(ufoPath, ufoLayerName)
-            glyphSet.writeContents()
+            self._scheduleWriteGlyphSetContents(glyphSet)
 
         ufoLayer = UFOLayer(
             manager=self.ufoManager,
@@ -958,7 +1194,7 @@ class DesignspaceBackend:
             name=ufoLayerName,
             fontraLayerName=fontraLayerName,
         )
-        self.ufoLayers.append(ufoLayer)
+        self._addUFOLayer(ufoLayer)
 
         return ufoLayer
 
@@ -974,10 +1210,11 @@ class DesignspaceBackend:
     async def deleteGlyph(self, glyphName):
         if glyphName not in self.glyphMap:
             raise KeyError(f"Glyph '{glyphName}' does not exist")
-        for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
+        for ufoLayer in self._getGlyphLayerIndex().pop(glyphName, ()):
+            glyphSet = ufoLayer.glyphSet
             if glyphName in glyphSet:
                 glyphSet.deleteGlyph(glyphName)
-                glyphSet.writeContents()
+                self._scheduleWriteGlyphSetContents(glyphSet)
         del self.glyphMap[glyphName]
         self.savedGlyphModificationTimes[glyphName] = None
         if self._glyphDependencies is not None:
@@ -1131,6 +1368,7 @@ class DesignspaceBackend:
         for dsSource in newDSSources:
             newLayers.append(dsSource.layer)
         self.ufoLayers = newLayers
+        self._glyphLayerIndex = None
 
         axisOrder = [axis.name for axis in self.dsDoc.axes]
         newSourceDescriptors = [
@@ -1171,13 +1409,17 @@ class DesignspaceBackend:
         # TODO: fixup RTL kerning
         # Context: UFO3's kern direction is "writing direction", but I want kerning
         # in Fontra to be "visial left to right", as that is much easier to manage.
+        ufoKerningPerSource = {}
         for dsSource in dsSources:
             groups = mergeKernGroups(groups, dsSource.layer.reader.readGroups())
             sourceKerning = dsSource.layer.reader.readKerning()
+            ufoKerningPerSource[dsSource.identifier] = sourceKerning
 
             for (leftKey, rightKey), value in sourceKerning.items():
                 valueDicts[leftKey][rightKey][dsSource.identifier] = value
 
+        self._ufoKerningPerSource = ufoKerningPerSource
+
         values = {
             adjustGroupPrefix(left): {
                 adjustGroupPrefix(right): [
@@ -1230,15 +1472,14 @@ class DesignspaceBackend:
             kerningPerSource: dict = defaultdict(dict)
 
             for left, rightDict in kerningTable.values.items():
-                left = "public.kern1." + left[1:] if left.startswith("@") else left
+                left = addLeftPrefix(left)
                 for right, values in rightDict.items():
-                    right = (
-                        "public.kern2." + right[1:] if right.startswith("@") else right
-                    )
+                    right = addRightPrefix(right)
                     for sourceIdentifier, value in zip(sourceIdentifiers, values):
                         if value is not None:
                             kerningPerSource[sourceIdentifier][left, right] = value
 
+            ufoKerningPerSource = {}
             for dsSource in self.dsSources:
                 if dsSource.isSparse:
                     continue
@@ -1249,11 +1490,87 @@ class DesignspaceBackend:
                     dsSource.layer.reader.writeGroups(groups)
                     ufoKerning = kerningPerSource.get(dsSource.identifier, {})
                     dsSource.layer.reader.writeKerning(ufoKerning)
+                    ufoKerningPerSource[dsSource.identifier] = ufoKerning
                 else:
                     # TODO: store in lib
                     logger.error(
                         "kerning types other than 'kern' are not yet implemented for UFO"
                     )
+            if kernType == "kern":
+                self._ufoKerningPerSource = ufoKerningPerSource
+
+    async def putKerningValues(
+        self,
+        kernType: str,
+        kerningTable: Kerning,
+        pairs: Iterable[tuple[str, str | None]],
+    ) -> None:
+        """Write the values of the given kerning `pairs` of `kerningTable`.
+        Only the kerning.plist files of the sources for which any of these
+        values changed are rewritten. A `(left, None)` pair stands for all
+        pairs with `left` as the left side. Groups are not written: changes
+        to groups must go through `putKerning()`.
+        """
+        sourceIdentifiers = kerningTable.sourceIdentifiers
+        nonSparseSourceIdentifiers = {
+            dsSource.identifier for dsSource in self.dsSources if not dsSource.isSparse
+        }
+        if (
+            kernType != "kern"
+            or self._ufoKerningPerSource is None
+            or set(self._ufoKerningPerSource) != nonSparseSourceIdentifiers
+            or set(sourceIdentifiers) != nonSparseSourceIdentifiers
+            or len(sourceIdentifiers) != len(nonSparseSourceIdentifiers)
+        ):
+            # We can't do an incremental update
+            await self.putKerning({kernType: kerningTable})
+            return
+
+        ufoKerningPerSource = self._ufoKerningPerSource
+        # Changes go to copies, which only replace the kerning we keep track of
+        # once they have been written
+        changedKerningPerSource: dict[str, dict[tuple[str, str], float]] = {}
+
+        for left, right in pairs:
+            ufoLeft = addLeftPrefix(left)
+            rightDict = kerningTable.values.get(left, {})
+            if right is None:
+                ufoPairs = {(ufoLeft, addRightPrefix(right)) for right in rightDict}
+                for ufoKerning in ufoKerningPerSource.values():
+                    ufoPairs.update(pair for pair in ufoKerning if pair[0] == ufoLeft)
+            else:
+                ufoPairs = {(ufoLeft, addRightPrefix(right))}
+
+            for ufoPair in ufoPairs:
+                values = rightDict.get(adjustGroupPrefix(ufoPair[1]), [])
+                for i, sourceIdentifier in enumerate(sourceIdentifiers):
+                    value = values[i] if i < len(values) else None
+                    ufoKerning = changedKerningPerSource.get(
+                        sourceIdentifier, ufoKerningPerSource[sourceIdentifier]
+                    )
+                    if ufoKerning.get(ufoPair) == value:
+                        continue
+                    if sourceIdentifier not in changedKerningPerSource:
+                        ufoKerning = dict(ufoKerning)
+                        changedKerningPerSource[sourceIdentifier] = ufoKerning
+                    if value is None:
+                        del ufoKerning[ufoPair]
+                    else:
+                        ufoKerning[ufoPair] = value
+
+        if not changedKerningPerSource:
+            return
+
+        kerningToWrite = [
+            (
+                self.dsSources.findItem(identifier=sourceIdentifier).layer.reader,
+                changedKerningPerSource[sourceIdentifier],
+            )
+            for sourceIdentifier in sorted(changedKerningPerSource)
+        ]
+        await runInThread(writeUFOKerning, kerningToWrite)
+        if self._ufoKerningPerSource is ufoKerningPerSource:
+            ufoKerningPerSource.update(changedKerningPerSource)
 
     async def getFeatures(self) -> OpenTypeFeatures:
         featureText = self.defaultReader.readFeatures()
@@ -1343,6 +1660,9 @@ class DesignspaceBackend:
         self, callback: Callable[[Any], Awaitable[None]]
     ) -> None:
         if self.fileWatcher is None:
+            # We need to know the glyph names of existing .glif files to
+            # recognize new glyphs
+            _ = self.glifFileNames
             self.fileWatcher = FileWatcher(self._fileWatcherCallback)
             self._updatePathsToWatch()
         self.fileWatcherCallbacks.append(callback)
@@ -1448,8 +1768,11 @@ class DesignspaceBackend:
             # TODO: come up with a better solution.
             #
             await asyncio.sleep(0.15)
+            # Make sure our own pending changes are on disk before rereading
+            self.flush()
             for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
                 glyphSet.rebuildContents()
+            self._glyphLayerIndex = None
 
         return changedItems
 
@@ -1860,14 +2183,27 @@ class DoubleDict(dict):
         raise NotImplementedError()
 
 
-def ufoLayerToStaticGlyph(glyphSet, glyphName, penClass=PackedPathPointPen):
+def ufoLayerToStaticGlyph(
+    glyphSet, glyphName, penClass=PackedPathPointPen, useFastParser=True
+):
     glyph = UFOGlyph()
-    pen = penClass()
-    glyphSet.readGlyph(glyphName, glyph, pen, validate=False)
-    components = [*pen.components] + unpackVariableComponents(glyph.lib)
+    fastResult = None
+    if useFastParser and penClass is PackedPathPointPen:
+        fastResult = readGlyphFast(glyphSet.getGLIF(glyphName), glyph)
+
+    if fastResult is not None:
+        path, components = fastResult
+    else:
+        # Unusual GLIF data, or a custom pen: use glifLib
+        pen = penClass()
+        glyphSet.readGlyph(glyphName, glyph, pen, validate=False)
+        path = pen.getPath()
+        components = list(pen.components)
+
+    components += unpackVariableComponents(glyph.lib)
     verticalOrigin = glyph.lib.get("public.verticalOrigin")
     staticGlyph = StaticGlyph(
-        path=pen.getPath(),
+        path=path,
         components=components,
         xAdvance=glyph.width,
         yAdvance=(
@@ -1882,6 +2218,45 @@ def ufoLayerToStaticGlyph(glyphSet, glyphName, penClass=PackedPathPointPen):
     return staticGlyph, glyph
 
 
+def writeUFOKerning(
+    kerningToWrite: list[tuple[UFOReaderWriter, dict[tuple[str, str], float]]]
+) -> None:
+    for reader, ufoKerning in kerningToWrite:
+        reader.writeKerning(ufoKerning)
+
+
+def readGlyphFromUFOLayers(
+    ufoLayers: list[UFOLayer], glyphName: str, glifCache: GlifCache | None = None
+) -> list[tuple[StaticGlyph, UFOGlyph]]:
+    if glifCache is None:
+        return [
+            ufoLayerToStaticGlyph(ufoLayer.glyphSet, glyphName)
+            for ufoLayer in ufoLayers
+        ]
+
+    # The .glif stamps are taken *before* parsing, so a .glif file that is
+    # modified while being parsed will not be used from the cache
+    glifStamps: list[tuple[str, GlifStampType | None] | None] = []
+    for ufoLayer in ufoLayers:
+        fileName = ufoLayer.glyphSet.contents.get(glyphName)
+        if fileName is None:
+            glifStamps.append(None)
+        else:
+            glifPath = ufoLayer.glyphSet.fs.getsyspath(fileName)
+            glifStamps.append((glifPath, getGlifStamp(glifPath)))
+    cachedItems = glifCache.getMany(dict(item for item in glifStamps if item))
+
+    parsedLayers = []
+    for ufoLayer, glifStamp in zip(ufoLayers, glifStamps, strict=True):
+        parsedLayer = cachedItems.get(glifStamp[0]) if glifStamp else None
+        if parsedLayer is None:
+            parsedLayer = ufoLayerToStaticGlyph(ufoLayer.glyphSet, glyphName)
+            if glifStamp is not None:
+                glifCache.put(*glifStamp, parsedLayer)
+        parsedLayers.append(parsedLayer)
+    return parsedLayers
+
+
 def unpackVariableComponents(lib):
     components = []
     for componentDict in lib.get(VARIABLE_COMPONENTS_LIB_KEY, ()):
@@ -2162,10 +2537,10 @@ class ComponentsOnlyPointPen(PackedPathPointPen):
 
 
 async def extractGlyphDependenciesFromUFO(
-    ufoPath: str, layerName: str
+    ufoPath: str, layerName: str, cachePath: PathLike | None = None
 ) -> GlyphDependencies:
     componentInfo = await runInSubProcess(
-        partial(_extractComponentInfoFromUFO, ufoPath, layerName)
+        partial(_extractComponentInfoFromUFO, ufoPath, layerName, cachePath)
     )
     dependencies = GlyphDependencies()
     for glyphName, componentNames in componentInfo.items():
@@ -2173,17 +2548,23 @@ async def extractGlyphDependenciesFromUFO(
     return dependencies
 
 
-def _extractComponentInfoFromUFO(ufoPath: str, layerName: str) -> dict[str, set[str]]:
+def _extractComponentInfoFromUFO(
+    ufoPath: str, layerName: str, cachePath: PathLike | None = None
+) -> dict[str, set[str]]:
     reader = UFOReaderWriter(ufoPath)
     glyphSet = reader.getGlyphSet(layerName=layerName)
-    componentInfo = {}
-    for glyphName in glyphSet.keys():
+
+    def readComponentNames(glyphName):
         glyph, _ = ufoLayerToStaticGlyph(
             glyphSet, glyphName, penClass=ComponentsOnlyPointPen
         )
-        if glyph.components:
-            componentInfo[glyphName] = {compo.name for compo in glyph.components}
-    return componentInfo
+        return [compo.name for compo in glyph.components]
+
+    glyphPaths = {
+        glyphName: glyphSet.fs.getsyspath(fileName)
+        for glyphName, fileName in glyphSet.contents.items()
+    }
+    return readComponentInfoIncrementally(glyphPaths, readComponentNames, cachePath)
 
 
 def componentNamesFromGlyph(glyph):
@@ -1,14 +1,19 @@
 import asyncio
+import concurrent.futures
 import csv
 import json
 import logging
+import os
 import pathlib
 import shutil
+import stat
+import tempfile
 from collections import defaultdict
-from copy import deepcopy
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from dataclasses import replace
 from functools import partial
-from typing import Any, Callable, Sequence
+from typing import Any, Iterable, Sequence
 
 from ..core.async_property import async_property
 from ..core.classes import (
@@ -24,18 +29,32 @@ from ..core.classes import (
     structure,
     unstructure,
 )
-from ..core.glyphdependencies import GlyphDependencies
+from ..core.glyphdependencies import (
+    GlyphDependencies,
+    getGlyphDependenciesCachePath,
+    readComponentInfoIncrementally,
+)
 from ..core.protocols import WritableFontBackend
+from ..core.scheduler import Scheduler
 from ..core.subprocess import runInSubProcess
 from .filenames import fileNameToString, stringToFileName
 
 logger = logging.getLogger(__name__)
 
 
+# Glyph files with format version 1 store outlines as contours with a dict per
+# point, version 2 stores them in packed form, like PackedPath. Both can be read
+# side by side, the format version only determines how glyphs are written.
+GLYPH_FORMAT_UNPACKED = 1
+GLYPH_FORMAT_PACKED = 2
+
+
 class FontraBackend:
     glyphInfoFileName = "glyph-info.csv"
+    glyphInfoJournalFileName = "glyph-info-journal.csv"
     fontDataFileName = "font-data.json"
     kerningFileName = "kerning.csv"
+    kerningJournalFileName = "kerning-journal.csv"
     featureTextFileName = "features.txt"
     glyphsDirName = "glyphs"
     backgroundImagesDirName = "background-images"
@@ -62,15 +81,36 @@ class FontraBackend:
             self.path.mkdir()
         self.glyphsDir.mkdir(exist_ok=True)
         self.glyphMap: dict[str, list[int]] = {}
+        self.glyphFormatVersion = GLYPH_FORMAT_UNPACKED
+
+        # Small changes to the glyph info and to kerning values are appended to
+        # journal files, instead of rewriting glyph-info.csv or kerning.csv.
+        # The journals are replayed when reading, and merged into the main
+        # files when closing, or when they have grown too large.
+        self._glyphInfoJournalSize = 0
+        self._glyphInfoChanges: dict[str, list[int] | None] = {}
+        self._kerningJournalSize = 0
+        self._kerningJournalEntries: list[list] = []
+        self._kerningNeedsFullWrite = False
+
         if not create:
             self._readGlyphInfo()
             self._readFontData()
         else:
             self.fontData = Font()
-            self._writeGlyphInfo()
-            self._writeFontData()
+            writeGlyphInfoFile(self.glyphInfoPath, [])
+            self._writeFontDataFiles(self.fontData, self.glyphFormatVersion)
         self._scheduler = Scheduler()
 
+        # All file writes happen in order, in a dedicated thread, so they don't
+        # block the event loop. Glyphs that are being written are kept in
+        # _pendingGlyphs (None means "deleted"), so they can be read back
+        # before the write has finished.
+        self._writer: concurrent.futures.ThreadPoolExecutor | None = None
+        self._pendingGlyphs: dict[
+            str, tuple[concurrent.futures.Future, dict | None]
+        ] = {}
+
         self._glyphDependenciesTask: asyncio.Task[GlyphDependencies] | None = None
         self._glyphDependencies: GlyphDependencies | None = None
         self._backgroundTasksTask: asyncio.Task | None = None
@@ -83,6 +123,10 @@ class FontraBackend:
     def kerningPath(self):
         return self.path / self.kerningFileName
 
+    @property
+    def kerningJournalPath(self):
+        return self.path / self.kerningJournalFileName
+
     @property
     def featureTextPath(self):
         return self.path / self.featureTextFileName
@@ -91,6 +135,10 @@ class FontraBackend:
     def glyphInfoPath(self):
         return self.path / self.glyphInfoFileName
 
+    @property
+    def glyphInfoJournalPath(self):
+        return self.path / self.glyphInfoJournalFileName
+
     @property
     def glyphsDir(self):
         return self.path / self.glyphsDirName
@@ -100,10 +148,29 @@ class FontraBackend:
         return self.path / self.backgroundImagesDirName
 
     async def aclose(self):
-        self.flush()
+        self._scheduler.flush()
+        self._compactJournals()
+        await self._waitForWrites()
+        if self._writer is not None:
+            self._writer.shutdown()
+            self._writer = None
 
     def flush(self):
         self._scheduler.flush()
+        if self._writer is not None:
+            # Wait for all pending writes to finish
+            self._writer.submit(_noop).result()
+
+    async def _waitForWrites(self) -> None:
+        if self._writer is not None:
+            await asyncio.wrap_future(self._writer.submit(_noop))
+
+    def _submitWrite(self, func, *args) -> concurrent.futures.Future:
+        if self._writer is None:
+            self._writer = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = self._writer.submit(func, *args)
+        future.add_done_callback(_logWriteError)
+        return future
 
     async def getUnitsPerEm(self) -> int:
         return self.fontData.unitsPerEm
@@ -130,12 +197,16 @@ class FontraBackend:
     async def putGlyph(
         self, glyphName: str, glyph: VariableGlyph, codePoints: list[int]
     ) -> None:
-        jsonSource = serializeGlyph(glyph, glyphName)
-        filePath = self.getGlyphFilePath(glyphName)
-        filePath.write_text(jsonSource, encoding="utf=8")
+        # Convert the glyph on the event loop, as the caller may modify it later.
+        # Encoding and writing the JSON data happens in the writer thread.
+        jsonGlyph = unstructureGlyph(
+            glyph, glyphName, self.glyphFormatVersion == GLYPH_FORMAT_PACKED
+        )
+        self._submitGlyphWrite(glyphName, jsonGlyph)
 
         if codePoints != self.glyphMap.get(glyphName):
             self.glyphMap[glyphName] = codePoints
+            self._glyphInfoChanges[glyphName] = codePoints
             self._scheduler.schedule(self._writeGlyphInfo)
 
         if self._glyphDependencies is not None:
@@ -144,9 +215,9 @@ class FontraBackend:
     async def deleteGlyph(self, glyphName: str) -> None:
         if glyphName not in self.glyphMap:
             raise KeyError(f"Glyph '{glyphName}' does not exist")
-        filePath = self.getGlyphFilePath(glyphName)
-        filePath.unlink()
+        self._submitGlyphWrite(glyphName, None)
         del self.glyphMap[glyphName]
+        self._glyphInfoChanges[glyphName] = None
         self._scheduler.schedule(self._writeGlyphInfo)
         if self._glyphDependencies is not None:
             self._glyphDependencies.update(glyphName, ())
@@ -178,7 +249,65 @@ class FontraBackend:
     async def putKerning(self, kerning: dict[str, Kerning]) -> None:
         assert all(isinstance(table, Kerning) for table in kerning.values())
         self.fontData.kerning = deepcopy(kerning)
-        self._scheduler.schedule(self._writeFontData)
+        self._kerningNeedsFullWrite = True
+        self._kerningJournalEntries = []
+        self._scheduler.schedule(self._writeKerning)
+
+    async def putKerningValues(
+        self,
+        kernType: str,
+        kerningTable: Kerning,
+        pairs: Iterable[tuple[str, str | None]],
+    ) -> None:
+        """Write the values of the given kerning `pairs` of `kerningTable`,
+        by appending them to the kerning journal. A `(left, None)` pair stands
+        for all pairs with `left` as the left side. If anything other than the
+        values changed, the whole kerning is written instead.
+        """
+        currentTable = self.fontData.kerning.get(kernType)
+        if (
+            currentTable is None
+            or not _hasKerningData(currentTable)
+            or currentTable.sourceIdentifiers != kerningTable.sourceIdentifiers
+            or currentTable.groupsSide1 != kerningTable.groupsSide1
+            or currentTable.groupsSide2 != kerningTable.groupsSide2
+        ):
+            # We can't do an incremental update
+            await self.putKerning({**self.fontData.kerning, kernType: kerningTable})
+            return
+
+        # Don't modify the current table in place, as the writer thread may
+        # be using it. Only the changed rows are copied.
+        values = dict(currentTable.values)
+        for left, right in pairs:
+            currentRow = currentTable.values.get(left, {})
+            newRow = kerningTable.values.get(left, {})
+            rights = currentRow.keys() | newRow.keys() if right is None else {right}
+            row = dict(values.get(left, {}))
+            for rightName in sorted(rights):
+                if rightName in newRow:
+                    rowValues = list(newRow[rightName])
+                    if rowValues != currentRow.get(rightName):
+                        self._kerningJournalEntries.append(
+                            ["value", kernType, left, rightName]
+                            + ["" if v is None else v for v in rowValues]
+                        )
+                    row[rightName] = rowValues
+                elif rightName in currentRow:
+                    self._kerningJournalEntries.append(
+                        ["delete", kernType, left, rightName]
+                    )
+                    row.pop(rightName, None)
+            if row:
+                values[left] = row
+            else:
+                values.pop(left, None)
+
+        self.fontData.kerning = {
+            **self.fontData.kerning,
+            kernType: replace(currentTable, values=values),
+        }
+        self._scheduler.schedule(self._writeKerning)
 
     async def getFeatures(self) -> OpenTypeFeatures:
         return deepcopy(self.fontData.features)
@@ -199,9 +328,10 @@ class FontraBackend:
 
     async def putBackgroundImage(self, imageIdentifier: str, data: ImageData) -> None:
         fileName = f"{imageIdentifier}.{data.type.lower()}"
-        self.backgroundImagesDir.mkdir(exist_ok=True)
         path = self.backgroundImagesDir / fileName
-        path.write_bytes(data.data)
+        await asyncio.wrap_future(
+            self._submitWrite(writeBackgroundImageFile, path, data.data)
+        )
 
     async def getCustomData(self) -> dict[str, Any]:
         return deepcopy(self.fontData.customData)
@@ -210,6 +340,15 @@ class FontraBackend:
         self.fontData.customData = deepcopy(customData)
         self._scheduler.schedule(self._writeFontData)
 
+    def setGlyphFormatVersion(self, glyphFormatVersion: int) -> None:
+        """Set the format for glyphs written from now on. Existing glyph files
+        are not converted.
+        """
+        if glyphFormatVersion not in (GLYPH_FORMAT_UNPACKED, GLYPH_FORMAT_PACKED):
+            raise ValueError(f"unknown glyph format version: {glyphFormatVersion}")
+        self.glyphFormatVersion = glyphFormatVersion
+        self._scheduler.schedule(self._writeFontData)
+
     def _readGlyphInfo(self) -> None:
         with self.glyphInfoPath.open("r", encoding="utf-8", newline="") as file:
             reader = csv.reader(file, delimiter=";")
@@ -223,18 +362,80 @@ class FontraBackend:
                     codePoints = []
                 self.glyphMap[glyphName] = codePoints
 
+        journal = readJournal(self.glyphInfoJournalPath)
+        for row in journal:
+            match row:
+                case ["set", glyphName, codePointsString]:
+                    self.glyphMap[glyphName] = _parseCodePoints(codePointsString)
+                case ["delete", glyphName]:
+                    self.glyphMap.pop(glyphName, None)
+                case _:
+                    logger.warning(f"skipping invalid glyph info journal row: {row}")
+        self._glyphInfoJournalSize = len(journal)
+
     def _writeGlyphInfo(self) -> None:
-        with self.glyphInfoPath.open("w", encoding="utf-8", newline="") as file:
-            writer = csv.writer(file, delimiter=";")
-            writer.writerow(["glyph name", "code points"])
-            for glyphName, codePoints in sorted(self.glyphMap.items()):
-                codePointsString = ",".join(f"U+{cp:04X}" for cp in codePoints)
-                writer.writerow([glyphName, codePointsString])
+        changes = self._glyphInfoChanges
+        self._glyphInfoChanges = {}
+        journalSize = self._glyphInfoJournalSize + len(changes)
+        if journalSize > _journalSizeLimit(len(self.glyphMap)):
+            self._writeGlyphInfoFiles()
+            return
+        rows = [
+            (
+                ["set", glyphName, _formatCodePoints(codePoints)]
+                if codePoints is not None
+                else ["delete", glyphName]
+            )
+            for glyphName, codePoints in changes.items()
+        ]
+        self._submitWrite(appendJournal, self.glyphInfoJournalPath, rows)
+        self._glyphInfoJournalSize = journalSize
+
+    def _writeGlyphInfoFiles(self) -> None:
+        self._submitWrite(
+            writeGlyphInfoFile, self.glyphInfoPath, sorted(self.glyphMap.items())
+        )
+        self._submitWrite(deleteFile, self.glyphInfoJournalPath)
+        self._glyphInfoJournalSize = 0
+
+    def _writeKerning(self) -> None:
+        entries = self._kerningJournalEntries
+        self._kerningJournalEntries = []
+        journalSize = self._kerningJournalSize + len(entries)
+        numPairs = sum(
+            len(row)
+            for kerningTable in self.fontData.kerning.values()
+            for row in kerningTable.values.values()
+        )
+        if self._kerningNeedsFullWrite or journalSize > _journalSizeLimit(numPairs):
+            self._writeKerningFiles()
+            return
+        self._submitWrite(appendJournal, self.kerningJournalPath, entries)
+        self._kerningJournalSize = journalSize
+
+    def _writeKerningFiles(self) -> None:
+        # self.fontData.kerning is replaced, but never modified in place
+        self._submitWrite(
+            writeKerningFiles,
+            self.kerningPath,
+            self.kerningJournalPath,
+            self.fontData.kerning,
+        )
+        self._kerningNeedsFullWrite = False
+        self._kerningJournalSize = 0
+
+    def _compactJournals(self) -> None:
+        if self._glyphInfoJournalSize:
+            self._writeGlyphInfoFiles()
+        if self._kerningJournalSize:
+            self._writeKerningFiles()
 
     def _readFontData(self) -> None:
-        self.fontData = structure(
-            json.loads(self.fontDataPath.read_text(encoding="utf-8")), Font
+        fontData = json.loads(self.fontDataPath.read_text(encoding="utf-8"))
+        self.glyphFormatVersion = fontData.pop(
+            "glyphFormatVersion", GLYPH_FORMAT_UNPACKED
         )
+        self.fontData = structure(fontData, Font)
         if self.featureTextPath.exists():
             self.fontData.features.text = self.featureTextPath.read_text(
                 encoding="utf-8"
@@ -242,19 +443,42 @@ class FontraBackend:
         if self.kerningPath.exists():
             self.fontData.kerning = readKerningFile(self.kerningPath)
 
+        journal = readJournal(self.kerningJournalPath)
+        for row in journal:
+            match row:
+                case ["value", kernType, left, right, *values]:
+                    if kernType in self.fontData.kerning:
+                        self.fontData.kerning[kernType].values.setdefault(left, {})[
+                            right
+                        ] = [kerningParseValue(v) if v else None for v in values]
+                        continue
+                case ["delete", kernType, left, right]:
+                    if kernType in self.fontData.kerning:
+                        kerningValues = self.fontData.kerning[kernType].values
+                        rightDict = kerningValues.get(left)
+                        if rightDict is not None:
+                            rightDict.pop(right, None)
+                            if not rightDict:
+                                del kerningValues[left]
+                        continue
+            logger.warning(f"skipping invalid kerning journal row: {row}")
+        self._kerningJournalSize = len(journal)
+
     def _writeFontData(self) -> None:
-        fontData = unstructure(self.fontData)
+        # The attributes of self.fontData are replaced, but never modified in
+        # place, so a shallow copy is a consistent snapshot for the writer thread
+        self._submitWrite(
+            self._writeFontDataFiles, copy(self.fontData), self.glyphFormatVersion
+        )
+
+    def _writeFontDataFiles(self, font: Font, glyphFormatVersion: int) -> None:
+        fontData = unstructure(font)
         fontData.pop("glyphs", None)
         fontData.pop("glyphMap", None)
         fontData.pop("kerning", None)
-
-        if any(
-            kernTable.values or kernTable.groupsSide1 or kernTable.groupsSide2
-            for kernTable in self.fontData.kerning.values()
-        ):
-            writeKerningFile(self.kerningPath, self.fontData.kerning)
-        elif self.kerningPath.exists():
-            self.kerningPath.unlink()
+        if glyphFormatVersion != GLYPH_FORMAT_UNPACKED:
+            # omit if default
+            fontData = {"glyphFormatVersion": glyphFormatVersion, **fontData}
 
         featureText = None
         if "features" in fontData:
@@ -263,13 +487,34 @@ class FontraBackend:
                 # omit if default
                 del fontData["features"]
             if featureText:
-                self.featureTextPath.write_text(featureText, encoding="utf-8")
+                writeTextFile(self.featureTextPath, featureText)
         if not featureText and self.featureTextPath.exists():
             self.featureTextPath.unlink()
 
-        self.fontDataPath.write_text(serialize(fontData) + "\n", encoding="utf-8")
+        writeTextFile(self.fontDataPath, serialize(fontData) + "\n")
+
+    def _submitGlyphWrite(self, glyphName: str, jsonGlyph: dict | None) -> None:
+        filePath = self.getGlyphFilePath(glyphName)
+        if jsonGlyph is not None:
+            future = self._submitWrite(writeGlyphFile, filePath, jsonGlyph)
+        else:
+            future = self._submitWrite(deleteFile, filePath)
+        self._pendingGlyphs[glyphName] = (future, jsonGlyph)
+
+        def writeDone(_):
+            pending = self._pendingGlyphs.get(glyphName)
+            if pending is not None and pending[0] is future:
+                del self._pendingGlyphs[glyphName]
+
+        asyncio.wrap_future(future).add_done_callback(writeDone)
 
     def getGlyphData(self, glyphName: str) -> str:
+        pending = self._pendingGlyphs.get(glyphName)
+        if pending is not None:
+            _, jsonGlyph = pending
+            if jsonGlyph is None:
+                raise KeyError(glyphName)
+            return serializeGlyphData(jsonGlyph)
         filePath = self.getGlyphFilePath(glyphName)
         if not filePath.is_file():
             raise KeyError(glyphName)
@@ -288,7 +533,7 @@ class FontraBackend:
 
         if self._glyphDependenciesTask is None:
             self._glyphDependenciesTask = asyncio.create_task(
-                extractGlyphDependenciesFromFontra(self.glyphsDir)
+                self._extractGlyphDependencies()
             )
 
             def setResult(task):
@@ -299,10 +544,137 @@ class FontraBackend:
 
         return await self._glyphDependenciesTask
 
+    async def _extractGlyphDependencies(self) -> GlyphDependencies:
+        # The glyph files must be up to date before they can be read
+        await self._waitForWrites()
+        return await extractGlyphDependenciesFromFontra(
+            self.glyphsDir, getGlyphDependenciesCachePath(self.path)
+        )
+
     def startOptionalBackgroundTasks(self) -> None:
         self._backgroundTasksTask = asyncio.create_task(self.glyphDependencies)
 
 
+def _noop() -> None:
+    pass
+
+
+def _logWriteError(future: concurrent.futures.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("error while writing file", exc_info=future.exception())
+
+
+def _getUmask() -> int:
+    # The umask can only be read by setting it, so do this once, at import time,
+    # and not from the writer thread
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_umask = _getUmask()
+
+
+@contextmanager
+def atomicWritePath(path: pathlib.Path):
+    """Yield a temporary path next to `path`, and move it to `path` when the
+    block succeeds. This way readers never see a partially written file.
+    The file gets the mode of the file it replaces, or the default mode for
+    new files.
+    """
+    fd, tempPath = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield pathlib.Path(tempPath)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            # mkstemp() creates the file with mode 0o600
+            mode = 0o666 & ~_umask
+        os.chmod(tempPath, mode)
+        os.replace(tempPath, path)
+    except BaseException:
+        os.unlink(tempPath)
+        raise
+
+
+def writeTextFile(path: pathlib.Path, text: str) -> None:
+    with atomicWritePath(path) as tempPath:
+        tempPath.write_text(text, encoding="utf-8")
+
+
+def writeGlyphFile(path: pathlib.Path, jsonGlyph: dict) -> None:
+    writeTextFile(path, serializeGlyphData(jsonGlyph))
+
+
+def deleteFile(path: pathlib.Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+def writeGlyphInfoFile(
+    path: pathlib.Path, glyphMapItems: list[tuple[str, list[int]]]
+) -> None:
+    with atomicWritePath(path) as tempPath:
+        with tempPath.open("w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(["glyph name", "code points"])
+            for glyphName, codePoints in glyphMapItems:
+                writer.writerow([glyphName, _formatCodePoints(codePoints)])
+
+
+def writeKerningFiles(
+    path: pathlib.Path, journalPath: pathlib.Path, kerning: dict[str, Kerning]
+) -> None:
+    if any(_hasKerningData(kerningTable) for kerningTable in kerning.values()):
+        writeKerningFile(path, kerning)
+    else:
+        path.unlink(missing_ok=True)
+    journalPath.unlink(missing_ok=True)
+
+
+def _hasKerningData(kerningTable: Kerning) -> bool:
+    return bool(
+        kerningTable.values or kerningTable.groupsSide1 or kerningTable.groupsSide2
+    )
+
+
+def _journalSizeLimit(numItems: int) -> int:
+    # Merging a journal costs a full rewrite, so let the journal grow in
+    # proportion to the data, to keep the cost per change constant
+    return max(1000, numItems // 2)
+
+
+def readJournal(path: pathlib.Path) -> list[list[str]]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    lines = text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        # An incomplete row, from an interrupted write
+        logger.warning(f"skipping incomplete last row of {path}")
+        del lines[-1]
+    return [row for row in csv.reader(lines, delimiter=";") if row]
+
+
+def appendJournal(path: pathlib.Path, rows: list[list]) -> None:
+    if not rows:
+        return
+    with path.open("a", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter=";", lineterminator="\n")
+        writer.writerows(rows)
+
+
+def writeBackgroundImageFile(path: pathlib.Path, data: bytes) -> None:
+    path.parent.mkdir(exist_ok=True)
+    with atomicWritePath(path) as tempPath:
+        tempPath.write_bytes(data)
+
+
+def _formatCodePoints(codePoints: list[int]) -> str:
+    return ",".join(f"U+{cp:04X}" for cp in codePoints)
+
+
 def _parseCodePoints(cell: str) -> list[int]:
     codePoints = []
     cell = cell.strip()
@@ -316,11 +688,19 @@ def _parseCodePoints(cell: str) -> list[int]:
     return codePoints
 
 
-def serializeGlyph(glyph, glyphName=None):
-    glyph = glyph.convertToPaths()
+def serializeGlyph(glyph, glyphName=None, packedPaths=False):
+    return serializeGlyphData(unstructureGlyph(glyph, glyphName, packedPaths))
+
+
+def unstructureGlyph(glyph, glyphName=None, packedPaths=False):
+    glyph = glyph.convertToPackedPaths() if packedPaths else glyph.convertToPaths()
     jsonGlyph = unstructure(glyph)
     if glyphName is not None:
         jsonGlyph["name"] = glyphName
+    return jsonGlyph
+
+
+def serializeGlyphData(jsonGlyph):
     return serialize(jsonGlyph) + "\n"
 
 
@@ -337,6 +717,11 @@ def serialize(data: list | dict) -> str:
 
 
 def writeKerningFile(path: pathlib.Path, kerning: dict[str, Kerning]) -> None:
+    with atomicWritePath(path) as tempPath:
+        _writeKerningFile(tempPath, kerning)
+
+
+def _writeKerningFile(path: pathlib.Path, kerning: dict[str, Kerning]) -> None:
     with path.open("w", encoding="utf-8", newline="") as file:
         writer = csv.writer(file, delimiter=";")
 
@@ -492,34 +877,11 @@ def nextNonBlankRow(rowIter):
     return None, None
 
 
-@dataclass(kw_only=True)
-class Scheduler:
-    delay: float = 0.2
-    scheduledCallables: dict[str, Callable] = field(default_factory=dict)
-    timerHandle: asyncio.TimerHandle | None = None
-
-    def schedule(self, callable: Callable):
-        self.scheduledCallables[callable.__name__] = callable
-        if self.timerHandle is not None:
-            self.timerHandle.cancel()
-        loop = asyncio.get_running_loop()
-        self.timerHandle = loop.call_later(self.delay, self.flush)
-
-    def flush(self):
-        if self.timerHandle is not None:
-            self.timerHandle.cancel()
-            self.timerHandle = None
-        logger.debug("calling scheduled callables")
-        for callable in self.scheduledCallables.values():
-            callable()
-        self.scheduledCallables = {}
-
-
 async def extractGlyphDependenciesFromFontra(
-    glyphsDir: pathlib.Path,
+    glyphsDir: pathlib.Path, cachePath: pathlib.Path | None = None
 ) -> GlyphDependencies:
     componentInfo = await runInSubProcess(
-        partial(_extractComponentInfoFromUFO, glyphsDir)
+        partial(_extractComponentInfoFromFontra, glyphsDir, cachePath)
     )
 
     dependencies = GlyphDependencies()
@@ -528,13 +890,19 @@ async def extractGlyphDependenciesFromFontra(
     return dependencies
 
 
-def _extractComponentInfoFromUFO(glyphsDir: pathlib.Path) -> dict[str, set[str]]:
-    componentInfo = {}
-    for glyphPath in glyphsDir.glob("*.json"):
-        glyphName = fileNameToString(glyphPath.stem)
-        glyphData = json.loads(glyphPath.read_text(encoding="utf-8"))
-        componentInfo[glyphName] = componentNamesFromGlyphData(glyphData)
-    return componentInfo
+def _extractComponentInfoFromFontra(
+    glyphsDir: pathlib.Path, cachePath: pathlib.Path | None = None
+) -> dict[str, set[str]]:
+    glyphPaths = {
+        fileNameToString(glyphPath.stem): os.fspath(glyphPath)
+        for glyphPath in glyphsDir.glob("*.json")
+    }
+
+    def readComponentNames(glyphName):
+        with open(glyphPaths[glyphName], encoding="utf-8") as f:
+            return componentNamesFromGlyphData(json.load(f))
+
+    return readComponentInfoIncrementally(glyphPaths, readComponentNames, cachePath)
 
 
 def componentNamesFromGlyph(glyph):
@@ -0,0 +1,491 @@
+import asyncio
+import hashlib
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import Any
+
+from ..core.async_property import async_property
+from ..core.classes import (
+    Axes,
+    Font,
+    FontInfo,
+    FontSource,
+    ImageData,
+    Kerning,
+    OpenTypeFeatures,
+    VariableGlyph,
+    structure,
+    unstructure,
+)
+from ..core.glyphdependencies import GlyphDependencies
+from ..core.protocols import WritableFontBackend
+from ..core.scheduler import Scheduler
+from ..core.subprocess import runInSubProcess
+from ..core.threading import runInThread
+from .fontra import (
+    componentNamesFromGlyph,
+    componentNamesFromGlyphData,
+    deserializeGlyph,
+    serializeGlyph,
+)
+
+logger = logging.getLogger(__name__)
+
+
+FONTRADB_FORMAT_VERSION = 1
+
+# The Font fields that are stored as rows in the fontData table
+fontDataKeys = [
+    field.name
+    for field in fields(Font)
+    if field.name not in {"glyphs", "glyphMap", "kerning"}
+]
+
+tableDefinitions = [
+    "meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "glyphs (name TEXT PRIMARY KEY, hash TEXT NOT NULL, data TEXT NOT NULL)",
+    "glyphMap (name TEXT PRIMARY KEY, codePoints TEXT NOT NULL)",
+    "kerning (kernType TEXT PRIMARY KEY, data TEXT NOT NULL)",
+    "fontData (key TEXT PRIMARY KEY, data TEXT NOT NULL)",
+    "backgroundImages (identifier TEXT PRIMARY KEY, type TEXT NOT NULL, data BLOB)",
+]
+
+
+@dataclass(kw_only=True)
+class _Changes:
+    # A batch of changes, to be written in a single transaction. Deleted glyphs
+    # and glyph map entries have a None value.
+    glyphs: dict[str, str | None]
+    glyphMap: dict[str, list[int] | None]
+    fontData: dict[str, Any]
+    kerning: dict[str, Kerning] | None
+
+
+class FontraDBFormatError(Exception):
+    pass
+
+
+class FontraDBBackend:
+    """A single-file variant of the .fontra format, stored in an SQLite database.
+
+    Glyphs are stored as rows containing the same JSON data as the .fontra glyph
+    files, along with a hash of that data. The glyph map, the kerning and the
+    other font data are stored in their own tables. Changes are collected and
+    written in a single transaction in a worker thread, shortly after the last
+    change. `flush()` writes all pending changes before it returns.
+    """
+
+    @classmethod
+    def fromPath(cls, path) -> WritableFontBackend:
+        return cls(path=path)
+
+    @classmethod
+    def createFromPath(cls, path) -> WritableFontBackend:
+        return cls(path=path, create=True)
+
+    def __init__(self, *, path: Any, create: bool = False):
+        self.path = pathlib.Path(path).resolve()
+        if create:
+            # Stale WAL files would otherwise be applied to the new database
+            for suffix in ["", "-wal", "-shm"]:
+                self.path.with_name(self.path.name + suffix).unlink(missing_ok=True)
+        elif not self.path.is_file():
+            raise FileNotFoundError(self.path)
+
+        # The connection is shared with worker threads, access is guarded by
+        # self._lock
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        if create:
+            self._createTables()
+        try:
+            self._checkFormatVersion()
+        except FontraDBFormatError:
+            self.connection.close()
+            raise
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        self.glyphMap: dict[str, list[int]] = {}
+        self._readGlyphMap()
+        self._readFontData()
+
+        self._scheduler = Scheduler()
+        self._glyphsToWrite: dict[str, str | None] = {}
+        self._glyphMapToWrite: dict[str, list[int] | None] = {}
+        self._fontDataKeysToWrite: set[str] = set()
+        self._writeKerning = False
+        self._pendingChanges: list[_Changes] = []
+        self._writeTasks: set[asyncio.Task] = set()
+
+        self._glyphDependenciesTask: asyncio.Task[GlyphDependencies] | None = None
+        self._glyphDependencies: GlyphDependencies | None = None
+        self._backgroundTasksTask: asyncio.Task | None = None
+
+    def _createTables(self) -> None:
+        with self.connection:
+            for tableDefinition in tableDefinitions:
+                self.connection.execute(f"CREATE TABLE {tableDefinition}")
+            self.connection.execute(
+                "INSERT INTO meta VALUES ('formatVersion', ?)",
+                (str(FONTRADB_FORMAT_VERSION),),
+            )
+
+    def _checkFormatVersion(self) -> None:
+        try:
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'formatVersion'"
+            ).fetchone()
+        except sqlite3.DatabaseError as e:
+            raise FontraDBFormatError(f"not a .fontradb file: {self.path}") from e
+        if row is None or int(row[0]) > FONTRADB_FORMAT_VERSION:
+            raise FontraDBFormatError(
+                f"unsupported .fontradb format version: {row and row[0]}"
+            )
+
+    async def aclose(self) -> None:
+        self._scheduler.flush()
+        await asyncio.gather(*self._writeTasks)
+        if self._glyphDependenciesTask is not None:
+            self._glyphDependenciesTask.cancel()
+        if self._backgroundTasksTask is not None:
+            self._backgroundTasksTask.cancel()
+        await runInThread(self._close)
+
+    def _close(self) -> None:
+        with self._lock:
+            self._writePendingChanges()
+            self.connection.close()
+
+    def flush(self) -> None:
+        self._scheduler.flush()
+        with self._lock:
+            self._writePendingChanges()
+
+    async def getUnitsPerEm(self) -> int:
+        return self.fontData.unitsPerEm
+
+    async def putUnitsPerEm(self, unitsPerEm: int) -> None:
+        self.fontData.unitsPerEm = unitsPerEm
+        self._scheduleWriteFontData("unitsPerEm")
+
+    async def getGlyphMap(self) -> dict[str, list[int]]:
+        return dict(self.glyphMap)
+
+    async def putGlyphMap(self, value: dict[str, list[int]]) -> None:
+        pass
+
+    async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
+        if glyphName not in self.glyphMap:
+            return None
+        return await runInThread(self._readGlyph, glyphName)
+
+    def _readGlyph(self, glyphName: str) -> VariableGlyph | None:
+        try:
+            jsonSource = self.getGlyphData(glyphName)
+        except KeyError:
+            return None
+        return deserializeGlyph(jsonSource, glyphName)
+
+    async def putGlyph(
+        self, glyphName: str, glyph: VariableGlyph, codePoints: list[int]
+    ) -> None:
+        self._glyphsToWrite[glyphName] = serializeGlyph(glyph, glyphName)
+
+        if codePoints != self.glyphMap.get(glyphName):
+            self.glyphMap[glyphName] = codePoints
+            self._glyphMapToWrite[glyphName] = codePoints
+
+        self._scheduler.schedule(self._writeChanges)
+
+        if self._glyphDependencies is not None:
+            self._glyphDependencies.update(glyphName, componentNamesFromGlyph(glyph))
+
+    async def deleteGlyph(self, glyphName: str) -> None:
+        if glyphName not in self.glyphMap:
+            raise KeyError(f"Glyph '{glyphName}' does not exist")
+        del self.glyphMap[glyphName]
+        self._glyphsToWrite[glyphName] = None
+        self._glyphMapToWrite[glyphName] = None
+        self._scheduler.schedule(self._writeChanges)
+        if self._glyphDependencies is not None:
+            self._glyphDependencies.update(glyphName, ())
+
+    async def getFontInfo(self) -> FontInfo:
+        return deepcopy(self.fontData.fontInfo)
+
+    async def putFontInfo(self, fontInfo: FontInfo):
+        self.fontData.fontInfo = deepcopy(fontInfo)
+        self._scheduleWriteFontData("fontInfo")
+
+    async def getAxes(self) -> Axes:
+        return deepcopy(self.fontData.axes)
+
+    async def putAxes(self, axes: Axes) -> None:
+        self.fontData.axes = deepcopy(axes)
+        self._scheduleWriteFontData("axes")
+
+    async def getSources(self) -> dict[str, FontSource]:
+        return deepcopy(self.fontData.sources)
+
+    async def putSources(self, sources: dict[str, FontSource]) -> None:
+        self.fontData.sources = deepcopy(sources)
+        self._scheduleWriteFontData("sources")
+
+    async def getKerning(self) -> dict[str, Kerning]:
+        return deepcopy(self.fontData.kerning)
+
+    async def putKerning(self, kerning: dict[str, Kerning]) -> None:
+        assert all(isinstance(table, Kerning) for table in kerning.values())
+        self.fontData.kerning = deepcopy(kerning)
+        self._writeKerning = True
+        self._scheduler.schedule(self._writeChanges)
+
+    async def getFeatures(self) -> OpenTypeFeatures:
+        return deepcopy(self.fontData.features)
+
+    async def putFeatures(self, features: OpenTypeFeatures) -> None:
+        assert isinstance(features, OpenTypeFeatures)
+        self.fontData.features = deepcopy(features)
+        self._scheduleWriteFontData("features")
+
+    async def getCustomData(self) -> dict[str, Any]:
+        return deepcopy(self.fontData.customData)
+
+    async def putCustomData(self, customData: dict[str, Any]) -> None:
+        self.fontData.customData = deepcopy(customData)
+        self._scheduleWriteFontData("customData")
+
+    async def getBackgroundImage(self, imageIdentifier: str) -> ImageData | None:
+        return await runInThread(self._readBackgroundImage, imageIdentifier)
+
+    def _readBackgroundImage(self, imageIdentifier: str) -> ImageData | None:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT type, data FROM backgroundImages WHERE identifier = ?",
+                (imageIdentifier,),
+            ).fetchone()
+        if row is None:
+            return None  # Image not found
+        imageType, data = row
+        return ImageData(type=imageType, data=data)
+
+    async def putBackgroundImage(self, imageIdentifier: str, data: ImageData) -> None:
+        await runInThread(self._writeBackgroundImage, imageIdentifier, data)
+
+    def _writeBackgroundImage(self, imageIdentifier: str, data: ImageData) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO backgroundImages VALUES (?, ?, ?)",
+                (imageIdentifier, data.type, data.data),
+            )
+
+    def getGlyphData(self, glyphName: str) -> str:
+        # Look for the most recent unwritten change first
+        for glyphsToWrite in [
+            self._glyphsToWrite,
+            *(changes.glyphs for changes in reversed(list(self._pendingChanges))),
+        ]:
+            if glyphName in glyphsToWrite:
+                jsonSource = glyphsToWrite[glyphName]
+                if jsonSource is None:
+                    raise KeyError(glyphName)
+                return jsonSource
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data FROM glyphs WHERE name = ?", (glyphName,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(glyphName)
+        return row[0]
+
+    def _scheduleWriteFontData(self, key: str) -> None:
+        self._fontDataKeysToWrite.add(key)
+        self._scheduler.schedule(self._writeChanges)
+
+    def _readGlyphMap(self) -> None:
+        for glyphName, codePoints in self.connection.execute(
+            "SELECT name, codePoints FROM glyphMap ORDER BY name"
+        ):
+            self.glyphMap[glyphName] = json.loads(codePoints)
+
+    def _readFontData(self) -> None:
+        fontData = {
+            key: json.loads(data)
+            for key, data in self.connection.execute("SELECT key, data FROM fontData")
+            if key in fontDataKeys
+        }
+        fontData["kerning"] = {
+            kernType: json.loads(data)
+            for kernType, data in self.connection.execute(
+                "SELECT kernType, data FROM kerning ORDER BY rowid"
+            )
+        }
+        self.fontData = structure(fontData, Font)
+
+    def _writeChanges(self) -> None:
+        # The font data objects are replaced, not modified, by the put methods,
+        # so they can be serialized later, in a worker thread
+        self._pendingChanges.append(
+            _Changes(
+                glyphs=self._glyphsToWrite,
+                glyphMap=self._glyphMapToWrite,
+                fontData={
+                    key: getattr(self.fontData, key)
+                    for key in sorted(self._fontDataKeysToWrite)
+                },
+                kerning=self.fontData.kerning if self._writeKerning else None,
+            )
+        )
+        self._glyphsToWrite = {}
+        self._glyphMapToWrite = {}
+        self._fontDataKeysToWrite = set()
+        self._writeKerning = False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            with self._lock:
+                self._writePendingChanges()
+        else:
+            # Write in a thread, so we don't block the event loop
+            task = asyncio.create_task(runInThread(self._writePendingChangesLocked))
+            self._writeTasks.add(task)
+            task.add_done_callback(self._writeTasks.discard)
+
+    def _writePendingChangesLocked(self) -> None:
+        with self._lock:
+            self._writePendingChanges()
+
+    def _writePendingChanges(self) -> None:
+        # Must be called with self._lock held. The changes stay visible to
+        # getGlyphData() until they are committed.
+        pendingChanges = list(self._pendingChanges)
+        if not pendingChanges:
+            return
+        for changes in pendingChanges:
+            self._writeChangesToDatabase(changes)
+        del self._pendingChanges[: len(pendingChanges)]
+
+    def _writeChangesToDatabase(self, changes: _Changes) -> None:
+        glyphsToWrite = changes.glyphs
+        glyphMapToWrite = changes.glyphMap
+
+        # All changes are written in a single transaction
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO glyphs VALUES (?, ?, ?) ON CONFLICT(name) DO UPDATE "
+                "SET hash = excluded.hash, data = excluded.data "
+                "WHERE glyphs.hash != excluded.hash",
+                [
+                    (glyphName, hashGlyphData(jsonSource), jsonSource)
+                    for glyphName, jsonSource in glyphsToWrite.items()
+                    if jsonSource is not None
+                ],
+            )
+            self.connection.executemany(
+                "DELETE FROM glyphs WHERE name = ?",
+                [
+                    (glyphName,)
+                    for glyphName, jsonSource in glyphsToWrite.items()
+                    if jsonSource is None
+                ],
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO glyphMap VALUES (?, ?)",
+                [
+                    (glyphName, json.dumps(codePoints))
+                    for glyphName, codePoints in glyphMapToWrite.items()
+                    if codePoints is not None
+                ],
+            )
+            self.connection.executemany(
+                "DELETE FROM glyphMap WHERE name = ?",
+                [
+                    (glyphName,)
+                    for glyphName, codePoints in glyphMapToWrite.items()
+                    if codePoints is None
+                ],
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO fontData VALUES (?, ?)",
+                [
+                    (key, serializeData(unstructure(value)))
+                    for key, value in changes.fontData.items()
+                ],
+            )
+            if changes.kerning is not None:
+                self.connection.execute("DELETE FROM kerning")
+                self.connection.executemany(
+                    "INSERT INTO kerning VALUES (?, ?)",
+                    [
+                        (kernType, serializeData(unstructure(kerningTable)))
+                        for kernType, kerningTable in changes.kerning.items()
+                    ],
+                )
+
+    async def findGlyphsThatUseGlyph(self, glyphName):
+        return sorted((await self.glyphDependencies).usedBy.get(glyphName, []))
+
+    @async_property
+    async def glyphDependencies(self) -> GlyphDependencies:
+        if self._glyphDependencies is not None:
+            return self._glyphDependencies
+
+        if self._glyphDependenciesTask is None:
+            # Make sure the subprocess sees all glyphs
+            self.flush()
+            self._glyphDependenciesTask = asyncio.create_task(
+                extractGlyphDependenciesFromFontraDB(self.path)
+            )
+
+            def setResult(task):
+                if not task.cancelled() and task.exception() is None:
+                    self._glyphDependencies = task.result()
+
+            self._glyphDependenciesTask.add_done_callback(setResult)
+
+        return await self._glyphDependenciesTask
+
+    def startOptionalBackgroundTasks(self) -> None:
+        self._backgroundTasksTask = asyncio.create_task(self.glyphDependencies)
+
+
+def hashGlyphData(jsonSource: str) -> str:
+    return hashlib.sha256(jsonSource.encode("utf-8")).hexdigest()
+
+
+def serializeData(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+async def extractGlyphDependenciesFromFontraDB(
+    path: pathlib.Path,
+) -> GlyphDependencies:
+    componentInfo = await runInSubProcess(
+        partial(_extractComponentInfoFromFontraDB, path)
+    )
+
+    dependencies = GlyphDependencies()
+    for glyphName, componentNames in componentInfo.items():
+        dependencies.update(glyphName, componentNames)
+    return dependencies
+
+
+def _extractComponentInfoFromFontraDB(path: pathlib.Path) -> dict[str, set[str]]:
+    connection = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    try:
+        return {
+            glyphName: componentNamesFromGlyphData(json.loads(jsonSource))
+            for glyphName, jsonSource in connection.execute(
+                "SELECT name, data FROM glyphs"
+            )
+        }
+    finally:
+        connection.close()
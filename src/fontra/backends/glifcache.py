@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import threading
+from typing import Any
+
+from .. import __version__ as fontraVersion
+from ..core.cachedir import getProjectCacheKey
+
+logger = logging.getLogger(__name__)
+
+PathLike = os.PathLike | str
+
+
+# Bump this when the structure of the cached data changes
+GLIF_CACHE_FORMAT_VERSION = 1
+
+GlifStampType = tuple[int, int]  # (mtime_ns, size)
+
+
+def getGlifStamp(path: str) -> GlifStampType | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class GlifCache:
+    """A persistent cache for parsed .glif files, stored in an SQLite database.
+    Each entry is keyed by the .glif file path, and is only valid as long as
+    the file's modification time and size are unchanged. The cached objects
+    are stored in pickled form. New entries are only committed to the database
+    when `commit()` is called. The methods may be called from any thread.
+    """
+
+    def __init__(self, cachePath: PathLike):
+        self.cachePath = pathlib.Path(cachePath)
+        self.cachePath.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.cachePath, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._checkFormatVersion()
+        self._pendingEntries: dict[str, tuple[GlifStampType, bytes]] = {}
+
+    @classmethod
+    def forProject(cls, cacheDir: PathLike, projectPath: PathLike) -> GlifCache:
+        projectKey = getProjectCacheKey(projectPath)
+        return cls(pathlib.Path(cacheDir) / f"{projectKey}.sqlite")
+
+    def _checkFormatVersion(self) -> None:
+        formatVersion = f"{GLIF_CACHE_FORMAT_VERSION}/{fontraVersion}"
+        connection = self._connection
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = connection.execute(
+            "SELECT value FROM meta WHERE key = 'formatVersion'"
+        ).fetchone()
+        if row is None or row[0] != formatVersion:
+            if row is not None:
+                logger.info(f"discarding outdated glif cache {self.cachePath}")
+            connection.execute("DROP TABLE IF EXISTS glifs")
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('formatVersion', ?)",
+                (formatVersion,),
+            )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS glifs "
+            "(path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, data BLOB)"
+        )
+        connection.commit()
+
+    def getMany(self, stamps: dict[str, GlifStampType | None]) -> dict[str, Any]:
+        """Return a dict with the cached objects for the paths in `stamps`, a
+        dict mapping paths to stamps, as returned by `getGlifStamp()`. Paths
+        for which there is no valid cached object are omitted.
+        """
+        paths = [path for path, stamp in stamps.items() if stamp is not None]
+        if not paths:
+            return {}
+
+        with self._lock:
+            rows = self._getRows(paths)
+
+        results = {}
+        for path, (stamp, data) in rows.items():
+            if stamp == stamps[path]:
+                try:
+                    results[path] = pickle.loads(data)
+                except Exception as e:
+                    logger.warning(f"can't read glif cache entry for {path}: {e!r}")
+        return results
+
+    def _getRows(self, paths: list[str]) -> dict[str, tuple[GlifStampType, bytes]]:
+        rows: dict[str, tuple[GlifStampType, bytes]] = {}
+        for path in paths:
+            pending = self._pendingEntries.get(path)
+            if pending is not None:
+                rows[path] = pending
+
+        queryPaths = [path for path in paths if path not in rows]
+        if queryPaths:
+            placeholders = ",".join("?" * len(queryPaths))
+            for path, mtime, size, data in self._connection.execute(
+                f"SELECT path, mtime, size, data FROM glifs WHERE path IN ({placeholders})",  # noqa: E501
+                queryPaths,
+            ):
+                rows[path] = ((mtime, size), data)
+        return rows
+
+    def put(self, path: str, stamp: GlifStampType | None, obj: Any) -> None:
+        if stamp is None:
+            return
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._pendingEntries[path] = (stamp, data)
+
+    def commit(self) -> None:
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if not self._pendingEntries:
+            return
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO glifs VALUES (?, ?, ?, ?)",
+            [
+                (path, mtime, size, data)
+                for path, ((mtime, size), data) in self._pendingEntries.items()
+            ],
+        )
+        self._connection.commit()
+        self._pendingEntries = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._connection.close()
@@ -1,5 +1,8 @@
+import mmap
+from collections import defaultdict
+from functools import cached_property
 from os import PathLike
-from typing import Any, Generator
+from typing import Any, Generator, Iterable
 
 from fontTools.misc.fixedTools import fixedToFloat
 from fontTools.misc.psCharStrings import SimpleT2Decompiler
@@ -24,6 +27,7 @@ from ..core.classes import (
     StaticGlyph,
     VariableGlyph,
 )
+from ..core.lrucache import LRUCache
 from ..core.path import PackedPath, PackedPathPointPen
 from ..core.varutils import locationToTuple
 
@@ -35,17 +39,19 @@ class OTFBackend:
 
     def __init__(self, *, path: PathLike) -> None:
         self.path = path
-        self.font = TTFont(path, lazy=True)
-        self.axes = unpackAxes(self.font)
-        gvar = self.font.get("gvar")
-        self.gvarVariations = gvar.variations if gvar is not None else None
-        varc = self.font.get("VARC")
-        self.varcTable = varc.table if varc is not None else None
-        self.charStrings = (
-            list(self.font["CFF2"].cff.values())[0].CharStrings
-            if "CFF2" in self.font
-            else None
-        )
+        # Map the file into memory instead of reading it, so only the parts
+        # of the font we actually use are loaded. Tables are decompiled on
+        # first use, and apart from the glyph map, everything else we need
+        # is set up lazily as well.
+        self._file = open(path, "rb")
+        try:
+            self._mappedFile = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self.font = TTFont(self._mappedFile, lazy=True)
+        except BaseException:
+            self._file.close()
+            raise
         self.characterMap = self.font.getBestCmap()
         glyphMap: dict[str, list[int]] = {}
         for glyphName in self.font.getGlyphOrder():
@@ -53,46 +59,118 @@ class OTFBackend:
         for code, glyphName in sorted(self.characterMap.items()):
             glyphMap[glyphName].append(code)
         self.glyphMap = glyphMap
-        self.glyphSet = self.font.getGlyphSet()
-        self.variationGlyphSets: dict[str, Any] = {}
+        self.variationGlyphSets: dict[str, Any] = LRUCache(maxSize=64)
+
+    @cached_property
+    def axes(self) -> Axes:
+        return unpackAxes(self.font)
+
+    @cached_property
+    def glyphSet(self):
+        return self.font.getGlyphSet()
+
+    @cached_property
+    def gvarVariations(self):
+        gvar = self.font.get("gvar")
+        return gvar.variations if gvar is not None else None
+
+    @cached_property
+    def varcTable(self):
+        varc = self.font.get("VARC")
+        return varc.table if varc is not None else None
+
+    @cached_property
+    def charStrings(self):
+        return (
+            list(self.font["CFF2"].cff.values())[0].CharStrings
+            if "CFF2" in self.font
+            else None
+        )
 
     async def aclose(self):
         self.font.close()
+        self.variationGlyphSets.clear()
+        self.__dict__.pop("glyphSet", None)
+        self._mappedFile.close()
+        self._file.close()
 
     async def getGlyphMap(self) -> dict[str, list[int]]:
         return self.glyphMap
 
     async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
-        if glyphName not in self.glyphSet:
+        if glyphName not in self.glyphMap:
             return None
-        defaultLayerName = "default"
-        glyph = VariableGlyph(name=glyphName)
-        staticGlyph = buildStaticGlyph(self.glyphSet, glyphName)
-        layers = {defaultLayerName: Layer(glyph=staticGlyph)}
-        defaultLocation = {axis.name: 0.0 for axis in self.axes.axes}
-        sources = [
-            GlyphSource(
-                location=defaultLocation,
-                name=defaultLayerName,
-                layerName=defaultLayerName,
-            )
+        return self._buildGlyphs([glyphName])[glyphName]
+
+    async def getGlyphs(
+        self, glyphNames: Iterable[str]
+    ) -> dict[str, VariableGlyph | None]:
+        """Return a dict with the glyphs for `glyphNames`. Glyphs that don't
+        exist are None. This is faster than calling `getGlyph()` for each
+        glyph, as the glyphs are extracted one variation location at a time.
+        """
+        glyphNames = list(glyphNames)
+        glyphs: dict[str, VariableGlyph | None] = dict.fromkeys(glyphNames)
+        existingGlyphNames = [
+            glyphName for glyphName in glyphNames if glyphName in self.glyphMap
         ]
+        glyphs.update(self._buildGlyphs(existingGlyphNames))
+        return glyphs
 
-        for sparseLoc in self._getGlyphVariationLocations(glyphName):
-            fullLoc = defaultLocation | sparseLoc
+    def _buildGlyphs(self, glyphNames: list[str]) -> dict[str, VariableGlyph]:
+        # Group the glyphs by variation location, so each location's glyph set
+        # is used for all glyphs that need it in one go
+        defaultLocation = {axis.name: 0.0 for axis in self.axes.axes}
+        locationsPerGlyph = {
+            glyphName: self._getGlyphVariationLocations(glyphName)
+            for glyphName in glyphNames
+        }
+        glyphNamesPerLocation = defaultdict(list)
+        for glyphName, sparseLocations in locationsPerGlyph.items():
+            for sparseLoc in sparseLocations:
+                glyphNamesPerLocation[locationToTuple(sparseLoc)].append(glyphName)
+
+        staticGlyphs: dict[tuple[str, str], StaticGlyph] = {}
+        for locTuple, locGlyphNames in glyphNamesPerLocation.items():
+            sparseLoc = dict(locTuple)
             locStr = locationToString(sparseLoc)
             varGlyphSet = self.variationGlyphSets.get(locStr)
             if varGlyphSet is None:
-                varGlyphSet = self.font.getGlyphSet(location=fullLoc, normalized=True)
+                varGlyphSet = self.font.getGlyphSet(
+                    location=defaultLocation | sparseLoc, normalized=True
+                )
                 self.variationGlyphSets[locStr] = varGlyphSet
-            varGlyph = buildStaticGlyph(varGlyphSet, glyphName)
-            layers[locStr] = Layer(glyph=varGlyph)
-            sources.append(GlyphSource(location=fullLoc, name=locStr, layerName=locStr))
-        if self.charStrings is not None:
-            checkAndFixCFF2Compatibility(glyphName, layers)
-        glyph.layers = layers
-        glyph.sources = sources
-        return glyph
+            for glyphName in locGlyphNames:
+                staticGlyphs[glyphName, locStr] = buildStaticGlyph(
+                    varGlyphSet, glyphName
+                )
+
+        glyphs = {}
+        defaultLayerName = "default"
+        for glyphName, sparseLocations in locationsPerGlyph.items():
+            glyph = VariableGlyph(name=glyphName)
+            staticGlyph = buildStaticGlyph(self.glyphSet, glyphName)
+            layers = {defaultLayerName: Layer(glyph=staticGlyph)}
+            sources = [
+                GlyphSource(
+                    location=defaultLocation,
+                    name=defaultLayerName,
+                    layerName=defaultLayerName,
+                )
+            ]
+            for sparseLoc in sparseLocations:
+                fullLoc = defaultLocation | sparseLoc
+                locStr = locationToString(sparseLoc)
+                layers[locStr] = Layer(glyph=staticGlyphs[glyphName, locStr])
+                sources.append(
+                    GlyphSource(location=fullLoc, name=locStr, layerName=locStr)
+                )
+            if self.charStrings is not None:
+                checkAndFixCFF2Compatibility(glyphName, layers)
+            glyph.layers = layers
+            glyph.sources = sources
+            glyphs[glyphName] = glyph
+        return glyphs
 
     def _getGlyphVariationLocations(self, glyphName: str) -> list[dict[str, float]]:
         # TODO/FIXME: This misses variations that only exist in HVAR/VVAR
@@ -1,8 +1,15 @@
 import logging
 import re
+from typing import Any
+from xml.etree import ElementTree
 
+from fontTools.misc import plistlib
+from fontTools.misc.transform import DecomposedTransform
 from fontTools.ufoLib.filenames import userNameToFileName
 
+from ..core.classes import Component
+from ..core.path import ContourInfo, PackedPath, PointType
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,3 +33,239 @@ def extractGlyphNameAndCodePoints(
             )
     codePoints = [int(u, 16) for u in _unicodePat.findall(data)]
     return glyphName, codePoints
+
+
+_transformationInfo = [
+    ("xScale", 1),
+    ("xyScale", 0),
+    ("yxScale", 0),
+    ("yScale", 1),
+    ("xOffset", 0),
+    ("yOffset", 0),
+]
+
+_onCurveSegmentTypes = {"move", "line", "curve", "qcurve"}
+
+
+class _UnsupportedGLIF(Exception):
+    pass
+
+
+def readGlyphFast(
+    data: bytes, glyphObject: Any
+) -> tuple[PackedPath, list[Component]] | None:
+    """Parse GLIF data, without going through glifLib and a point pen. The
+    glyph attributes (width, height, unicodes, anchors, guidelines, image,
+    note, lib) are set on `glyphObject`, the same way glifLib does it, and
+    a (path, components) tuple is returned.
+
+    Only the common subset of GLIF format 2 is supported. If the data contains
+    anything else, including invalid data, None is returned, and
+    `glyphObject` is left untouched. The caller should then fall back to
+    glifLib, which will also report any errors properly.
+    """
+    try:
+        return _readGlyphFast(data, glyphObject)
+    except (_UnsupportedGLIF, ElementTree.ParseError, KeyError, ValueError):
+        return None
+
+
+def _readGlyphFast(data: bytes, glyphObject: Any) -> tuple[PackedPath, list[Component]]:
+    root = ElementTree.fromstring(data)
+    if (
+        root.tag != "glyph"
+        or root.get("format") != "2"
+        or root.get("formatMinor", "0") != "0"
+    ):
+        raise _UnsupportedGLIF()
+
+    attributes: dict[str, Any] = {}
+    unicodes: list[int] = []
+    anchors = []
+    guidelines = []
+    path = PackedPath()
+    components: list[Component] = []
+
+    for element in root:
+        tag = element.tag
+        if tag == "outline":
+            path, components = _readOutline(element)
+        elif tag == "advance":
+            attributes["width"] = _number(element.get("width", "0"))
+            attributes["height"] = _number(element.get("height", "0"))
+        elif tag == "unicode":
+            codePoint = int(element.attrib["hex"], 16)
+            if codePoint not in unicodes:
+                unicodes.append(codePoint)
+        elif tag == "anchor":
+            anchors.append(_numberAttributes(element.attrib, ("x", "y")))
+        elif tag == "guideline":
+            guidelines.append(_numberAttributes(element.attrib, ("x", "y", "angle")))
+        elif tag == "image":
+            image: dict[str, Any] = dict(element.attrib)
+            for attr, default in _transformationInfo:
+                value = image.get(attr)
+                image[attr] = default if value is None else _number(value)
+            attributes["image"] = image
+        elif tag == "note":
+            if element.text is None:
+                raise _UnsupportedGLIF()
+            lines = (line.strip() for line in element.text.split("\n"))
+            attributes["note"] = "\n".join(line for line in lines if line)
+        elif tag == "lib":
+            if len(element) != 1:
+                raise _UnsupportedGLIF()
+            attributes["lib"] = _plistFromElement(element[0])
+        else:
+            raise _UnsupportedGLIF()
+
+    if unicodes:
+        attributes["unicodes"] = unicodes
+    if anchors:
+        attributes["anchors"] = anchors
+    if guidelines:
+        attributes["guidelines"] = guidelines
+
+    for attrName, value in attributes.items():
+        setattr(glyphObject, attrName, value)
+
+    return path, components
+
+
+def _readOutline(outline) -> tuple[PackedPath, list[Component]]:
+    coordinates: list[float] = []
+    pointTypes: list[PointType] = []
+    pointAttributes: list[dict | None] = []
+    contourInfo: list[ContourInfo] = []
+    components: list[Component] = []
+
+    for element in outline:
+        if element.tag == "contour":
+            if not len(element):
+                # PackedPathPointPen skips empty contours, too
+                continue
+            _readContour(element, coordinates, pointTypes, pointAttributes)
+            contourInfo.append(
+                ContourInfo(
+                    endPoint=len(coordinates) // 2 - 1,
+                    isClosed=element[0].get("type") != "move",
+                )
+            )
+        elif element.tag == "component":
+            transformation = tuple(
+                _number(element.attrib[attr]) if attr in element.attrib else default
+                for attr, default in _transformationInfo
+            )
+            components.append(
+                Component(
+                    name=element.attrib["base"],
+                    transformation=DecomposedTransform.fromTransform(transformation),
+                )
+            )
+        else:
+            raise _UnsupportedGLIF()
+
+    return (
+        PackedPath(coordinates, pointTypes, contourInfo, pointAttributes),
+        components,
+    )
+
+
+_pointTypes = {
+    (segmentType, smooth): (
+        PointType.OFF_CURVE_CUBIC
+        if segmentType in {None, "offcurve"}
+        else PointType.ON_CURVE_SMOOTH if smooth == "yes" else PointType.ON_CURVE
+    )
+    for segmentType in [None, "offcurve", *_onCurveSegmentTypes]
+    for smooth in [None, "yes", "no"]
+}
+
+
+def _readContour(contour, coordinates, pointTypes, pointAttributes) -> None:
+    # This mirrors what PackedPathPointPen does with the points of a contour
+    contourPointTypes = []
+    contourCoordinates = []
+    hasQCurve = False
+    for point in contour:
+        if point.tag != "point":
+            raise _UnsupportedGLIF()
+        attrib = point.attrib
+        contourCoordinates.append(attrib["x"])
+        contourCoordinates.append(attrib["y"])
+        segmentType = attrib.get("type")
+        contourPointTypes.append(_pointTypes[segmentType, attrib.get("smooth")])
+        if segmentType == "qcurve":
+            hasQCurve = True
+        if "name" in attrib or "identifier" in attrib:
+            pointAttributes.append(
+                {key: attrib[key] for key in ("name", "identifier") if key in attrib}
+            )
+        else:
+            pointAttributes.append(None)
+
+    if all(pointType == PointType.OFF_CURVE_CUBIC for pointType in contourPointTypes):
+        # A TrueType "quad blob": a closed contour without on-curve points
+        contourPointTypes = [PointType.OFF_CURVE_QUAD] * len(contourPointTypes)
+    elif hasQCurve:
+        isClosed = contour[0].get("type") != "move"
+        numPoints = len(contourPointTypes)
+        for i, point in enumerate(contour):
+            if point.get("type") == "qcurve":
+                stopIndex = i - numPoints if isClosed else -1
+                for j in range(i - 1, stopIndex, -1):
+                    if contourPointTypes[j] != PointType.OFF_CURVE_CUBIC:
+                        break
+                    contourPointTypes[j] = PointType.OFF_CURVE_QUAD
+
+    try:
+        # Fast path: most coordinates are integers
+        numbers: list[float] = list(map(int, contourCoordinates))
+    except ValueError:
+        numbers = list(map(_number, contourCoordinates))
+    coordinates.extend(numbers)
+    pointTypes.extend(contourPointTypes)
+
+
+def _plistFromElement(element) -> Any:
+    # A faster version of plistlib.fromtree() for the common value types
+    tag = element.tag
+    if tag == "dict":
+        if len(element) % 2:
+            raise _UnsupportedGLIF()
+        children = iter(element)
+        result = {}
+        for keyElement, valueElement in zip(children, children):
+            if keyElement.tag != "key":
+                raise _UnsupportedGLIF()
+            result[keyElement.text or ""] = _plistFromElement(valueElement)
+        return result
+    elif tag == "array":
+        return [_plistFromElement(child) for child in element]
+    elif tag == "string":
+        return element.text or ""
+    elif tag == "integer":
+        return int(element.text)
+    elif tag == "real":
+        return float(element.text)
+    elif tag == "true":
+        return True
+    elif tag == "false":
+        return False
+    return plistlib.fromtree(element)
+
+
+def _numberAttributes(attrib, attrNames) -> dict:
+    result = dict(attrib)
+    for attrName in attrNames:
+        if attrName in result:
+            result[attrName] = _number(result[attrName])
+    return result
+
+
+def _number(s: str) -> int | float:
+    # Like glifLib: "1" becomes an int, "1.0" becomes a float
+    try:
+        return int(s)
+    except ValueError:
+        return float(s)
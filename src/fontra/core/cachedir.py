@@ -0,0 +1,21 @@
+import hashlib
+import os
+import pathlib
+
+
+def getFontraCacheDir() -> pathlib.Path:
+    """Return the directory for Fontra's persistent caches, following the XDG
+    base directory convention: $XDG_CACHE_HOME/fontra, defaulting to
+    ~/.cache/fontra.
+    """
+    cacheHome = os.environ.get("XDG_CACHE_HOME")
+    cacheDir = pathlib.Path(cacheHome) if cacheHome else pathlib.Path.home() / ".cache"
+    return cacheDir / "fontra"
+
+
+def getProjectCacheKey(projectPath: os.PathLike | str, *extraKeys: str) -> str:
+    """Return a string that identifies a project (and optionally a part of it,
+    given as `extraKeys`) in a cache, based on its absolute path.
+    """
+    keyParts = [os.path.abspath(os.fspath(projectPath)), *extraKeys]
+    return hashlib.sha256("\0".join(keyParts).encode("utf-8")).hexdigest()[:32]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from fontTools.varLib.models import (
     VariationModel,
@@ -11,6 +14,7 @@ from fontTools.varLib.models import (
 )
 
 from .classes import DiscreteFontAxis, FontAxis, GlyphAxis
+from .lrucache import LRUCache
 from .varutils import locationToTuple, makeSparseNormalizedLocation
 
 CachedModelInfoType = tuple[VariationModel, tuple, list | None]
@@ -58,6 +62,7 @@ class DiscreteVariationModel:
                 self._locations[key].append(normalizedLocation)
 
         self._models: dict[LocationTupleType, CachedModelInfoType] = {}
+        self._discreteLocationFinder: NearestLocationFinder | None = None
 
     def getDeltas(self, sourceValues) -> DiscreteDeltas:
         sources = defaultdict(list)
@@ -84,7 +89,7 @@ class DiscreteVariationModel:
                 usedKey = nearestKey
             else:
                 try:
-                    model = VariationModel(locations)
+                    model = getCachedVariationModel(locations)
                 except VariationModelError as exc:
                     if not self.softFail:
                         raise
@@ -100,9 +105,12 @@ class DiscreteVariationModel:
         return cachedModelInfo
 
     def _findNearestDiscreteLocationKey(self, key):
+        if self._discreteLocationFinder is None:
+            self._discreteLocationFinder = NearestLocationFinder(
+                list(self._locationsKeyToDiscreteLocation.values())
+            )
         locationKeys = list(self._locationsKeyToDiscreteLocation.keys())
-        locations = list(self._locationsKeyToDiscreteLocation.values())
-        nearestIndex = findNearestLocationIndex(dict(key), locations)
+        nearestIndex = self._discreteLocationFinder.findNearestIndex(dict(key))
         return locationKeys[nearestIndex]
 
     def checkCompatibilityFromDeltas(self, deltas):
@@ -115,16 +123,35 @@ class DiscreteVariationModel:
                 collectedErrors.extend(errors)
         return collectedErrors
 
-    def interpolateFromDeltas(self, location, deltas) -> InterpolationResult:
+    def interpolateFromDeltas(
+        self, location, deltas, scalarsCache: dict | None = None
+    ) -> InterpolationResult:
+        # If `scalarsCache` is given, the model scalars for the normalized
+        # location are looked up there first, and stored there otherwise. The
+        # cache is keyed by the model locations, so it can be shared between
+        # different models.
         discreteLocation, continuousLocation = self.splitDiscreteLocation(location)
         key = locationToTuple(discreteLocation)
 
         discreteDeltas, model, errors = self._getDiscreteDeltasAndModel(key, deltas)
 
-        instance = model.interpolateFromDeltas(
-            normalizeLocation(continuousLocation, self._continuousAxesTriples),
-            discreteDeltas,
+        normalizedLocation = normalizeLocation(
+            continuousLocation, self._continuousAxesTriples
         )
+
+        if scalarsCache is None or isinstance(model, BrokenVariationModel):
+            instance = model.interpolateFromDeltas(normalizedLocation, discreteDeltas)
+        else:
+            scalarsKey = (
+                getModelLocationsKey(model),
+                locationToTuple(makeSparseNormalizedLocation(normalizedLocation)),
+            )
+            scalars = scalarsCache.get(scalarsKey)
+            if scalars is None:
+                scalars = model.getScalars(normalizedLocation)
+                scalarsCache[scalarsKey] = scalars
+            instance = model.interpolateFromDeltasAndScalars(discreteDeltas, scalars)
+
         return InterpolationResult(instance=instance, errors=errors)
 
     def _getDiscreteDeltasAndModel(self, key, deltas):
@@ -133,7 +160,7 @@ class DiscreteVariationModel:
         if key not in deltas.deltas:
             sourceValues = deltas.sources[usedKey]
             if None in sourceValues:
-                model, sourceValues = model.getSubModel(sourceValues)
+                model, sourceValues = getCachedSubModel(model, sourceValues)
 
             try:
                 deltas.deltas[key] = model.getDeltas(sourceValues)
@@ -173,20 +200,136 @@ class DiscreteVariationModel:
 class BrokenVariationModel:
     def __init__(self, locations):
         self.locations = locations
+        self._nearestLocationFinder = NearestLocationFinder(locations)
 
     def getDeltas(self, sourceValues):
         return sourceValues
 
     def interpolateFromDeltas(self, location, deltas):
-        index = findNearestLocationIndex(location, self.locations)
+        index = self._nearestLocationFinder.findNearestIndex(location)
         return deltas[index]
 
 
+# Many glyphs in a font share the exact same source locations, so
+# VariationModel objects are cached process-wide, keyed by their locations.
+# The locations are ordered, as the order determines the meaning of the
+# source values and deltas.
+
+VARIATION_MODEL_CACHE_SIZE = 2000
+
+_variationModelCache: LRUCache = LRUCache(VARIATION_MODEL_CACHE_SIZE)
+_variationModelCacheLock = threading.Lock()
+_variationModelCacheHits = 0
+_variationModelCacheMisses = 0
+
+
+def getCachedVariationModel(locations: list[dict[str, float]]) -> VariationModel:
+    """Return a VariationModel for `locations`, which must be normalized.
+    Models are shared, and must not be modified. Raises VariationModelError
+    if the locations are invalid.
+    """
+    global _variationModelCacheHits, _variationModelCacheMisses
+
+    key = tuple(locationToTuple(location) for location in locations)
+    with _variationModelCacheLock:
+        cached = _variationModelCache.get(key)
+        if cached is not None:
+            _variationModelCacheHits += 1
+        else:
+            _variationModelCacheMisses += 1
+
+    if cached is None:
+        try:
+            cached = VariationModel(locations)
+        except VariationModelError as exc:
+            # Cache the error, too: it will recur for the same locations
+            cached = str(exc)
+        with _variationModelCacheLock:
+            _variationModelCache[key] = cached
+
+    if isinstance(cached, str):
+        raise VariationModelError(cached)
+    return cached
+
+
+def getCachedSubModel(
+    model: VariationModel, sourceValues: list
+) -> tuple[VariationModel, list]:
+    # Like VariationModel.getSubModel(), but the sub-model is shared with
+    # all models that have the same locations for the non-None values
+    if None not in sourceValues:
+        return model, sourceValues
+    subLocations = [
+        location
+        for location, value in zip(model.origLocations, sourceValues, strict=True)
+        if value is not None
+    ]
+    subModel = getCachedVariationModel(subLocations)
+    return subModel, [value for value in sourceValues if value is not None]
+
+
+def clearVariationModelCache() -> None:
+    global _variationModelCacheHits, _variationModelCacheMisses
+
+    with _variationModelCacheLock:
+        _variationModelCache.clear()
+        _variationModelCacheHits = 0
+        _variationModelCacheMisses = 0
+
+
+def getVariationModelCacheStats() -> dict[str, Any]:
+    """Return statistics about the process-wide VariationModel cache. The
+    memory size is an estimate, based on the containers the models hold.
+    """
+    with _variationModelCacheLock:
+        models = [m for m in _variationModelCache.values() if not isinstance(m, str)]
+        hits = _variationModelCacheHits
+        misses = _variationModelCacheMisses
+        numEntries = len(_variationModelCache)
+
+    lookups = hits + misses
+    return dict(
+        numEntries=numEntries,
+        numModels=len(models),
+        maxSize=VARIATION_MODEL_CACHE_SIZE,
+        hits=hits,
+        misses=misses,
+        hitRate=hits / lookups if lookups else 0.0,
+        estimatedMemorySize=sum(_estimateModelSize(model) for model in models),
+    )
+
+
+def _estimateModelSize(model: VariationModel) -> int:
+    size = sys.getsizeof(model) + sys.getsizeof(model.__dict__)
+    for attrName in ["origLocations", "locations", "supports", "deltaWeights"]:
+        items = getattr(model, attrName, None)
+        if items is None:
+            continue
+        size += sys.getsizeof(items)
+        for item in items:
+            size += sys.getsizeof(item)
+    for attrName in ["mapping", "reverseMapping"]:
+        size += sys.getsizeof(getattr(model, attrName, ()))
+    return size
+
+
+_modelLocationsKeys: WeakKeyDictionary[VariationModel, tuple] = WeakKeyDictionary()
+
+
+def getModelLocationsKey(model: VariationModel) -> tuple:
+    # Models with the same (ordered) locations have the same supports, and
+    # therefore produce the same scalars for a given location
+    key = _modelLocationsKeys.get(model)
+    if key is None:
+        key = tuple(locationToTuple(location) for location in model.locations)
+        _modelLocationsKeys[model] = key
+    return key
+
+
 def findNearestValue(value, values):
     if not values:
         return value
-    values = sorted(values, key=lambda v: abs(v - value))
-    return values[0]
+    return min(values, key=lambda v: abs(v - value))
 
 
 def findNearestLocationIndex(targetLocation, locations):
@@ -209,6 +352,58 @@ def findNearestLocationIndex(targetLocation, locations):
     return closestIndex
 
 
+NEAREST_LOCATION_CACHE_SIZE = 256
+
+
+class NearestLocationFinder:
+    """Find the nearest location in a fixed list of locations, like
+    `findNearestLocationIndex()`. The locations are stored once as a dense
+    matrix, and the results are cached per target location.
+    """
+
+    def __init__(self, locations: list[dict[str, float]]):
+        self.axisNames = sorted({axisName for loc in locations for axisName in loc})
+        self._axisIndices = {
+            axisName: index for index, axisName in enumerate(self.axisNames)
+        }
+        self.matrix = [
+            tuple(loc.get(axisName, 0) for axisName in self.axisNames)
+            for loc in locations
+        ]
+        self._cache: LRUCache = LRUCache(NEAREST_LOCATION_CACHE_SIZE)
+
+    def findNearestIndex(self, targetLocation: dict[str, float]) -> int | None:
+        # As with `findNearestLocationIndex()`, `targetLocation` must *not*
+        # be sparse: axes that are not in `targetLocation` are ignored.
+        key = locationToTuple(targetLocation)
+        if key in self._cache:
+            return self._cache[key]
+
+        # Axes that don't occur in any of the locations add the same amount
+        # to all distances, so they can be skipped
+        axisIndices = []
+        targetValues = []
+        for axisName, value in targetLocation.items():
+            axisIndex = self._axisIndices.get(axisName)
+            if axisIndex is not None:
+                axisIndices.append(axisIndex)
+                targetValues.append(value)
+
+        nearestIndex = None
+        if self.matrix:
+            distances = [
+                sum(
+                    (row[axisIndex] - value) ** 2
+                    for axisIndex, value in zip(axisIndices, targetValues)
+                )
+                for row in self.matrix
+            ]
+            nearestIndex = min(range(len(distances)), key=distances.__getitem__)
+
+        self._cache[key] = nearestIndex
+        return nearestIndex
+
+
 def formatDiscreteLocationKey(key):
     return ",".join(f"{axisName}={value}" for axisName, value in key)
 
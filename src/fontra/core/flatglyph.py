@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Sequence
+
+from fontTools.misc.transform import DecomposedTransform
+from fontTools.misc.vector import Vector
+
+from .classes import Component, StaticGlyph
+from .path import PackedPath, copyContourInfo
+
+transformFieldNames = tuple(f.name for f in fields(DecomposedTransform))
+
+metricsFieldNames = ("xAdvance", "yAdvance", "verticalOrigin")
+
+
+@dataclass(frozen=True)
+class FlatGlyphTemplate:
+    """The structure of a StaticGlyph, with all its interpolatable numbers
+    taken out. Combined with a flat sequence of numbers, as produced by
+    `flattenGlyph()`, it can rebuild a StaticGlyph. Two glyphs with equal
+    templates are interpolation compatible.
+    """
+
+    key: tuple
+    glyph: StaticGlyph = field(compare=False)
+    componentLocationKeys: tuple[tuple[str, ...], ...] = field(compare=False)
+
+    def unflatten(self, values: Sequence[float]) -> StaticGlyph:
+        glyph = self.glyph
+        path = glyph.path
+        assert isinstance(path, PackedPath)
+
+        index = len(path.coordinates)
+        newPath = PackedPath(
+            list(values[:index]),
+            list(path.pointTypes),
+            copyContourInfo(path.contourInfo),
+            deepcopy(path.pointAttributes),
+        )
+
+        metrics: dict[str, Any] = {}
+        for fieldName in metricsFieldNames:
+            if getattr(glyph, fieldName) is not None:
+                metrics[fieldName] = values[index]
+                index += 1
+
+        components = []
+        for compo, locationKeys in zip(
+            glyph.components, self.componentLocationKeys, strict=True
+        ):
+            numTransformValues = len(transformFieldNames)
+            transformation = DecomposedTransform(
+                *values[index : index + numTransformValues]
+            )
+            index += numTransformValues
+            location = dict(
+                zip(locationKeys, values[index : index + len(locationKeys)])
+            )
+            index += len(locationKeys)
+            # Component.customData is not interpolated, and is dropped, just as
+            # with MathWrapper-based interpolation
+            components.append(
+                Component(
+                    name=compo.name, transformation=transformation, location=location
+                )
+            )
+
+        anchors = []
+        for anchor in glyph.anchors:
+            anchors.append(replace(anchor, x=values[index], y=values[index + 1]))
+            index += 2
+
+        guidelines = []
+        for guideline in glyph.guidelines:
+            guidelines.append(
+                replace(
+                    guideline,
+                    x=values[index],
+                    y=values[index + 1],
+                    angle=values[index + 2],
+                )
+            )
+            index += 3
+
+        assert index == len(values)
+
+        return replace(
+            glyph,
+            path=newPath,
+            components=components,
+            anchors=anchors,
+            guidelines=guidelines,
+            **metrics,
+        )
+
+
+def flattenGlyph(glyph: StaticGlyph) -> tuple[FlatGlyphTemplate, Vector] | None:
+    """Return a (template, values) tuple, where `values` is a Vector containing
+    all interpolatable numbers of `glyph`. Return None if the glyph contains
+    data that can't be flattened.
+    """
+    path = glyph.path
+    if not isinstance(path, PackedPath) or glyph.backgroundImage is not None:
+        return None
+
+    values: list[float] = list(path.coordinates)
+
+    metricsKey = []
+    for fieldName in metricsFieldNames:
+        value = getattr(glyph, fieldName)
+        metricsKey.append(value is not None)
+        if value is not None:
+            values.append(value)
+
+    componentsKey = []
+    componentLocationKeys = []
+    for compo in glyph.components:
+        transformation = compo.transformation
+        values.extend(
+            getattr(transformation, fieldName) for fieldName in transformFieldNames
+        )
+        locationKeys = tuple(sorted(compo.location))
+        values.extend(compo.location[axisName] for axisName in locationKeys)
+        componentsKey.append((compo.name, locationKeys))
+        componentLocationKeys.append(locationKeys)
+
+    for anchor in glyph.anchors:
+        values.append(anchor.x)
+        values.append(anchor.y)
+
+    for guideline in glyph.guidelines:
+        values.append(guideline.x)
+        values.append(guideline.y)
+        values.append(guideline.angle)
+
+    if any(value is None for value in values):
+        return None
+
+    key = (
+        tuple((info.endPoint, info.isClosed) for info in path.contourInfo),
+        len(path.coordinates),
+        tuple(metricsKey),
+        tuple(componentsKey),
+        tuple(anchor.name for anchor in glyph.anchors),
+        tuple(guideline.name for guideline in glyph.guidelines),
+    )
+
+    template = FlatGlyphTemplate(
+        key=key, glyph=glyph, componentLocationKeys=tuple(componentLocationKeys)
+    )
+    return template, Vector(values)
+
+
+def flattenGlyphs(
+    glyphs: Sequence[StaticGlyph],
+) -> tuple[FlatGlyphTemplate, list[Vector]] | None:
+    """Flatten a list of glyphs, which must all have the same structure. Return
+    a (template, vectors) tuple, or None if the glyphs can't be flattened, or
+    aren't compatible.
+    """
+    if not glyphs:
+        return None
+
+    template = None
+    vectors = []
+
+    for glyph in glyphs:
+        flattened = flattenGlyph(glyph)
+        if flattened is None:
+            return None
+        glyphTemplate, vector = flattened
+        if template is None:
+            template = glyphTemplate
+        elif glyphTemplate != template:
+            return None
+        vectors.append(vector)
+
+    assert template is not None
+    return template, vectors
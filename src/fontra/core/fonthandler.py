@@ -27,6 +27,7 @@ from .protocols import (
     ReadableFontBackend,
     WatchableFontBackend,
     WritableFontBackend,
+    WriteKerningValues,
 )
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,9 @@ class FontHandler:
         self.clientData = defaultdict(dict)
         self.localData = LRUCache()
         self._dataScheduledForWriting = {}
+        # Kerning pairs changed since the last kerning write, per kerning type,
+        # or None if the next kerning write must write everything
+        self._kerningPairsToWrite: dict[str, set] | None = {}
         self.glyphMap = {}
 
     @cached_property
@@ -406,6 +410,7 @@ class FontHandler:
             rootObject,
             sourceConnection,
             not isExternalChange and not self.readOnly,
+            collectKerningPairChanges(change) if "kerning" in rootKeys else None,
         )
 
     def _getLocalDataPattern(self):
@@ -442,7 +447,12 @@ class FontHandler:
         return rootKeys, rootObject
 
     async def _updateLocalData(
-        self, rootKeys, rootObject, sourceConnection, writeToBackEnd
+        self,
+        rootKeys,
+        rootObject,
+        sourceConnection,
+        writeToBackEnd,
+        kerningPairChanges=None,
     ) -> None:
         writeFunc: Callable[
             [], Awaitable[None]
@@ -488,11 +498,44 @@ class FontHandler:
                 if not writeToBackEnd:
                     continue
                 assert self.writableBackend is not None
-                writeFunc = functools.partial(
-                    self._putData, rootKey, deepcopy(self.localData[rootKey])
-                )
+                if rootKey == "kerning" and isinstance(
+                    self.writableBackend, WriteKerningValues
+                ):
+                    writeFunc = self._prepareKerningWrite(
+                        deepcopy(self.localData[rootKey]), kerningPairChanges
+                    )
+                else:
+                    writeFunc = functools.partial(
+                        self._putData, rootKey, deepcopy(self.localData[rootKey])
+                    )
                 await self.scheduleDataWrite(rootKey, writeFunc, sourceConnection)
 
+    def _prepareKerningWrite(
+        self, kerning, kerningPairChanges
+    ) -> Callable[[], Awaitable[None]]:
+        # Accumulate the changed pairs until the write happens, as a pending
+        # write gets replaced by a newer one
+        if kerningPairChanges is None or self._kerningPairsToWrite is None:
+            self._kerningPairsToWrite = None
+        else:
+            for kernType, pairs in kerningPairChanges.items():
+                self._kerningPairsToWrite.setdefault(kernType, set()).update(pairs)
+        return functools.partial(self._putKerning, kerning)
+
+    async def _putKerning(self, kerning) -> None:
+        assert isinstance(self.writableBackend, WriteKerningValues)
+        kerningPairsToWrite = self._kerningPairsToWrite
+        self._kerningPairsToWrite = {}
+        if kerningPairsToWrite is None or not kerningPairsToWrite.keys() <= set(
+            kerning
+        ):
+            await self.writableBackend.putKerning(kerning)
+        else:
+            for kernType, pairs in sorted(kerningPairsToWrite.items()):
+                await self.writableBackend.putKerningValues(
+                    kernType, kerning[kernType], sorted(pairs, key=str)
+                )
+
     async def scheduleDataWrite(
         self, writeKey, writeFunc, connection, reloadPattern=None
     ):
@@ -589,6 +632,40 @@ def scheduleTaskAndLogException(awaitable):
     return task
 
 
+def collectKerningPairChanges(change) -> dict[str, set] | None:
+    """Return the kerning pairs that `change` modifies, as a dict with sets of
+    `(left, right)` tuples per kerning type, if `change` only modifies kerning
+    values (`kerning/<type>/values/<left>/<right>`). A `(left, None)` tuple means
+    that all pairs with `left` as the left side may have changed. Return None if
+    the change modifies anything else in the kerning, such as groups or source
+    identifiers. Changes to other root keys are ignored.
+    """
+    pairs: dict[str, set] = {}
+    for targetPath in _iterateChangeTargetPaths(change):
+        if not targetPath or targetPath[0] != "kerning":
+            continue
+        if len(targetPath) < 4 or targetPath[2] != "values":
+            return None
+        pairs.setdefault(targetPath[1], set()).add(
+            (targetPath[3], targetPath[4] if len(targetPath) >= 5 else None)
+        )
+    return pairs
+
+
+def _iterateChangeTargetPaths(change, prefix=()):
+    # Yield the paths of the items that are modified by `change`
+    path = prefix + tuple(change.get("p", ()))
+    func = change.get("f")
+    if func is not None:
+        args = change.get("a", [])
+        if func in {"=", "d"} and args:
+            yield path + (args[0],)
+        else:
+            yield path
+    for childChange in change.get("c", []):
+        yield from _iterateChangeTargetPaths(childChange, path)
+
+
 def _writeKeyToPattern(writeKey):
     if not isinstance(writeKey, tuple):
         writeKey = (writeKey,)
@@ -1,5 +1,14 @@
+import json
+import logging
+import os
+import pathlib
+import tempfile
 from dataclasses import dataclass, field
-from typing import Sequence
+from typing import Callable, Iterable, Sequence
+
+from .cachedir import getFontraCacheDir, getProjectCacheKey
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(kw_only=True)
@@ -27,3 +36,101 @@ class GlyphDependencies:
             if componentName not in self.usedBy:
                 self.usedBy[componentName] = set()
             self.usedBy[componentName].add(glyphName)
+
+    def getUsedByRecursively(self, glyphName: str) -> set[str]:
+        """Return the names of all glyphs that use `glyphName` as a component,
+        directly or indirectly.
+        """
+        result: set[str] = set()
+        glyphNames = [glyphName]
+        while glyphNames:
+            for parentGlyphName in self.usedBy.get(glyphNames.pop(), ()):
+                if parentGlyphName not in result:
+                    result.add(parentGlyphName)
+                    glyphNames.append(parentGlyphName)
+        return result
+
+
+GLYPH_DEPENDENCIES_CACHE_FORMAT_VERSION = 1
+
+
+def getGlyphDependenciesCachePath(
+    projectPath: os.PathLike | str, *extraKeys: str
+) -> pathlib.Path:
+    projectKey = getProjectCacheKey(projectPath, *extraKeys)
+    return getFontraCacheDir() / "glyphdependencies" / f"{projectKey}.json"
+
+
+def readComponentInfoIncrementally(
+    glyphPaths: dict[str, str],
+    readComponentNames: Callable[[str], Iterable[str]],
+    cachePath: os.PathLike | str | None = None,
+) -> dict[str, set[str]]:
+    """Return a dict mapping glyph names to the names of the components they use,
+    for all glyphs in `glyphPaths`, which maps glyph names to glyph file paths.
+    Glyphs without components are omitted. `readComponentNames(glyphName)` is
+    called to parse a glyph file.
+
+    If `cachePath` is given, the component names are stored in a cache file,
+    together with the modification time and size of each glyph file. The next
+    time, only the glyph files that were added or changed since are parsed.
+    """
+    cachedEntries = _readComponentInfoCache(cachePath) if cachePath else {}
+    entries = {}
+    componentInfo = {}
+    cacheIsDirty = len(cachedEntries) != len(glyphPaths)
+
+    for glyphName, glyphPath in glyphPaths.items():
+        try:
+            st = os.stat(glyphPath)
+        except FileNotFoundError:
+            continue
+        entry = cachedEntries.get(glyphName)
+        if entry is None or entry[:3] != [glyphPath, st.st_mtime_ns, st.st_size]:
+            componentNames = sorted(set(readComponentNames(glyphName)))
+            entry = [glyphPath, st.st_mtime_ns, st.st_size, componentNames]
+            cacheIsDirty = True
+        entries[glyphName] = entry
+        if entry[3]:
+            componentInfo[glyphName] = set(entry[3])
+
+    if cachePath and cacheIsDirty:
+        _writeComponentInfoCache(cachePath, entries)
+
+    return componentInfo
+
+
+def _readComponentInfoCache(cachePath: os.PathLike | str) -> dict[str, list]:
+    try:
+        with open(cachePath, "rb") as f:
+            cacheData = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"can't read glyph dependencies cache {cachePath}: {e!r}")
+        return {}
+    if cacheData.get("formatVersion") != GLYPH_DEPENDENCIES_CACHE_FORMAT_VERSION:
+        return {}
+    return cacheData.get("glyphs", {})
+
+
+def _writeComponentInfoCache(
+    cachePath: os.PathLike | str, entries: dict[str, list]
+) -> None:
+    cachePath = pathlib.Path(cachePath)
+    cacheData = dict(
+        formatVersion=GLYPH_DEPENDENCIES_CACHE_FORMAT_VERSION, glyphs=entries
+    )
+    try:
+        cachePath.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically, so a concurrent reader never sees a partial file
+        fd, tempPath = tempfile.mkstemp(dir=cachePath.parent, suffix=".tmp")
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(cacheData, f, separators=(",", ":"))
+            os.replace(tempPath, cachePath)
+        except BaseException:
+            os.unlink(tempPath)
+            raise
+    except OSError as e:
+        logger.warning(f"can't write glyph dependencies cache {cachePath}: {e!r}")
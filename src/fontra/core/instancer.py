@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from contextlib import contextmanager
+from copy import copy, deepcopy
 from dataclasses import dataclass, replace
 from enum import Enum
 from functools import cached_property, singledispatch
@@ -27,8 +28,10 @@ from .classes import (
     VariableGlyph,
 )
 from .discretevariationmodel import DiscreteDeltas, DiscreteVariationModel
+from .flatglyph import FlatGlyphTemplate, flattenGlyphs
+from .glyphdependencies import GlyphDependencies
 from .lrucache import LRUCache
-from .path import InterpolationError, PackedPath, joinPaths
+from .path import InterpolationError, PackedPath, copyContourInfo, joinPaths
 from .protocols import ReadableFontBackend
 from .varutils import (
     AxisRange,
@@ -54,9 +57,21 @@ class GlyphNotFoundError(Exception):
 class FontInstancer:
     backend: ReadableFontBackend
     failOnInterpolationError: bool = False
+    glyphInstancerCacheSize: int = 2000
+    decomposedPathCacheSize: int = 1000  # 0 disables the cache
 
     def __post_init__(self) -> None:
-        self.glyphInstancers: dict[str, GlyphInstancer] = {}
+        self.glyphInstancers: dict[str, GlyphInstancer] = LRUCache(
+            self.glyphInstancerCacheSize
+        )
+        self._decomposedPathCache: dict[tuple, PackedPath] | None = (
+            LRUCache(self.decomposedPathCacheSize)
+            if self.decomposedPathCacheSize
+            else None
+        )
+        self.decomposedPathCacheHits = 0
+        self.decomposedPathCacheMisses = 0
+        self._glyphDependencies = GlyphDependencies()
         self._fontAxes: list[FontAxis | DiscreteFontAxis] | None = None
         self._fontSources: dict[str, FontSource] | None = None
         self._glyphErrors: set[str] = set()
@@ -144,10 +159,88 @@ class FontInstancer:
             glyphInstancer = GlyphInstancer(glyph, self)
             if addToCache:
                 self.glyphInstancers[glyphName] = glyphInstancer
+                self._glyphDependencies.update(
+                    glyphName, sorted(getComponentNames(glyph))
+                )
         return glyphInstancer
 
+    async def instantiateMany(
+        self,
+        glyphNames: Iterable[str],
+        locations: list[dict[str, float]],
+        *,
+        coordSystem=LocationCoordinateSystem.SOURCE,
+    ) -> dict[str, list[GlyphInstance]]:
+        """Instantiate each glyph in `glyphNames` at each of `locations`.
+        Glyphs that share the same set of source locations share the
+        variation model scalars, so these are only computed once per location.
+        """
+        await self._ensureSetup()
+        if coordSystem == LocationCoordinateSystem.USER:
+            locations = [
+                mapLocationFromUserToSource(location, self.fontAxes)
+                for location in locations
+            ]
+
+        scalarsCache: dict = {}
+        instances = {}
+        for glyphName in glyphNames:
+            glyphInstancer = await self.getGlyphInstancer(glyphName)
+            instances[glyphName] = glyphInstancer.instantiateMany(
+                locations, scalarsCache=scalarsCache
+            )
+        return instances
+
     def dropGlyphInstancerFromCache(self, glyphName):
-        self.glyphInstancers.pop(glyphName, None)
+        glyphInstancer = self.glyphInstancers.pop(glyphName, None)
+        if glyphInstancer is not None:
+            glyphInstancer.clearInstanceCache()
+
+    def invalidateGlyph(self, glyphName: str) -> None:
+        """Drop the cached glyph instancer for `glyphName`, as well as those of
+        all glyphs that use `glyphName` as a component, directly or indirectly.
+        Call this when a glyph has changed in the backend.
+        """
+        glyphNames = {
+            glyphName,
+            *self._glyphDependencies.getUsedByRecursively(glyphName),
+        }
+        for name in glyphNames:
+            self.dropGlyphInstancerFromCache(name)
+            self._glyphDependencies.update(name, ())
+
+        if self._decomposedPathCache:
+            for key in list(self._decomposedPathCache):
+                if key[0] in glyphNames:
+                    del self._decomposedPathCache[key]
+
+    async def _getDecomposedPathCached(
+        self, glyphInstancer: GlyphInstancer, location: dict[str, float]
+    ) -> PackedPath:
+        # Return the decomposed path for the glyph at `location`, without any
+        # transformation applied. The returned path is shared, and must not
+        # be modified.
+        if (
+            self._decomposedPathCache is None
+            or self.variableGlyphAxisRanges is not None
+        ):
+            # When collecting axis ranges, we need to visit all components
+            return await glyphInstancer.instantiate(location).getDecomposedPath()
+
+        # Only instantiate the glyph on a cache miss
+        key = (
+            glyphInstancer.glyph.name,
+            glyphInstancer.getInstanceCacheKey(location),
+            locationToTuple(glyphInstancer.getParentLocation(location)),
+        )
+        path = self._decomposedPathCache.get(key)
+        if path is None:
+            self.decomposedPathCacheMisses += 1
+            path = await glyphInstancer.instantiate(location).getDecomposedPath()
+            self._decomposedPathCache[key] = path
+        else:
+            self.decomposedPathCacheHits += 1
+        return path
 
     def glyphError(self, errorMessage):
         if errorMessage not in self._glyphErrors:
@@ -197,6 +290,14 @@ class FontInstancer:
         )
 
 
+def getComponentNames(glyph: VariableGlyph) -> set[str]:
+    return {
+        compo.name
+        for layer in glyph.layers.values()
+        for compo in layer.glyph.components
+    }
+
+
 def _areComponentLocationsCompatible(
     glyphs: Iterable[StaticGlyph],
 ) -> tuple[bool, list[set[str]]]:
@@ -267,6 +368,15 @@ class GlyphInstancer:
     glyph: VariableGlyph
     fontInstancer: FontInstancer
 
+    def __post_init__(self) -> None:
+        self._instanceCache: LRUCache = LRUCache(50)
+        self._flatGlyphTemplate: FlatGlyphTemplate | None = None
+        self.instanceCacheHits = 0
+        self.instanceCacheMisses = 0
+
+    def clearInstanceCache(self) -> None:
+        self._instanceCache.clear()
+
     async def drawPoints(
         self,
         pen,
@@ -289,6 +399,31 @@ class GlyphInstancer:
 
     def instantiate(
         self, location, *, coordSystem=LocationCoordinateSystem.SOURCE
+    ) -> GlyphInstance:
+        return self._instantiate(location, coordSystem, None)
+
+    def instantiateMany(
+        self,
+        locations: Iterable[dict[str, float]],
+        *,
+        coordSystem=LocationCoordinateSystem.SOURCE,
+        scalarsCache: dict | None = None,
+    ) -> list[GlyphInstance]:
+        """Instantiate the glyph at each of `locations`. The variation model
+        scalars for each location are computed once, and are stored in
+        `scalarsCache`, so they can be reused for other glyphs that have the
+        same source locations. Pass the same `scalarsCache` dict to multiple
+        calls to benefit from that.
+        """
+        if scalarsCache is None:
+            scalarsCache = {}
+        return [
+            self._instantiate(location, coordSystem, scalarsCache)
+            for location in locations
+        ]
+
+    def _instantiate(
+        self, location, coordSystem, scalarsCache: dict | None
     ) -> GlyphInstance:
         if coordSystem == LocationCoordinateSystem.USER:
             location = mapLocationFromUserToSource(location, self.fontAxes)
@@ -301,8 +436,47 @@ class GlyphInstancer:
                 ),
             )
 
+        locationKey = self.getInstanceCacheKey(location)
+        cachedResult = self._instanceCache.get(locationKey)
+        if cachedResult is not None:
+            self.instanceCacheHits += 1
+            instantiatedGlyph, componentTypes = cachedResult
+            # The cached glyph is shared between instances, but callers may
+            # modify the glyph they get, so give each instance its own copy
+            instantiatedGlyph = copyStaticGlyph(instantiatedGlyph)
+        else:
+            self.instanceCacheMisses += 1
+            instantiatedGlyph, componentTypes = self._interpolate(
+                location, scalarsCache
+            )
+            self._instanceCache[locationKey] = (instantiatedGlyph, componentTypes)
+            instantiatedGlyph = copyStaticGlyph(instantiatedGlyph)
+
+        return GlyphInstance(
+            self.glyph.name,
+            instantiatedGlyph,
+            componentTypes,
+            self.getParentLocation(location),
+            self.fontInstancer,
+        )
+
+    def getParentLocation(self, location) -> dict[str, float]:
+        """Return the location that the components of an instance at `location`
+        inherit. `location` must be in source coordinates.
+        """
+        # Only font axis values can be inherited, so filter out glyph axes
+        fontAxisNames = self.fontAxisNames
+        return {
+            name: value for name, value in location.items() if name in fontAxisNames
+        }
+
+    def _interpolate(
+        self, location, scalarsCache: dict | None = None
+    ) -> tuple[StaticGlyph, list[bool]]:
         try:
-            result = self.model.interpolateFromDeltas(location, self.deltas)
+            result = self.model.interpolateFromDeltas(
+                location, self.deltas, scalarsCache
+            )
         except Exception as e:
             if self.fontInstancer.failOnInterpolationError:
                 raise
@@ -320,23 +494,25 @@ class GlyphInstancer:
                 for compo in instantiatedGlyph.components
             ]
         else:
-            assert isinstance(result.instance, MathWrapper)
-            assert isinstance(result.instance.subject, StaticGlyph)
-            instantiatedGlyph = result.instance.subject
+            if self._flatGlyphTemplate is not None:
+                instantiatedGlyph = self._flatGlyphTemplate.unflatten(result.instance)
+            else:
+                assert isinstance(result.instance, MathWrapper)
+                assert isinstance(result.instance.subject, StaticGlyph)
+                instantiatedGlyph = result.instance.subject
             componentTypes = self.componentTypes
 
-        # Only font axis values can be inherited, so filter out glyph axes
-        fontAxisNames = self.fontAxisNames
-        parentLocation = {
-            name: value for name, value in location.items() if name in fontAxisNames
-        }
+        return instantiatedGlyph, componentTypes
 
-        return GlyphInstance(
-            self.glyph.name,
-            instantiatedGlyph,
-            componentTypes,
-            parentLocation,
-            self.fontInstancer,
+    def getInstanceCacheKey(self, location) -> tuple:
+        """Return a hashable key for `location`, which must be in source
+        coordinates. Locations that resolve to the same instance produce
+        the same key.
+        """
+        return locationToTuple(
+            subsetLocationKeep(
+                self.defaultSourceLocation | location, self.combinedAxisNames
+            )
         )
 
     @cached_property
@@ -445,7 +621,14 @@ class GlyphInstancer:
                 for layerGlyph in layerGlyphs
             ]
 
-        sourceValues = [MathWrapper(layerGlyph) for layerGlyph in layerGlyphs]
+        # Compatible glyphs are interpolated as flat vectors of numbers, which
+        # is much faster than recursing into the glyph structure. Incompatible
+        # glyphs go through MathWrapper, which produces meaningful errors.
+        flattened = flattenGlyphs(layerGlyphs)
+        if flattened is not None:
+            self._flatGlyphTemplate, sourceValues = flattened
+        else:
+            sourceValues = [MathWrapper(layerGlyph) for layerGlyph in layerGlyphs]
         return self.model.getDeltas(sourceValues)
 
     def checkCompatibility(self):
@@ -540,11 +723,13 @@ class GlyphInstance:
             )
             return PackedPath()
 
-        instance = instancer.instantiate(self.parentLocation | component.location)
+        path = await self.fontInstancer._getDecomposedPathCached(
+            instancer, self.parentLocation | component.location
+        )
         transform = component.transformation.toTransform()
         if parentTransform is not None:
             transform = parentTransform.transform(transform)
-        return await instance.getDecomposedPath(transform)
+        return path.transformed(transform)
 
     async def shallowDecomposeComponent(self, component: Component) -> StaticGlyph:
         try:
@@ -667,6 +852,44 @@ class FontSourcesInstancer:
         return sourceInstance
 
 
+def copyStaticGlyph(glyph: StaticGlyph) -> StaticGlyph:
+    """Return a deep copy of `glyph`. This is several times faster than
+    `deepcopy()`, which matters for the instance cache of `GlyphInstancer`.
+    """
+    path = glyph.path
+    if isinstance(path, PackedPath):
+        path = PackedPath(
+            coordinates=list(path.coordinates),
+            pointTypes=list(path.pointTypes),
+            contourInfo=copyContourInfo(path.contourInfo),
+            pointAttributes=deepcopy(path.pointAttributes),
+        )
+    else:
+        path = deepcopy(path)
+    return replace(
+        glyph,
+        path=path,
+        components=[
+            replace(
+                compo,
+                transformation=copy(compo.transformation),
+                location=dict(compo.location),
+                customData=deepcopy(compo.customData),
+            )
+            for compo in glyph.components
+        ],
+        anchors=[
+            replace(anchor, customData=deepcopy(anchor.customData))
+            for anchor in glyph.anchors
+        ],
+        guidelines=[
+            replace(guideline, customData=deepcopy(guideline.customData))
+            for guideline in glyph.guidelines
+        ],
+        backgroundImage=deepcopy(glyph.backgroundImage),
+    )
+
+
 def areGuidelinesCompatible(parents):
     if not parents:
         return True  # or False, doesn't matter
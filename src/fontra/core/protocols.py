@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import argparse
 from types import SimpleNamespace
-from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
+from typing import Any, Awaitable, Callable, Iterable, Protocol, runtime_checkable
 
 from aiohttp import web
 
@@ -93,6 +93,14 @@ class WatchableFontBackend(Protocol):
         pass
 
 
+@runtime_checkable
+class ReadGlyphs(Protocol):
+    async def getGlyphs(
+        self, glyphNames: Iterable[str]
+    ) -> dict[str, VariableGlyph | None]:
+        pass
+
+
 @runtime_checkable
 class ReadBackgroundImage(Protocol):
     async def getBackgroundImage(self, imageIdentifier: str) -> ImageData | None:
@@ -110,6 +118,17 @@ class WriteBackgroundImage(Protocol):
     #     pass
 
 
+@runtime_checkable
+class WriteKerningValues(Protocol):
+    async def putKerningValues(
+        self,
+        kernType: str,
+        kerningTable: Kerning,
+        pairs: Iterable[tuple[str, str | None]],
+    ) -> None:
+        pass
+
+
 @runtime_checkable
 class ProjectManagerFactory(Protocol):
     @staticmethod
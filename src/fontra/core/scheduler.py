@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True)
+class Scheduler:
+    """Call scheduled callables after `delay` seconds without new scheduling
+    activity, or when `flush()` is called. A callable is only called once per
+    flush, no matter how often it was scheduled: callables are identified by
+    their `__name__`.
+    """
+
+    delay: float = 0.2
+    scheduledCallables: dict[str, Callable] = field(default_factory=dict)
+    timerHandle: asyncio.TimerHandle | None = None
+
+    def schedule(self, callable: Callable):
+        self.scheduledCallables[callable.__name__] = callable
+        if self.timerHandle is not None:
+            self.timerHandle.cancel()
+        loop = asyncio.get_running_loop()
+        self.timerHandle = loop.call_later(self.delay, self.flush)
+
+    def flush(self):
+        if self.timerHandle is not None:
+            self.timerHandle.cancel()
+            self.timerHandle = None
+        logger.debug("calling scheduled callables")
+        for callable in self.scheduledCallables.values():
+            callable()
+        self.scheduledCallables = {}
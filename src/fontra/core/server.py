@@ -3,6 +3,7 @@ from __future__ import annotations
 import errno
 import json
 import logging
+import pathlib
 import socket
 import sys
 import traceback
@@ -27,6 +28,14 @@ from .protocols import ProjectManager
 from .remote import RemoteObjectConnection, RemoteObjectConnectionException
 from .serverutils import apiFunctions
 from .subprocess import shutdownProcessPool
+from .thumbnails import (
+    DEFAULT_THUMBNAIL_SIZE,
+    MAX_THUMBNAIL_SIZE,
+    FontHandlerReader,
+    GlyphThumbnailRenderer,
+    ThumbnailDiskCache,
+    getDefaultThumbnailCacheDir,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,10 +63,16 @@ class FontraServer:
     versionToken: Optional[str] = None
     cookieMaxAge: int = 7 * 24 * 60 * 60
     allowedFileExtensions: frozenset[str] = frozenset(mimeTypes.keys())
+    thumbnailCacheDir: Optional[pathlib.Path] = None
 
     def setup(self) -> None:
         self.startupTime = datetime.now(timezone.utc).replace(microsecond=0)
         self.httpApp = web.Application()
+        self._thumbnailDiskCache = ThumbnailDiskCache(
+            self.thumbnailCacheDir
+            if self.thumbnailCacheDir is not None
+            else getDefaultThumbnailCacheDir()
+        )
         self.projectManager.setupWebRoutes(self)
         routes = []
         routes.append(web.get("/", self.rootDocumentHandler))
@@ -65,6 +80,7 @@ class FontraServer:
         routes.append(web.get("/projectlist", self.projectListHandler))
         routes.append(web.get("/serverinfo", self.serverInfoHandler))
         routes.append(web.post("/api/{function:.*}", self.webAPIHandler))
+        routes.append(web.get("/thumbnail", self.thumbnailHandler))
         for ep in entry_points(group="fontra.views"):
             routes.append(
                 web.get(
@@ -244,6 +260,58 @@ class FontraServer:
             result = {"returnValue": returnValue}
         return web.Response(text=json.dumps(result), content_type="application/json")
 
+    async def thumbnailHandler(self, request: web.Request) -> web.Response:
+        authToken = await self.projectManager.authorize(request)
+        if not authToken:
+            raise web.HTTPUnauthorized()
+
+        projectIdentifier = request.query.get("project")
+        glyphName = request.query.get("glyph")
+        if not projectIdentifier or not glyphName:
+            raise web.HTTPBadRequest()
+
+        try:
+            location = json.loads(request.query.get("location", "{}"))
+            size = int(request.query.get("size", DEFAULT_THUMBNAIL_SIZE))
+        except ValueError:
+            raise web.HTTPBadRequest()
+        if (
+            not isinstance(location, dict)
+            or not all(isinstance(v, (int, float)) for v in location.values())
+            or not 0 < size <= MAX_THUMBNAIL_SIZE
+        ):
+            raise web.HTTPBadRequest()
+
+        if not await self.projectManager.projectAvailable(projectIdentifier, authToken):
+            raise web.HTTPForbidden()
+
+        subject = await self.projectManager.getRemoteSubject(
+            projectIdentifier, authToken
+        )
+        if subject is None:
+            raise web.HTTPForbidden()
+
+        renderer = GlyphThumbnailRenderer(
+            FontHandlerReader(subject), self._thumbnailDiskCache
+        )
+        # The key is a hash of everything the image depends on, so it can
+        # serve as an ETag, and we can skip the rendering when the client
+        # already has the current image
+        snapshot = await renderer.getSnapshot(glyphName, location, size)
+        if snapshot is None:
+            raise web.HTTPNotFound()
+        etag = f'"{snapshot.key}"'
+        if request.headers.get("If-None-Match") == etag:
+            raise web.HTTPNotModified(headers={"ETag": etag})
+
+        thumbnail = await renderer.getThumbnailFromSnapshot(snapshot)
+
+        response = web.Response(body=thumbnail.data, content_type="image/png")
+        response.headers["ETag"] = etag
+        # The URL does not change when the glyph is edited: always revalidate
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
     async def viewHandler(self, packageName: str, request: web.Request) -> web.Response:
         authToken = await self.projectManager.authorize(request)
         if not authToken:
@@ -1,6 +1,7 @@
 import asyncio
 import atexit
 import concurrent.futures
+import os
 
 _processPool = None
 
@@ -23,4 +24,12 @@ def shutdownProcessPool():
         _processPool = None
 
 
+def _forgetProcessPool():
+    # The pool belongs to the parent process, a forked child must not use it
+    global _processPool
+
+    _processPool = None
+
+
 atexit.register(shutdownProcessPool)
+os.register_at_fork(after_in_child=_forgetProcessPool)
@@ -1,6 +1,7 @@
 import asyncio
 import atexit
 import concurrent.futures
+import os
 
 _threadPool = None
 
@@ -15,6 +16,20 @@ async def runInThread(func, *args):
     return await loop.run_in_executor(_threadPool, func, *args)
 
 
+def mapInThreads(func, items, maxWorkers=8) -> list:
+    """Call `func` for each of `items` concurrently, in a temporary thread pool,
+    and return the results in order. This is meant for synchronous code that
+    does a lot of file system access, for example when opening a font.
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(maxWorkers, len(items))
+    ) as threadPool:
+        return list(threadPool.map(func, items))
+
+
 def shutdownThreadPool():
     global _threadPool
 
@@ -23,4 +38,12 @@ def shutdownThreadPool():
         _threadPool = None
 
 
+def _forgetThreadPool():
+    # The threads of the pool don't exist in a forked child process
+    global _threadPool
+
+    _threadPool = None
+
+
 atexit.register(shutdownThreadPool)
+os.register_at_fork(after_in_child=_forgetThreadPool)
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import pathops
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.pointPen import PointToSegmentPen
+from PIL import Image, ImageChops, ImageDraw
+
+from .cachedir import getFontraCacheDir
+from .classes import Axes, FontSource, VariableGlyph, unstructure
+from .instancer import FontInstancer, FontSourcesInstancer
+from .path import PackedPath
+from .pathops import fontraPathToSkiaPath, skiaPathToFontraPath
+from .protocols import ReadableFontBackend
+from .threading import runInThread
+
+logger = logging.getLogger(__name__)
+
+
+# Bump this when the rendering changes, to invalidate cached thumbnails
+THUMBNAIL_FORMAT_VERSION = 1
+
+DEFAULT_THUMBNAIL_SIZE = 64
+MAX_THUMBNAIL_SIZE = 512
+SUPERSAMPLING = 4
+# Extra space above the ascender and below the descender, relative to the line
+# height, so accents on capitals are not clipped
+VERTICAL_MARGIN = 0.2
+CURVE_STEPS = 8
+# The disk cache is pruned to PRUNE_RATIO times its maximum size when it gets
+# too large, least recently used thumbnails first
+DEFAULT_THUMBNAIL_CACHE_SIZE = 100 * 1024 * 1024
+PRUNE_RATIO = 0.8
+
+
+def getDefaultThumbnailCacheDir() -> pathlib.Path:
+    return getFontraCacheDir() / "thumbnails"
+
+
+@dataclass
+class ThumbnailDiskCache:
+    """Store thumbnails as PNG files in `cacheDir`. When the total size of the
+    files exceeds `maxSize` bytes, the least recently used files are deleted.
+    The modification time of a file is updated when it is read, as the access
+    time isn't reliably maintained by all file systems.
+    """
+
+    cacheDir: pathlib.Path
+    maxSize: int = DEFAULT_THUMBNAIL_CACHE_SIZE
+    _totalSize: int | None = field(init=False, default=None)
+    _lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def _getPath(self, key: str) -> pathlib.Path:
+        return self.cacheDir / key[:2] / f"{key}.png"
+
+    async def get(self, key: str) -> bytes | None:
+        return await runInThread(self._read, key)
+
+    async def put(self, key: str, data: bytes) -> None:
+        await runInThread(self._write, key, data)
+
+    def _read(self, key: str) -> bytes | None:
+        path = self._getPath(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # The file may have been pruned in the meantime
+            pass
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._getPath(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first, so concurrent readers never see a
+        # partially written file
+        fd, tempPath = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tempPath, path)
+        except BaseException:
+            os.unlink(tempPath)
+            raise
+
+        with self._lock:
+            if self._totalSize is None:
+                # The first write scans the existing files, later writes keep
+                # track of the size as they go
+                self._totalSize = sum(size for _, size, _ in self._scanFiles())
+            else:
+                self._totalSize += len(data)
+            if self._totalSize > self.maxSize:
+                self._prune()
+
+    def _scanFiles(self) -> list[tuple[float, int, pathlib.Path]]:
+        files = []
+        for path in self.cacheDir.glob("*/*.png"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        return files
+
+    def _prune(self) -> None:
+        files = sorted(self._scanFiles())
+        totalSize = sum(size for _, size, _ in files)
+        targetSize = PRUNE_RATIO * self.maxSize
+        numDeleted = 0
+        for _, size, path in files:
+            if totalSize <= targetSize:
+                break
+            path.unlink(missing_ok=True)
+            totalSize -= size
+            numDeleted += 1
+        self._totalSize = totalSize
+        logger.info(f"pruned {numDeleted} thumbnails from {self.cacheDir}")
+
+
+@dataclass
+class FontHandlerReader:
+    """Provide the backend read API on top of a FontHandler, so thumbnails
+    reflect edits that haven't been written to the backend yet.
+    """
+
+    fontHandler: Any
+
+    async def getGlyph(self, glyphName: str):
+        return await self.fontHandler.getGlyph(glyphName)
+
+    async def getAxes(self):
+        return await self.fontHandler.getData("axes")
+
+    async def getSources(self):
+        return await self.fontHandler.getData("sources")
+
+    async def getUnitsPerEm(self):
+        return await self.fontHandler.getData("unitsPerEm")
+
+
+@dataclass(kw_only=True)
+class GlyphThumbnail:
+    key: str  # content hash, suitable as an HTTP ETag
+    data: bytes  # PNG data
+
+
+@dataclass(kw_only=True)
+class ThumbnailSnapshot:
+    """A copy of all the data a thumbnail depends on, along with the cache key
+    derived from it. Rendering from the snapshot ensures the image matches the
+    key, even if the glyph is edited in the meantime.
+    """
+
+    glyphName: str
+    location: dict[str, float]
+    size: int
+    glyphs: dict[str, VariableGlyph]
+    axes: Axes
+    sources: dict[str, FontSource]
+    unitsPerEm: int
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        keyData = [
+            THUMBNAIL_FORMAT_VERSION,
+            self.glyphName,
+            sorted(self.location.items()),
+            self.size,
+            self.unitsPerEm,
+            unstructure(self.axes),
+            unstructure(self.sources),
+            [unstructure(self.glyphs[name]) for name in sorted(self.glyphs)],
+        ]
+        self.key = hashlib.sha256(
+            json.dumps(keyData, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    # The backend read API, for FontInstancer
+
+    async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
+        return self.glyphs.get(glyphName)
+
+    async def getAxes(self) -> Axes:
+        return self.axes
+
+    async def getSources(self) -> dict[str, FontSource]:
+        return self.sources
+
+    async def getUnitsPerEm(self) -> int:
+        return self.unitsPerEm
+
+
+class GlyphThumbnailRenderer:
+    """Render glyph thumbnails for a font, as PNG images. Thumbnails are cached
+    on disk, keyed by a hash of all data that contributes to the image: the
+    glyph, its components, the axes and sources, the location and the size.
+
+    `reader` is an object that provides `getGlyph()`, `getAxes()`,
+    `getSources()` and `getUnitsPerEm()`, such as a backend or a
+    `FontHandlerReader`.
+    """
+
+    def __init__(self, reader: Any, diskCache: ThumbnailDiskCache):
+        self.reader = reader
+        self.diskCache = diskCache
+
+    async def getSnapshot(
+        self, glyphName: str, location: dict[str, float], size: int
+    ) -> ThumbnailSnapshot | None:
+        glyphs = await self._collectGlyphs(glyphName)
+        if glyphs is None:
+            return None
+        return ThumbnailSnapshot(
+            glyphName=glyphName,
+            location=dict(location),
+            size=size,
+            glyphs=glyphs,
+            axes=deepcopy(await self.reader.getAxes()),
+            sources=deepcopy(await self.reader.getSources()),
+            unitsPerEm=await self.reader.getUnitsPerEm(),
+        )
+
+    async def getThumbnailKey(
+        self, glyphName: str, location: dict[str, float], size: int
+    ) -> str | None:
+        snapshot = await self.getSnapshot(glyphName, location, size)
+        return snapshot.key if snapshot is not None else None
+
+    async def _collectGlyphs(self, glyphName: str) -> dict[str, Any] | None:
+        # Return copies of the glyph and all the glyphs it uses as components,
+        # directly or indirectly. The reader may return live objects that are
+        # modified by edits.
+        glyphs: dict[str, Any] = {}
+        glyphNames = [glyphName]
+        while glyphNames:
+            name = glyphNames.pop()
+            if name in glyphs:
+                continue
+            glyph = await self.reader.getGlyph(name)
+            if glyph is None:
+                if name == glyphName:
+                    return None
+                continue
+            glyph = deepcopy(glyph)
+            glyphs[name] = glyph
+            glyphNames.extend(
+                compo.name
+                for layer in glyph.layers.values()
+                for compo in layer.glyph.components
+            )
+        return glyphs
+
+    async def getThumbnail(
+        self, glyphName: str, location: dict[str, float], size: int
+    ) -> GlyphThumbnail | None:
+        snapshot = await self.getSnapshot(glyphName, location, size)
+        if snapshot is None:
+            return None
+        return await self.getThumbnailFromSnapshot(snapshot)
+
+    async def getThumbnailFromSnapshot(
+        self, snapshot: ThumbnailSnapshot
+    ) -> GlyphThumbnail:
+        data = await self.diskCache.get(snapshot.key)
+        if data is None:
+            data = await renderThumbnailSnapshot(snapshot)
+            await self.diskCache.put(snapshot.key, data)
+        return GlyphThumbnail(key=snapshot.key, data=data)
+
+
+async def renderThumbnailSnapshot(snapshot: ThumbnailSnapshot) -> bytes:
+    # The snapshot provides the part of the backend API that FontInstancer uses
+    fontInstancer = FontInstancer(cast(ReadableFontBackend, snapshot))
+    glyphInstancer = await fontInstancer.getGlyphInstancer(snapshot.glyphName)
+    instance = glyphInstancer.instantiate(snapshot.location)
+    path = await instance.getDecomposedPath()
+
+    fontSourcesInstancer = await fontInstancer.fontSourcesInstancer
+    ascender, descender = getVerticalMetrics(
+        fontSourcesInstancer, snapshot.location, snapshot.unitsPerEm
+    )
+
+    return await runInThread(
+        renderGlyphThumbnail,
+        path,
+        instance.glyph.xAdvance or 0,
+        ascender,
+        descender,
+        snapshot.size,
+    )
+
+
+def getVerticalMetrics(
+    fontSourcesInstancer: FontSourcesInstancer,
+    location: dict[str, float],
+    unitsPerEm: int,
+) -> tuple[float, float]:
+    fontSource: FontSource | None = fontSourcesInstancer.instantiate(location)
+    lineMetrics = (
+        fontSource.lineMetricsHorizontalLayout if fontSource is not None else {}
+    )
+    ascender = lineMetrics.get("ascender")
+    descender = lineMetrics.get("descender")
+    return (
+        ascender.value if ascender is not None else 0.8 * unitsPerEm,
+        descender.value if descender is not None else -0.2 * unitsPerEm,
+    )
+
+
+def renderGlyphThumbnail(
+    path: PackedPath, xAdvance: float, ascender: float, descender: float, size: int
+) -> bytes:
+    """Render `path` to a square, black on transparent PNG image of `size` by
+    `size` pixels. The vertical range from `descender` to `ascender` fills the
+    image height, with some margin, and the advance width is centered
+    horizontally.
+    """
+    margin = VERTICAL_MARGIN * (ascender - descender)
+    ascender += margin
+    descender -= margin
+    renderSize = size * SUPERSAMPLING
+    height = ascender - descender
+    scale = renderSize / height if height > 0 else 1
+    offsetX = (renderSize - xAdvance * scale) / 2
+
+    polygons = flattenPath(removeOverlaps(path))
+
+    mask = Image.new("1", (renderSize, renderSize), 0)
+    for polygon in polygons:
+        if len(polygon) < 3:
+            continue
+        # Contours are combined with XOR, giving the even-odd fill rule. As
+        # overlaps have been removed, this matches the non-zero fill rule.
+        contourImage = Image.new("1", (renderSize, renderSize), 0)
+        ImageDraw.Draw(contourImage).polygon(
+            [(offsetX + x * scale, (ascender - y) * scale) for x, y in polygon],
+            fill=1,
+        )
+        mask = ImageChops.logical_xor(mask, contourImage)
+
+    alpha = mask.convert("L").resize((size, size), Image.Resampling.BOX)
+    image = Image.new("LA", (size, size), 0)
+    image.putalpha(alpha)
+
+    f = io.BytesIO()
+    image.save(f, format="PNG", optimize=True)
+    return f.getvalue()
+
+
+def removeOverlaps(path: PackedPath) -> PackedPath:
+    skiaPath = fontraPathToSkiaPath(path)
+    try:
+        skiaPath = pathops.simplify(skiaPath, clockwise=skiaPath.clockwise)
+    except pathops.PathOpsError as e:
+        logger.warning(f"can't remove overlaps for thumbnail: {e!r}")
+        return path
+    return skiaPathToFontraPath(skiaPath)
+
+
+def flattenPath(path: PackedPath) -> list[list[tuple[float, float]]]:
+    pen = PolygonPen()
+    path.drawPoints(PointToSegmentPen(pen))
+    return pen.polygons
+
+
+class PolygonPen(BasePen):
+    """A segment pen that collects contours as polygons, approximating curves
+    with straight line segments.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(None)
+        self.polygons: list[list[tuple[float, float]]] = []
+
+    def _moveTo(self, pt):
+        self.polygons.append([pt])
+
+    def _lineTo(self, pt):
+        self.polygons[-1].append(pt)
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        (x0, y0) = self._getCurrentPoint()
+        (x1, y1), (x2, y2), (x3, y3) = pt1, pt2, pt3
+        for i in range(1, CURVE_STEPS + 1):
+            t = i / CURVE_STEPS
+            mt = 1 - t
+            a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+            self.polygons[-1].append(
+                (
+                    a * x0 + b * x1 + c * x2 + d * x3,
+                    a * y0 + b * y1 + c * y2 + d * y3,
+                )
+            )
+
+    def _qCurveToOne(self, pt1, pt2):
+        (x0, y0) = self._getCurrentPoint()
+        (x1, y1), (x2, y2) = pt1, pt2
+        for i in range(1, CURVE_STEPS + 1):
+            t = i / CURVE_STEPS
+            mt = 1 - t
+            a, b, c = mt * mt, 2 * mt * t, t * t
+            self.polygons[-1].append(
+                (a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2)
+            )
+
+    def _closePath(self):
+        pass
+
+    def _endPath(self):
+        pass
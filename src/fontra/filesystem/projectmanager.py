@@ -34,6 +34,12 @@ class FileSystemProjectManagerFactory:
         )
         parser.add_argument("--max-folder-depth", type=int, default=3)
         parser.add_argument("--read-only", action="store_true")
+        parser.add_argument(
+            "--glif-cache",
+            action="store_true",
+            help="Keep a persistent cache of parsed .glif files, to speed up "
+            "reading glyphs from UFO and designspace projects",
+        )
 
     @staticmethod
     def getProjectManager(arguments: SimpleNamespace) -> ProjectManager:
@@ -41,6 +47,7 @@ class FileSystemProjectManagerFactory:
             rootPath=arguments.path,
             maxFolderDepth=arguments.max_folder_depth,
             readOnly=arguments.read_only,
+            glifCache=arguments.glif_cache,
         )
 
 
@@ -60,11 +67,13 @@ class FileSystemProjectManager:
         rootPath: pathlib.Path | None,
         maxFolderDepth: int = 3,
         readOnly: bool = False,
+        glifCache: bool = False,
     ):
         self.rootPath = rootPath
         self.singleFilePath = None
         self.maxFolderDepth = maxFolderDepth
         self.readOnly = readOnly
+        self.glifCache = glifCache
         if self.rootPath is not None and self.rootPath.suffix.lower() in fileExtensions:
             self.singleFilePath = self.rootPath
             self.rootPath = self.rootPath.parent
@@ -98,6 +107,8 @@ class FileSystemProjectManager:
             if projectPath is None:
                 raise FileNotFoundError(projectPath)
             backend = getFileSystemBackend(projectPath)
+            if self.glifCache and hasattr(backend, "enableGlifCache"):
+                backend.enableGlifCache()
 
             async def closeFontHandler():
                 logger.info(f"closing FontHandler for '{projectIdentifier}'")
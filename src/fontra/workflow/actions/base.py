@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import pathlib
 import tempfile
 from contextlib import aclosing, asynccontextmanager
+from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Any, AsyncGenerator, ClassVar
@@ -27,6 +29,7 @@ from ...core.classes import (
     unstructure,
 )
 from ...core.instancer import FontInstancer
+from ...core.lrucache import LRUCache
 from ...core.protocols import ReadableFontBackend
 from . import (
     OutputProcessorProtocol,
@@ -231,6 +234,53 @@ class MemoryCache(BaseFilter):
         return self._glyphCache[glyphName]
 
 
+@dataclass(kw_only=True)
+class SharedGlyphReads(BaseFilter):
+    """Serve concurrent and recent requests for the same glyph from a single
+    read of the input. The workflow inserts this where the input of a step is
+    also read by other branches, so outputs that are processed concurrently
+    share the work of the filters upstream of them. Each request gets its own
+    copy of the glyph, so downstream filters may modify it.
+    """
+
+    recentGlyphsCacheSize: ClassVar[int] = 64
+
+    def __post_init__(self) -> None:
+        self._pendingGlyphs: dict[str, asyncio.Task[VariableGlyph | None]] = {}
+        self._recentGlyphs = LRUCache(maxSize=self.recentGlyphsCacheSize)
+
+    async def getGlyph(self, glyphName: str) -> VariableGlyph | None:
+        if glyphName in self._recentGlyphs:
+            glyph = self._recentGlyphs[glyphName]
+        else:
+            task = self._pendingGlyphs.get(glyphName)
+            if task is None:
+                task = asyncio.create_task(self._readGlyph(glyphName))
+                self._pendingGlyphs[glyphName] = task
+                task.add_done_callback(
+                    lambda task: self._pendingGlyphs.pop(glyphName, None)
+                )
+            # Shield the task, so a cancelled request doesn't cancel the others
+            glyph = await asyncio.shield(task)
+        return deepcopy(glyph)
+
+    async def aclose(self) -> None:
+        # Reads whose requests were all cancelled may still be running, they
+        # must not outlive the input
+        pendingGlyphs = list(self._pendingGlyphs.values())
+        for task in pendingGlyphs:
+            task.cancel()
+        await asyncio.gather(*pendingGlyphs, return_exceptions=True)
+        self._pendingGlyphs.clear()
+        self._recentGlyphs.clear()
+        await super().aclose()
+
+    async def _readGlyph(self, glyphName: str) -> VariableGlyph | None:
+        glyph = await self.validatedInput.getGlyph(glyphName)
+        self._recentGlyphs[glyphName] = glyph
+        return glyph
+
+
 @registerFilterAction("disk-cache")
 @dataclass(kw_only=True)
 class DiskCache(BaseFilter):
@@ -8,7 +8,7 @@ from contextlib import AsyncExitStack
 
 import yaml
 
-from .workflow import Workflow
+from .workflow import Workflow, processOutputs
 
 if hasattr(logging, "getLevelNamesMapping"):
     levelNamesMapping = logging.getLevelNamesMapping()
@@ -86,6 +86,14 @@ async def mainAsync() -> None:
         help="Continue copying if reading or processing a glyph causes an error. "
         "The error will be logged, but the glyph will not be present in the output.",
     )
+    parser.add_argument(
+        "--max-parallel-outputs",
+        type=int,
+        default=4,
+        help="The maximum number of outputs to process at the same time "
+        "(default: 4). Glyphs read by several outputs through the same steps are "
+        "only computed once.",
+    )
     parser.add_argument(
         "--substitute",
         action="append",
@@ -140,13 +148,19 @@ async def mainAsync() -> None:
                 config=config, parentDir=config_path.parent, substitutions=substitutions
             )
             endPoints = await exitStack.enter_async_context(
-                workflow.endPoints(nextInput)
+                workflow.endPoints(
+                    nextInput, maxParallelOutputs=args.max_parallel_outputs
+                )
             )
             outputs.extend(endPoints.outputs)
             nextInput = endPoints.endPoint
 
-        for output in outputs:
-            await output.process(output_dir, continueOnError=args.continue_on_error)
+        await processOutputs(
+            outputs,
+            output_dir,
+            continueOnError=args.continue_on_error,
+            maxParallelOutputs=args.max_parallel_outputs,
+        )
 
 
 def main():
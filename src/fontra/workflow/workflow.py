@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import pathlib
 import re
@@ -7,7 +8,7 @@ from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from functools import singledispatch
 from importlib.metadata import entry_points
-from typing import Any, AsyncGenerator, Protocol
+from typing import Any, AsyncGenerator, ClassVar, Protocol
 
 from ..backends.null import NullBackend
 from ..core.protocols import ReadableFontBackend
@@ -18,6 +19,7 @@ from .actions import (
     OutputProcessorProtocol,
     getActionClass,
 )
+from .actions.base import SharedGlyphReads
 from .merger import FontBackendMerger
 
 
@@ -40,13 +42,20 @@ class Workflow:
 
     @asynccontextmanager
     async def endPoints(
-        self, input: ReadableFontBackend | None = None
+        self, input: ReadableFontBackend | None = None, *, maxParallelOutputs: int = 1
     ) -> AsyncGenerator[WorkflowEndPoints, None]:
+        """Set up the workflow steps, and yield the end point and the outputs.
+        `maxParallelOutputs` should match the value passed to `processOutputs()`:
+        if it is larger than 1, glyph reads are shared between outputs that read
+        from the same step.
+        """
         if input is None:
             input = NullBackend()
         async with AsyncExitStack() as exitStack:
             with chdir(self.parentDir):
-                endPoints = await _prepareEndPoints(input, self.steps, exitStack)
+                endPoints = await _prepareEndPoints(
+                    input, self.steps, exitStack, maxParallelOutputs
+                )
             yield endPoints
 
 
@@ -57,8 +66,12 @@ class WorkflowEndPoints:
 
 
 class ActionStep(Protocol):
+    steps: list[ActionStep]
+    # Whether the input of the step is also read by the steps that follow it
+    sharesInput: ClassVar[bool]
+
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         pass
 
@@ -94,9 +107,10 @@ class InputActionStep:
     actionName: str
     arguments: dict
     steps: list[ActionStep] = field(default_factory=list)
+    sharesInput: ClassVar[bool] = False
 
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         action = getAction("input", self.actionName, self.arguments)
         assert isinstance(action, InputActionProtocol)
@@ -105,7 +119,9 @@ class InputActionStep:
         assert isinstance(backend, ReadableFontBackend)
 
         # set up nested steps
-        endPoints = await _prepareEndPoints(backend, self.steps, exitStack)
+        endPoints = await _prepareEndPoints(
+            backend, self.steps, exitStack, maxParallelOutputs
+        )
 
         endPoint = FontBackendMerger(inputA=currentInput, inputB=endPoints.endPoint)
         return WorkflowEndPoints(endPoint=endPoint, outputs=endPoints.outputs)
@@ -117,9 +133,10 @@ class FilterActionStep:
     actionName: str
     arguments: dict
     steps: list[ActionStep] = field(default_factory=list)
+    sharesInput: ClassVar[bool] = False
 
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         action = getAction("filter", self.actionName, self.arguments)
         assert isinstance(action, FilterActionProtocol)
@@ -127,7 +144,9 @@ class FilterActionStep:
         backend = await exitStack.enter_async_context(action.connect(currentInput))
 
         # set up nested steps
-        return await _prepareEndPoints(backend, self.steps, exitStack)
+        return await _prepareEndPoints(
+            backend, self.steps, exitStack, maxParallelOutputs
+        )
 
 
 @registerActionStepClass("output")
@@ -136,9 +155,10 @@ class OutputActionStep:
     actionName: str
     arguments: dict
     steps: list[ActionStep] = field(default_factory=list)
+    sharesInput: ClassVar[bool] = True
 
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         assert currentInput is not None
         action = getAction("output", self.actionName, self.arguments)
@@ -147,7 +167,9 @@ class OutputActionStep:
         outputs = []
 
         # set up nested steps
-        endPoints = await _prepareEndPoints(currentInput, self.steps, exitStack)
+        endPoints = await _prepareEndPoints(
+            currentInput, self.steps, exitStack, maxParallelOutputs
+        )
         outputs.extend(endPoints.outputs)
 
         assert isinstance(endPoints.endPoint, ReadableFontBackend)
@@ -166,6 +188,7 @@ class ForkActionStep:
     actionName: str
     arguments: dict
     steps: list[ActionStep] = field(default_factory=list)
+    sharesInput: ClassVar[bool] = True
 
     def __post_init__(self):
         if self.actionName:
@@ -177,10 +200,12 @@ class ForkActionStep:
             raise WorkflowError("fork does not expect arguments")
 
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         # set up nested steps
-        endPoints = await _prepareEndPoints(currentInput, self.steps, exitStack)
+        endPoints = await _prepareEndPoints(
+            currentInput, self.steps, exitStack, maxParallelOutputs
+        )
         return WorkflowEndPoints(endPoint=currentInput, outputs=endPoints.outputs)
 
 
@@ -190,6 +215,7 @@ class ForkMergeActionStep:
     actionName: str
     arguments: dict
     steps: list[ActionStep] = field(default_factory=list)
+    sharesInput: ClassVar[bool] = True
 
     def __post_init__(self):
         if self.actionName:
@@ -201,10 +227,12 @@ class ForkMergeActionStep:
             raise WorkflowError("fork-merge does not expect arguments")
 
     async def setup(
-        self, currentInput: ReadableFontBackend, exitStack
+        self, currentInput: ReadableFontBackend, exitStack, maxParallelOutputs: int
     ) -> WorkflowEndPoints:
         # set up nested steps
-        endPoints = await _prepareEndPoints(currentInput, self.steps, exitStack)
+        endPoints = await _prepareEndPoints(
+            currentInput, self.steps, exitStack, maxParallelOutputs
+        )
 
         endPoint = FontBackendMerger(
             inputA=currentInput, inputB=endPoints.endPoint, warnAboutDuplicates=False
@@ -245,17 +273,71 @@ async def _prepareEndPoints(
     currentInput: ReadableFontBackend,
     steps: list[ActionStep],
     exitStack: AsyncExitStack,
+    maxParallelOutputs: int,
 ) -> WorkflowEndPoints:
     outputs: list[OutputProcessorProtocol] = []
 
-    for step in steps:
-        endPoints = await step.setup(currentInput, exitStack)
+    for i, step in enumerate(steps):
+        if (
+            maxParallelOutputs > 1
+            and step.sharesInput
+            and not isinstance(currentInput, SharedGlyphReads)
+            and _countOutputsReadingInput(steps[i:]) > 1
+        ):
+            # Several outputs may read the same glyphs at the same time
+            currentInput = await exitStack.enter_async_context(
+                SharedGlyphReads().connect(currentInput)
+            )
+        endPoints = await step.setup(currentInput, exitStack, maxParallelOutputs)
         currentInput = endPoints.endPoint
         outputs.extend(endPoints.outputs)
 
     return WorkflowEndPoints(currentInput, outputs)
 
 
+def _countOutputsReadingInput(steps: list[ActionStep]) -> int:
+    # Count the outputs of `steps` that read from the input of the first step.
+    # The nested steps of an input step read from the new input instead.
+    return sum(
+        isinstance(step, OutputActionStep)
+        + (
+            _countOutputsReadingInput(step.steps)
+            if not isinstance(step, InputActionStep)
+            else 0
+        )
+        for step in steps
+    )
+
+
+async def processOutputs(
+    outputs: list[OutputProcessorProtocol],
+    outputDir: os.PathLike = pathlib.Path(),
+    *,
+    continueOnError: bool = False,
+    maxParallelOutputs: int = 1,
+) -> None:
+    """Process `outputs`, up to `maxParallelOutputs` at a time. When an output
+    fails, the outputs that are still being processed are cancelled.
+    """
+    semaphore = asyncio.Semaphore(maxParallelOutputs)
+
+    async def processOutput(output: OutputProcessorProtocol) -> None:
+        async with semaphore:
+            await output.process(outputDir, continueOnError=continueOnError)
+
+    tasks = [asyncio.create_task(processOutput(output)) for output in outputs]
+    if not tasks:
+        return
+    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    for task in tasks:
+        if task in done:
+            task.result()  # Raises the exception of a failed output
+
+
 def _loadActionsEntryPoints():
     from .actions import axes  # noqa: F401
     from .actions import base  # noqa: F401
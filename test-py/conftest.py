@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 
@@ -8,3 +10,11 @@ def pytest_addoption(parser):
 @pytest.fixture(scope="session")
 def writeExpectedData(pytestconfig):
     return pytestconfig.getoption("write_expected_data")
+
+
+@pytest.fixture(autouse=True)
+def fontraCacheDir(tmp_path_factory, monkeypatch):
+    # Keep persistent caches out of the user's cache directory
+    cacheHome = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", os.fspath(cacheHome))
+    return cacheHome / "fontra"
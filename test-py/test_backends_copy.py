@@ -1,11 +1,19 @@
+import logging
+import multiprocessing.util
 import pathlib
 import subprocess
+from contextlib import aclosing
 
 import pytest
 from test_backends_designspace import fileNamesFromDir
 
-from fontra.backends import UnknownFileType, getFileSystemBackend, newFileSystemBackend
-from fontra.backends.copy import copyFont
+from fontra.backends import (
+    UnknownFileType,
+    copy,
+    getFileSystemBackend,
+    newFileSystemBackend,
+)
+from fontra.backends.copy import CopyJournal, SubProcessGlyphReader, copyFont
 
 mutatorDSPath = (
     pathlib.Path(__file__).resolve().parent
@@ -39,6 +47,156 @@ async def test_copyFont(tmpdir, glyphNames):
     assert glyphNames == reopenedGlyphNames
 
 
+@pytest.mark.parametrize("glyphNames", [None, ["A", "Aacute", "period"]])
+async def test_copyFont_subProcessGlyphReader(tmpdir, glyphNames):
+    tmpdir = pathlib.Path(tmpdir)
+    destPath = tmpdir / "MutatorCopy.fontra"
+    sourceFont = getFileSystemBackend(mutatorDSPath)
+    destFont = newFileSystemBackend(destPath)
+    glyphReader = SubProcessGlyphReader(mutatorDSPath, 2)
+    async with aclosing(glyphReader), aclosing(destFont):
+        await copyFont(
+            sourceFont, destFont, glyphNames=glyphNames, glyphReader=glyphReader
+        )
+
+    reopenedFont = getFileSystemBackend(destPath)
+    glyphMap = await reopenedFont.getGlyphMap()
+    if glyphNames is None:
+        assert await sourceFont.getGlyphMap() == glyphMap
+    else:
+        # Components are included
+        assert ["A", "Aacute", "acute", "period"] == sorted(glyphMap)
+    for glyphName in glyphMap:
+        assert await sourceFont.getGlyph(glyphName) == await reopenedFont.getGlyph(
+            glyphName
+        )
+    assert await sourceFont.getAxes() == await reopenedFont.getAxes()
+
+
+def test_closeSubProcessBackends(monkeypatch):
+    # This runs the worker side of SubProcessGlyphReader in this process
+    monkeypatch.setattr(copy, "_subProcessBackends", {})
+    monkeypatch.setattr(copy, "_subProcessEventLoop", None)
+    monkeypatch.setattr(multiprocessing.util, "Finalize", lambda *args, **kwargs: None)
+    ttfPath = mutatorDSPath.parent / "MutatorSans.ttf"
+
+    glyphs = copy._readGlyphsInSubProcess(str(ttfPath), ["A", "nonexistent"])
+    assert glyphs["A"] is not None
+    assert glyphs["nonexistent"] is None
+    [backend] = copy._subProcessBackends.values()
+    assert not backend._file.closed
+
+    copy._closeSubProcessBackends()
+    assert backend._file.closed
+    assert not copy._subProcessBackends
+    assert copy._subProcessEventLoop is None
+
+
+async def test_copyFont_resume(tmpdir, caplog):
+    caplog.set_level(logging.INFO)
+    tmpdir = pathlib.Path(tmpdir)
+    destPath = tmpdir / "MutatorCopy.fontra"
+    journalPath = tmpdir / "MutatorCopy.fontra.copy-journal.csv"
+    sourceFont = getFileSystemBackend(mutatorDSPath)
+    numGlyphs = len(await sourceFont.getGlyphMap())
+
+    journal = CopyJournal(journalPath)
+    destFont = newFileSystemBackend(destPath)
+    async with aclosing(destFont):
+        await copyFont(sourceFont, destFont, journal=journal)
+    journal.close()
+    rows = journalPath.read_text(encoding="utf-8").splitlines()
+    assert numGlyphs == len(rows)
+
+    # Pretend the copy was interrupted, and that "A" changed since
+    rows = rows[:20]
+    assert rows[0].startswith("A;")
+    rows[0] = "A;0000"
+    journalPath.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    caplog.clear()
+    journal = CopyJournal(journalPath, resume=True)
+    destFont = getFileSystemBackend(destPath)
+    async with aclosing(destFont):
+        await copyFont(sourceFont, destFont, journal=journal)
+    journal.close()
+    assert f"copied {numGlyphs - 19} glyphs (19 unchanged glyphs skipped)" in (
+        caplog.text
+    )
+
+    reopenedFont = getFileSystemBackend(destPath)
+    assert await sourceFont.getGlyphMap() == await reopenedFont.getGlyphMap()
+    assert await sourceFont.getGlyph("A") == await reopenedFont.getGlyph("A")
+
+
+class FlushTracker:
+    def __init__(self, backend, journalPath):
+        self.backend = backend
+        self.journalPath = journalPath
+        self.unflushedGlyphNames = set()
+        self.flushedGlyphNames = set()
+        self.numFlushes = 0
+
+    def __getattr__(self, attrName):
+        return getattr(self.backend, attrName)
+
+    def checkJournal(self):
+        rows = self.journalPath.read_text(encoding="utf-8").splitlines()
+        journalGlyphNames = {row.split(";")[0] for row in rows}
+        assert journalGlyphNames <= self.flushedGlyphNames
+
+    async def putGlyph(self, glyphName, glyph, codePoints):
+        self.checkJournal()
+        await self.backend.putGlyph(glyphName, glyph, codePoints)
+        self.unflushedGlyphNames.add(glyphName)
+
+    def flush(self):
+        self.checkJournal()
+        self.backend.flush()
+        self.flushedGlyphNames.update(self.unflushedGlyphNames)
+        self.unflushedGlyphNames.clear()
+        self.numFlushes += 1
+
+
+async def test_copyFont_journalFollowsFlush(tmpdir):
+    tmpdir = pathlib.Path(tmpdir)
+    journalPath = tmpdir / "MutatorCopy.fontra.copy-journal.csv"
+    sourceFont = getFileSystemBackend(mutatorDSPath)
+    numGlyphs = len(await sourceFont.getGlyphMap())
+
+    journal = CopyJournal(journalPath)
+    journal.maxPendingRows = 10
+    destFont = FlushTracker(
+        newFileSystemBackend(tmpdir / "MutatorCopy.fontra"), journalPath
+    )
+    async with aclosing(destFont):
+        await copyFont(sourceFont, destFont, journal=journal)
+    journal.close()
+
+    assert destFont.numFlushes == numGlyphs // 10 + 1
+    destFont.checkJournal()
+    rows = journalPath.read_text(encoding="utf-8").splitlines()
+    assert numGlyphs == len(rows)
+
+
+def test_fontra_copy_resume(tmpdir):
+    tmpdir = pathlib.Path(tmpdir)
+    destPath = tmpdir / "MutatorCopy.fontra"
+    for i in range(2):
+        subprocess.run(["fontra-copy", mutatorDSPath, destPath, "--resume"], check=True)
+        # The journal is deleted when the copy completes
+        assert ["MutatorCopy.fontra"] == fileNamesFromDir(tmpdir)
+
+
+def test_fontra_copy_processes(tmpdir):
+    tmpdir = pathlib.Path(tmpdir)
+    destPath = tmpdir / "MutatorCopy.fontra"
+    subprocess.run(
+        ["fontra-copy", mutatorDSPath, destPath, "--processes", "2"], check=True
+    )
+    assert ["MutatorCopy.fontra"] == fileNamesFromDir(tmpdir)
+
+
 def test_fontra_copy(tmpdir):
     tmpdir = pathlib.Path(tmpdir)
     destPath = tmpdir / "MutatorCopy.designspace"
@@ -1,5 +1,6 @@
 import pathlib
 import shutil
+import threading
 import uuid
 from contextlib import aclosing
 from copy import deepcopy
@@ -7,10 +8,13 @@ from dataclasses import asdict, replace
 
 import pytest
 from fontTools.designspaceLib import DesignSpaceDocument
+from fontTools.ufoLib import UFOReaderWriter
+from fontTools.ufoLib.glifLib import GlyphSet
 
-from fontra.backends import getFileSystemBackend, newFileSystemBackend
+from fontra.backends import designspace, getFileSystemBackend, newFileSystemBackend
 from fontra.backends.copy import copyFont
 from fontra.backends.designspace import DesignspaceBackend, UFOBackend, convertImageData
+from fontra.backends.glifcache import GlifCache
 from fontra.backends.null import NullBackend
 from fontra.core.classes import (
     Anchor,
@@ -172,6 +176,7 @@ async def test_addNewSparseSource(writableTestFont, location, expectedDSSource):
     glyph.layers["mid"] = Layer(glyph=StaticGlyph(xAdvance=100))
 
     await writableTestFont.putGlyph(glyphName, glyph, glyphMap[glyphName])
+    writableTestFont.flush()
 
     newDSDoc = DesignSpaceDocument.fromfile(writableTestFont.dsDoc.path)
     newDSSources = unpackSources(newDSDoc.sources)
@@ -211,6 +216,7 @@ async def test_addNewDenseSource(writableTestFont):
     glyph.layers["widest"] = Layer(glyph=StaticGlyph())
 
     await writableTestFont.putGlyph(glyphName, glyph, glyphMap[glyphName])
+    writableTestFont.flush()
 
     newDSDoc = DesignSpaceDocument.fromfile(writableTestFont.dsDoc.path)
     newDSSources = unpackSources(newDSDoc.sources)
@@ -368,6 +374,82 @@ async def test_readGlyphNote_None(testFont):
     assert glyph.customData.get("fontra.glyph.note") is None
 
 
+async def test_getGlyphs(testFont):
+    glyphNames = ["A", "B", "Aacute", "space", "no-such-glyph"]
+    glyphs = await testFont.getGlyphs(glyphNames)
+    assert list(glyphs) == glyphNames
+    assert glyphs["no-such-glyph"] is None
+    for glyphName in glyphNames[:-1]:
+        assert glyphs[glyphName] == await testFont.getGlyph(glyphName)
+
+
+async def test_lazyGlifFileNames(writableTestFont):
+    # The glyph sets of all layers are only needed to watch for external changes
+    assert writableTestFont._glifFileNames is None
+    await writableTestFont.getGlyph("A")
+    assert writableTestFont._glifFileNames is None
+
+    async def callback(reloadPattern):
+        pass
+
+    await writableTestFont.watchExternalChanges(callback)
+    assert writableTestFont._glifFileNames is not None
+    assert writableTestFont.glifFileNames["A_.glif"] == "A"
+    await writableTestFont.aclose()
+
+
+async def test_glifCache(writableTestFont, tmpdir, monkeypatch):
+    cacheDir = pathlib.Path(tmpdir) / "glif-cache"
+    dsPath = writableTestFont.dsDoc.path
+    glyphNames = ["A", "B", "Aacute"]
+
+    writableTestFont.enableGlifCache(cacheDir)
+    expectedGlyphs = await writableTestFont.getGlyphs(glyphNames)
+    await writableTestFont.aclose()
+    assert len(list(cacheDir.glob("*.sqlite"))) == 1
+
+    parsedGlyphs = []
+
+    def ufoLayerToStaticGlyph(glyphSet, glyphName):
+        parsedGlyphs.append(glyphName)
+        return originalUFOLayerToStaticGlyph(glyphSet, glyphName)
+
+    originalUFOLayerToStaticGlyph = designspace.ufoLayerToStaticGlyph
+    monkeypatch.setattr(designspace, "ufoLayerToStaticGlyph", ufoLayerToStaticGlyph)
+
+    cacheThreads = set()
+
+    def getMany(self, stamps):
+        cacheThreads.add(threading.current_thread())
+        return originalGetMany(self, stamps)
+
+    originalGetMany = GlifCache.getMany
+    monkeypatch.setattr(GlifCache, "getMany", getMany)
+
+    font = DesignspaceBackend.fromPath(dsPath)
+    font.enableGlifCache(cacheDir)
+    async with aclosing(font):
+        for glyphName in glyphNames:
+            assert await font.getGlyph(glyphName) == expectedGlyphs[glyphName]
+        assert await font.getGlyphs(glyphNames) == expectedGlyphs
+        assert parsedGlyphs == []
+        # The cache is read in worker threads, not on the event loop
+        assert cacheThreads
+        assert threading.main_thread() not in cacheThreads
+
+        # A modified .glif file must be parsed again
+        glyphSet = font.defaultUFOLayer.glyphSet
+        glifPath = pathlib.Path(glyphSet.fs.getsyspath(glyphSet.contents["B"]))
+        glifPath.write_bytes(glifPath.read_bytes().replace(b'width="', b'width="1'))
+        glyph = await font.getGlyph("B")
+        assert parsedGlyphs == ["B"]
+        defaultLayerName = font.defaultUFOLayer.fontraLayerName
+        assert (
+            glyph.layers[defaultLayerName].glyph.xAdvance
+            != expectedGlyphs["B"].layers[defaultLayerName].glyph.xAdvance
+        )
+
+
 async def test_writeGlyphNote(writableTestFont):
     glyphName = "space"
     glyphMap = await writableTestFont.getGlyphMap()
@@ -561,6 +643,7 @@ async def test_newFileSystemBackend(
     glyphMap = await sourceFont.getGlyphMap()
     glyph = await sourceFont.getGlyph("H")
     await font.putGlyph("H", glyph, glyphMap["H"])
+    font.flush()
 
     assert expectedFileNames == fileNamesFromDir(tmpdir)
 
@@ -676,6 +759,49 @@ async def test_deleteGlyph(writableTestFont):
     assert await writableTestFont.getGlyph(glyphName) is None
 
 
+async def test_glyphLayerIndex(writableTestFont):
+    def buildGlyphLayerIndex(font):
+        font._glyphLayerIndex = None
+        return font._getGlyphLayerIndex()
+
+    glyphMap = await writableTestFont.getGlyphMap()
+    glyphLayerIndex = writableTestFont._getGlyphLayerIndex()
+    assert [layer.fontraLayerName for layer in glyphLayerIndex["A"]] == [
+        layer.fontraLayerName
+        for layer in writableTestFont.ufoLayers
+        if "A" in layer.glyphSet
+    ]
+
+    # Add a layer to an existing glyph, and add a new glyph
+    glyph = await writableTestFont.getGlyph("period")
+    glyph.layers["test"] = Layer(glyph=StaticGlyph(xAdvance=0))
+    glyph.sources.append(
+        GlyphSource(name="test", locationBase="light-condensed", layerName="test")
+    )
+    await writableTestFont.putGlyph("period", glyph, glyphMap["period"])
+    await writableTestFont.putGlyph("period.alt", glyph, [])
+
+    # Remove layers from a glyph, and delete a glyph
+    glyph = await writableTestFont.getGlyph("B")
+    glyph.sources = glyph.sources[:1]
+    glyph.layers = {
+        layerName: layer
+        for layerName, layer in glyph.layers.items()
+        if layerName == glyph.sources[0].layerName
+    }
+    await writableTestFont.putGlyph("B", glyph, glyphMap["B"])
+    await writableTestFont.deleteGlyph("A")
+
+    glyphLayerIndex = {
+        glyphName: list(glyphLayers)
+        for glyphName, glyphLayers in writableTestFont._getGlyphLayerIndex().items()
+    }
+    assert "A" not in glyphLayerIndex
+    assert len(glyphLayerIndex["period"]) == len(glyphLayerIndex["period.alt"])
+    assert len(glyphLayerIndex["B"]) == 1
+    assert glyphLayerIndex == buildGlyphLayerIndex(writableTestFont)
+
+
 async def test_deleteGlyphRaisesKeyError(writableTestFont):
     glyphName = "A.doesnotexist"
     with pytest.raises(KeyError, match="Glyph 'A.doesnotexist' does not exist"):
@@ -991,6 +1117,18 @@ async def test_glyphDependencies(testFont) -> None:
     }
 
 
+async def test_glyphDependencies_cache(testFont, fontraCacheDir) -> None:
+    deps = await testFont.glyphDependencies
+    cachePaths = list((fontraCacheDir / "glyphdependencies").glob("*.json"))
+    assert len(cachePaths) == 1
+
+    # A second open reads from the cache, and gives the same result
+    cacheModTime = cachePaths[0].stat().st_mtime_ns
+    reopenedDeps = await getTestFont().glyphDependencies
+    assert reopenedDeps == deps
+    assert cachePaths[0].stat().st_mtime_ns == cacheModTime
+
+
 async def test_glyphDependencies_new_font(tmpdir) -> None:
     tmpdir = pathlib.Path(tmpdir)
     destPath = tmpdir / "Test.designspace"
@@ -1165,11 +1303,73 @@ async def test_kerning_read_write(writableTestFont):
     assert "<key>public.kern2.A</key>" in someKerningData
 
 
+async def test_putKerningValues(writableTestFont, monkeypatch):
+    kerning = await writableTestFont.getKerning()
+    kernTable = kerning["kern"]
+    sourceIdentifiers = kernTable.sourceIdentifiers
+
+    writtenKerningPaths = []
+
+    def writeKerning(self, kerning, validate=None):
+        writtenKerningPaths.append(self.fs.getsyspath("/"))
+        return originalWriteKerning(self, kerning, validate)
+
+    originalWriteKerning = UFOReaderWriter.writeKerning
+    monkeypatch.setattr(UFOReaderWriter, "writeKerning", writeKerning)
+
+    kernTable.values["A"]["J"] = [None, -25, None, None, None]
+    # ("T", "@A") is unchanged, so only one source is affected
+    await writableTestFont.putKerningValues(
+        "kern", kernTable, [("A", "J"), ("T", "@A")]
+    )
+    assert len(writtenKerningPaths) == 1
+
+    # Delete all pairs with "T" on the left side
+    affectedSources = {
+        sourceIdentifier
+        for values in kernTable.values["T"].values()
+        for sourceIdentifier, value in zip(sourceIdentifiers, values)
+        if value is not None
+    }
+    del kernTable.values["T"]
+    writtenKerningPaths.clear()
+    await writableTestFont.putKerningValues("kern", kernTable, [("T", None)])
+    assert len(writtenKerningPaths) == len(affectedSources)
+
+    reopenedFont = getFileSystemBackend(writableTestFont.dsDoc.path)
+    reopenedKerning = await reopenedFont.getKerning()
+    assert reopenedKerning["kern"].values == kernTable.values
+    assert reopenedKerning["kern"].groupsSide1 == kernTable.groupsSide1
+
+
+async def test_putKerningValues_writeError(writableTestFont, monkeypatch):
+    kerning = await writableTestFont.getKerning()
+    kernTable = kerning["kern"]
+    originalWriteKerning = UFOReaderWriter.writeKerning
+
+    def failingWriteKerning(self, kerning, validate=None):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(UFOReaderWriter, "writeKerning", failingWriteKerning)
+    kernTable.values["A"]["J"] = [None, -25, None, None, None]
+    with pytest.raises(OSError):
+        await writableTestFont.putKerningValues("kern", kernTable, [("A", "J")])
+
+    # The failed change is not taken for written, so trying again writes it
+    monkeypatch.setattr(UFOReaderWriter, "writeKerning", originalWriteKerning)
+    await writableTestFont.putKerningValues("kern", kernTable, [("A", "J")])
+
+    reopenedFont = getFileSystemBackend(writableTestFont.dsDoc.path)
+    reopenedKerning = await reopenedFont.getKerning()
+    assert reopenedKerning["kern"].values == kernTable.values
+
+
 async def test_roundtrip_single_UFO(testFontSingleUFO, tmpdir):
     tmpdir = pathlib.Path(tmpdir)
     outPath = tmpdir / "roundtripped.ufo"
     outBackend = newFileSystemBackend(outPath)
     await copyFont(testFontSingleUFO, outBackend)
+    outBackend.flush()
     reopenedBackend = getFileSystemBackend(outPath)
     assert await testFontSingleUFO.getGlyph("A") == await reopenedBackend.getGlyph("A")
     assert await testFontSingleUFO.getGlyph("Q") == await reopenedBackend.getGlyph("Q")
@@ -1198,12 +1398,42 @@ async def test_empty_layers_have_contents_plist(tmpdir, suffix, testFont):
 
     outBackend = newFileSystemBackend(outPath)
     await outBackend.putSources(sources)
+    outBackend.flush()
 
     for ufoPath in tmpdir.glob("*.ufo"):
         for glyphsDir in ufoPath.glob("glyphs*"):
             assert (glyphsDir / "contents.plist").exists()
 
 
+async def test_deferredContentsWrites(writableTestFont, monkeypatch):
+    writtenGlyphSets = []
+
+    def writeContents(glyphSet):
+        writtenGlyphSets.append(glyphSet)
+        originalWriteContents(glyphSet)
+
+    originalWriteContents = GlyphSet.writeContents
+    monkeypatch.setattr(GlyphSet, "writeContents", writeContents)
+
+    glyph = await writableTestFont.getGlyph("A")
+    newGlyphNames = [f"A.alt{i}" for i in range(10)]
+    for glyphName in newGlyphNames:
+        await writableTestFont.putGlyph(glyphName, glyph, [])
+
+    ufoPath = writableTestFont.defaultUFOLayer.path
+    assert writtenGlyphSets == []
+    glyphSet = UFOReaderWriter(ufoPath).getGlyphSet()
+    assert not set(newGlyphNames) & set(glyphSet.keys())
+
+    writableTestFont.flush()
+
+    # Each glyph set is written once
+    assert len(writtenGlyphSets) == len(set(map(id, writtenGlyphSets)))
+    assert writableTestFont.defaultUFOLayer.glyphSet in writtenGlyphSets
+    glyphSet = UFOReaderWriter(ufoPath).getGlyphSet()
+    assert set(newGlyphNames) <= set(glyphSet.keys())
+
+
 async def test_sparse_master_background_layers(writableTestFont):
     glyphName = "B"
     layerName = "support.crossbar"
@@ -1213,6 +1443,7 @@ async def test_sparse_master_background_layers(writableTestFont):
     glyph.layers[bgLayerName] = deepcopy(glyph.layers[layerName])
 
     await writableTestFont.putGlyph(glyphName, glyph, [ord(glyphName)])
+    writableTestFont.flush()
 
     reopenedBackend = getFileSystemBackend(writableTestFont.dsDoc.path)
     reopenedGlyph = await reopenedBackend.getGlyph(glyphName)
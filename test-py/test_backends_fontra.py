@@ -1,13 +1,20 @@
 import asyncio
+import os
 import pathlib
 import shutil
+import stat
+import sys
 from contextlib import aclosing
 
 import pytest
 
 from fontra.backends import getFileSystemBackend, newFileSystemBackend
 from fontra.backends.copy import copyFont
-from fontra.backends.fontra import longestCommonPrefix
+from fontra.backends.fontra import (
+    GLYPH_FORMAT_PACKED,
+    GLYPH_FORMAT_UNPACKED,
+    longestCommonPrefix,
+)
 from fontra.core.classes import ImageType, Kerning, OpenTypeFeatures
 
 dataDir = pathlib.Path(__file__).resolve().parent / "data"
@@ -84,6 +91,160 @@ async def test_deleteGlyph(writableFontraFont):
     assert await reopenedFont.getGlyph(glyphName) is None
 
 
+async def test_deferredGlyphWrites(writableFontraFont):
+    glyphName = "A"
+    async with aclosing(writableFontraFont):
+        glyph = await writableFontraFont.getGlyph(glyphName)
+        glyph.layers[glyph.sources[0].layerName].glyph.xAdvance += 10
+        await writableFontraFont.putGlyph(glyphName, glyph, [ord("A")])
+        # A pending write can be read back immediately
+        assert await writableFontraFont.getGlyph(glyphName) == glyph
+
+        await writableFontraFont.deleteGlyph("B")
+        assert await writableFontraFont.getGlyph("B") is None
+
+        writableFontraFont.flush()
+        assert not writableFontraFont.getGlyphFilePath("B").exists()
+        reopenedFont = getFileSystemBackend(writableFontraFont.path)
+        assert await reopenedFont.getGlyph(glyphName) == glyph
+        assert await reopenedFont.getGlyph("B") is None
+
+    # No temporary files are left behind
+    assert [] == list(writableFontraFont.path.glob("**/*.tmp"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+async def test_writtenFileModes(writableFontraFont):
+    umask = os.umask(0)
+    os.umask(umask)
+    existingPath = writableFontraFont.getGlyphFilePath("A")
+    existingPath.chmod(0o640)
+    async with aclosing(writableFontraFont):
+        glyph = await writableFontraFont.getGlyph("A")
+        glyph.layers[glyph.sources[0].layerName].glyph.xAdvance += 10
+        await writableFontraFont.putGlyph("A", glyph, [ord("A")])
+        await writableFontraFont.putGlyph("A.alt", glyph, [])
+        writableFontraFont.flush()
+
+        # A rewritten file keeps its mode, a new file gets the default mode
+        assert stat.S_IMODE(existingPath.stat().st_mode) == 0o640
+        newPath = writableFontraFont.getGlyphFilePath("A.alt")
+        assert stat.S_IMODE(newPath.stat().st_mode) == 0o666 & ~umask
+
+
+async def test_packedGlyphFormat(testFontraFont, newFontraFont):
+    async with aclosing(newFontraFont):
+        newFontraFont.setGlyphFormatVersion(GLYPH_FORMAT_PACKED)
+        await copyFont(testFontraFont, newFontraFont)
+
+    reopenedFont = getFileSystemBackend(newFontraFont.path)
+    assert reopenedFont.glyphFormatVersion == GLYPH_FORMAT_PACKED
+
+    glyphMap = await testFontraFont.getGlyphMap()
+    for glyphName in glyphMap:
+        glyphData = reopenedFont.getGlyphData(glyphName)
+        assert len(glyphData) <= len(testFontraFont.getGlyphData(glyphName))
+        assert await testFontraFont.getGlyph(glyphName) == await reopenedFont.getGlyph(
+            glyphName
+        )
+    assert '"pointTypes"' in reopenedFont.getGlyphData("A")
+
+    # Switching back only affects glyphs written from now on, and glyph files
+    # of both formats can be read side by side
+    async with aclosing(reopenedFont):
+        reopenedFont.setGlyphFormatVersion(GLYPH_FORMAT_UNPACKED)
+        glyph = await reopenedFont.getGlyph("B")
+        await reopenedFont.putGlyph("B", glyph, glyphMap["B"])
+
+    reopenedFont = getFileSystemBackend(newFontraFont.path)
+    assert reopenedFont.glyphFormatVersion == GLYPH_FORMAT_UNPACKED
+    assert '"pointTypes"' in reopenedFont.getGlyphData("A")
+    assert '"contours"' in reopenedFont.getGlyphData("B")
+    for glyphName in ["A", "B"]:
+        assert await testFontraFont.getGlyph(glyphName) == await reopenedFont.getGlyph(
+            glyphName
+        )
+
+    with pytest.raises(ValueError):
+        reopenedFont.setGlyphFormatVersion(3)
+
+
+async def test_glyphInfoJournal(writableFontraFont):
+    glyphInfoText = writableFontraFont.glyphInfoPath.read_text(encoding="utf-8")
+    async with aclosing(writableFontraFont):
+        glyph = await writableFontraFont.getGlyph("A")
+        await writableFontraFont.putGlyph("A", glyph, [ord("A"), ord("a")])
+        await writableFontraFont.putGlyph("A.alt", glyph, [])
+        await writableFontraFont.deleteGlyph("B")
+        writableFontraFont.flush()
+
+        # The changes went to the journal, glyph-info.csv is unchanged
+        assert glyphInfoText == writableFontraFont.glyphInfoPath.read_text(
+            encoding="utf-8"
+        )
+        assert writableFontraFont.glyphInfoJournalPath.is_file()
+        expectedGlyphMap = await writableFontraFont.getGlyphMap()
+        reopenedFont = getFileSystemBackend(writableFontraFont.path)
+        assert expectedGlyphMap == await reopenedFont.getGlyphMap()
+
+    # Closing merges the journal into glyph-info.csv
+    assert not writableFontraFont.glyphInfoJournalPath.exists()
+    reopenedFont = getFileSystemBackend(writableFontraFont.path)
+    assert expectedGlyphMap == await reopenedFont.getGlyphMap()
+    assert [ord("A"), ord("a")] == expectedGlyphMap["A"]
+    assert [] == expectedGlyphMap["A.alt"]
+    assert "B" not in expectedGlyphMap
+
+
+async def test_kerningJournal(writableFontraFont):
+    kerningText = writableFontraFont.kerningPath.read_text(encoding="utf-8")
+    async with aclosing(writableFontraFont):
+        kerning = await writableFontraFont.getKerning()
+        kerningTable = kerning["kern"]
+        (left, rightDict), *_ = kerningTable.values.items()
+        right1, right2, *_ = rightDict
+        numSources = len(kerningTable.sourceIdentifiers)
+        rightDict[right1] = [10] * numSources
+        del rightDict[right2]
+        kerningTable.values["Aacute"] = {"V": [None] * (numSources - 1) + [-5]}
+        await writableFontraFont.putKerningValues(
+            "kern", kerningTable, [(left, right1), (left, right2), ("Aacute", None)]
+        )
+        writableFontraFont.flush()
+
+        # The changes went to the journal, kerning.csv is unchanged
+        assert kerningText == writableFontraFont.kerningPath.read_text(encoding="utf-8")
+        journalRows = writableFontraFont.kerningJournalPath.read_text(
+            encoding="utf-8"
+        ).splitlines()
+        assert 3 == len(journalRows)
+        assert kerning == await writableFontraFont.getKerning()
+        reopenedFont = getFileSystemBackend(writableFontraFont.path)
+        assert kerning == await reopenedFont.getKerning()
+
+        # An incomplete row at the end of the journal is ignored
+        with open(writableFontraFont.kerningJournalPath, "a", encoding="utf-8") as f:
+            f.write("value;kern;Aacute;V;")
+        reopenedFont = getFileSystemBackend(writableFontraFont.path)
+        assert kerning == await reopenedFont.getKerning()
+
+        # A group change can't be journaled, and rewrites kerning.csv
+        kerningTable.groupsSide1["newgroup"] = ["A"]
+        await writableFontraFont.putKerningValues("kern", kerningTable, [])
+        writableFontraFont.flush()
+        assert not writableFontraFont.kerningJournalPath.exists()
+        reopenedFont = getFileSystemBackend(writableFontraFont.path)
+        assert kerning == await reopenedFont.getKerning()
+
+        rightDict[right1] = [20] * numSources
+        await writableFontraFont.putKerningValues("kern", kerningTable, [(left, None)])
+
+    # Closing merges the journal into kerning.csv
+    assert not writableFontraFont.kerningJournalPath.exists()
+    reopenedFont = getFileSystemBackend(writableFontraFont.path)
+    assert kerning == await reopenedFont.getKerning()
+
+
 async def test_emptyFontraProject(tmpdir):
     path = tmpdir / "newfont.fontra"
     backend = newFileSystemBackend(path)
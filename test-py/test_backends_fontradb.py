@@ -0,0 +1,232 @@
+import asyncio
+import pathlib
+import threading
+from contextlib import aclosing
+
+import pytest
+
+from fontra.backends import getFileSystemBackend, newFileSystemBackend
+from fontra.backends.copy import copyFont
+from fontra.backends.fontradb import FontraDBBackend, FontraDBFormatError
+from fontra.core.classes import ImageData, ImageType, Kerning, OpenTypeFeatures
+
+dataDir = pathlib.Path(__file__).resolve().parent / "data"
+commonFontsDir = pathlib.Path(__file__).parent.parent / "test-common" / "fonts"
+
+
+@pytest.fixture
+def testFontraFont():
+    return getFileSystemBackend(commonFontsDir / "MutatorSans.fontra")
+
+
+@pytest.fixture
+async def writableFontraDBFont(tmpdir, testFontraFont):
+    font = FontraDBBackend.createFromPath(tmpdir / "MutatorSans.fontradb")
+    await copyFont(testFontraFont, font)
+    font.flush()
+    return font
+
+
+async def test_roundTrip(tmpdir, testFontraFont):
+    dbPath = tmpdir / "MutatorSans.fontradb"
+    async with aclosing(FontraDBBackend.createFromPath(dbPath)) as dbFont:
+        await copyFont(testFontraFont, dbFont)
+
+    reopenedFont = FontraDBBackend.fromPath(dbPath)
+    roundTrippedFont = newFileSystemBackend(tmpdir / "MutatorSans.fontra")
+    async with aclosing(reopenedFont), aclosing(roundTrippedFont):
+        assert await testFontraFont.getGlyphMap() == await reopenedFont.getGlyphMap()
+        await copyFont(reopenedFont, roundTrippedFont)
+
+    glyphMap = await testFontraFont.getGlyphMap()
+    assert glyphMap == await roundTrippedFont.getGlyphMap()
+    for glyphName in glyphMap:
+        assert testFontraFont.getGlyphData(glyphName) == roundTrippedFont.getGlyphData(
+            glyphName
+        )
+
+    assert testFontraFont.fontDataPath.read_text(
+        encoding="utf-8"
+    ) == roundTrippedFont.fontDataPath.read_text(encoding="utf-8")
+    assert testFontraFont.kerningPath.read_text(
+        encoding="utf-8"
+    ) == roundTrippedFont.kerningPath.read_text(encoding="utf-8")
+
+
+async def test_copyFromDesignspace(tmpdir):
+    srcFont = getFileSystemBackend(dataDir / "mutatorsans" / "MutatorSans.designspace")
+    dbPath = tmpdir / "MutatorSans.fontradb"
+    async with aclosing(FontraDBBackend.createFromPath(dbPath)) as dbFont:
+        await copyFont(srcFont, dbFont)
+
+    reopenedFont = FontraDBBackend.fromPath(dbPath)
+    async with aclosing(reopenedFont):
+        for glyphName in ["A", "B", "E", "Q", "nlitest", "varcotest1"]:
+            assert await srcFont.getGlyph(glyphName) == await reopenedFont.getGlyph(
+                glyphName
+            )
+        assert await srcFont.getAxes() == await reopenedFont.getAxes()
+        assert await srcFont.getSources() == await reopenedFont.getSources()
+        assert await srcFont.getKerning() == await reopenedFont.getKerning()
+
+
+async def test_putGlyph_unchangedHash(writableFontraDBFont):
+    font = writableFontraDBFont
+    async with aclosing(font):
+
+        def getRowInfo(glyphName):
+            return font.connection.execute(
+                "SELECT rowid, hash FROM glyphs WHERE name = ?", (glyphName,)
+            ).fetchone()
+
+        rowInfo = getRowInfo("A")
+        glyph = await font.getGlyph("A")
+        await font.putGlyph("A", glyph, [ord("A")])
+        font.flush()
+        assert getRowInfo("A") == rowInfo
+
+        glyph.layers[glyph.sources[0].layerName].glyph.xAdvance += 10
+        await font.putGlyph("A", glyph, [ord("A")])
+        # Pending changes are visible before they are written
+        assert await font.getGlyph("A") == glyph
+        font.flush()
+        assert getRowInfo("A")[1] != rowInfo[1]
+
+    reopenedFont = FontraDBBackend.fromPath(font.path)
+    async with aclosing(reopenedFont):
+        assert await reopenedFont.getGlyph("A") == glyph
+
+
+async def test_writeChangesInThread(writableFontraDBFont, monkeypatch):
+    font = writableFontraDBFont
+    writeThreads = []
+    originalWriteChanges = FontraDBBackend._writeChangesToDatabase
+
+    def writeChangesToDatabase(self, changes):
+        writeThreads.append(threading.current_thread())
+        originalWriteChanges(self, changes)
+
+    monkeypatch.setattr(
+        FontraDBBackend, "_writeChangesToDatabase", writeChangesToDatabase
+    )
+
+    async with aclosing(font):
+        glyph = await font.getGlyph("A")
+        glyph.layers[glyph.sources[0].layerName].glyph.xAdvance += 10
+        await font.putGlyph("A", glyph, [ord("A")])
+        font._scheduler.flush()
+        # The glyph is visible while it is being written
+        assert await font.getGlyph("A") == glyph
+        await asyncio.gather(*font._writeTasks)
+
+    assert writeThreads
+    assert threading.main_thread() not in writeThreads
+
+    reopenedFont = FontraDBBackend.fromPath(font.path)
+    async with aclosing(reopenedFont):
+        assert await reopenedFont.getGlyph("A") == glyph
+
+
+async def test_createRemovesStaleWALFiles(tmpdir, testFontraFont):
+    dbPath = pathlib.Path(tmpdir / "MutatorSans.fontradb")
+    stalePaths = [dbPath.with_name(dbPath.name + suffix) for suffix in ["-wal", "-shm"]]
+    for path in [dbPath, *stalePaths]:
+        path.write_bytes(b"stale")
+
+    async with aclosing(FontraDBBackend.createFromPath(dbPath)) as dbFont:
+        for path in stalePaths:
+            assert not path.exists() or path.read_bytes() != b"stale"
+        await copyFont(testFontraFont, dbFont)
+
+    reopenedFont = FontraDBBackend.fromPath(dbPath)
+    async with aclosing(reopenedFont):
+        assert await testFontraFont.getGlyphMap() == await reopenedFont.getGlyphMap()
+
+
+async def test_deleteGlyph(writableFontraDBFont):
+    font = writableFontraDBFont
+    async with aclosing(font):
+        assert await font.getGlyph("A") is not None
+        await font.deleteGlyph("A")
+        await asyncio.sleep(0.01)
+        assert await font.getGlyph("A") is None
+        with pytest.raises(KeyError):
+            await font.deleteGlyph("A")
+
+    reopenedFont = FontraDBBackend.fromPath(font.path)
+    async with aclosing(reopenedFont):
+        assert await reopenedFont.getGlyph("A") is None
+        assert "A" not in await reopenedFont.getGlyphMap()
+
+
+async def test_fontData(writableFontraDBFont):
+    font = writableFontraDBFont
+    featureData = OpenTypeFeatures(language="fea", text="# dummy fea data\n")
+    kerning = {
+        "kern": Kerning(
+            groupsSide1={"A": ["A"]},
+            groupsSide2={},
+            sourceIdentifiers=["---"],
+            values={"A": {"V": [-10]}},
+        )
+    }
+    customData = {"com.example.test": [1, 2, 3]}
+    async with aclosing(font):
+        await font.putUnitsPerEm(2000)
+        await font.putFeatures(featureData)
+        await font.putKerning(kerning)
+        await font.putCustomData(customData)
+
+    reopenedFont = FontraDBBackend.fromPath(font.path)
+    async with aclosing(reopenedFont):
+        assert await reopenedFont.getUnitsPerEm() == 2000
+        assert await reopenedFont.getFeatures() == featureData
+        assert await reopenedFont.getKerning() == kerning
+        assert await reopenedFont.getCustomData() == customData
+
+
+async def test_backgroundImage(writableFontraDBFont):
+    font = writableFontraDBFont
+    async with aclosing(font):
+        glyph = await font.getGlyph("C")
+        bgImage = None
+        for layer in glyph.layers.values():
+            if layer.glyph.backgroundImage is not None:
+                bgImage = layer.glyph.backgroundImage
+                break
+        assert bgImage is not None
+
+        imageData = await font.getBackgroundImage(bgImage.identifier)
+        assert imageData.type == ImageType.PNG
+        assert len(imageData.data) == 60979
+
+        assert await font.getBackgroundImage("nonexistent") is None
+        newImageData = ImageData(type=ImageType.JPEG, data=b"dummy")
+        await font.putBackgroundImage("test-image", newImageData)
+        assert await font.getBackgroundImage("test-image") == newImageData
+
+
+async def test_findGlyphsThatUseGlyph(writableFontraDBFont):
+    font = writableFontraDBFont
+    async with aclosing(font):
+        assert [
+            "Aacute",
+            "Adieresis",
+            "varcotest1",
+        ] == await font.findGlyphsThatUseGlyph("A")
+        await font.deleteGlyph("Adieresis")
+        assert ["Aacute", "varcotest1"] == await font.findGlyphsThatUseGlyph("A")
+        glyph = await font.getGlyph("Aacute")
+        await font.putGlyph("B", glyph, [ord("B")])
+        assert [
+            "Aacute",
+            "B",
+            "varcotest1",
+        ] == await font.findGlyphsThatUseGlyph("A")
+
+
+async def test_notAFontraDBFile(tmpdir):
+    path = tmpdir / "bogus.fontradb"
+    path.write_text("not a database", encoding="utf-8")
+    with pytest.raises(FontraDBFormatError):
+        FontraDBBackend.fromPath(path)
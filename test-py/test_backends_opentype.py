@@ -1,9 +1,12 @@
 import pathlib
+from contextlib import aclosing
 
 import pytest
 
 from fontra.backends import getFileSystemBackend
+from fontra.backends.opentype import OTFBackend
 from fontra.core.classes import Axes, CrossAxisMapping, FontAxis
+from fontra.core.lrucache import LRUCache
 
 dataDir = pathlib.Path(__file__).resolve().parent / "data"
 
@@ -145,3 +148,24 @@ expectedAxesNLI = Axes(
 async def test_readAvar2NLI(testFontAvar2NLI):
     axes = await testFontAvar2NLI.getAxes()
     assert expectedAxesNLI == axes
+
+
+@pytest.mark.parametrize(
+    "fileName", ["MutatorSans.ttf", "MutatorSans.otf", "MutatorSans-VARC.ttf"]
+)
+async def test_getGlyphs(fileName):
+    path = dataDir / "mutatorsans" / fileName
+    async with aclosing(OTFBackend.fromPath(path)) as referenceFont:
+        glyphNames = list(await referenceFont.getGlyphMap())
+        expectedGlyphs = {
+            glyphName: await referenceFont.getGlyph(glyphName)
+            for glyphName in glyphNames
+        }
+    expectedGlyphs["nonexistent"] = None
+
+    async with aclosing(OTFBackend.fromPath(path)) as font:
+        # The glyph sets per location are cached, with a size limit
+        font.variationGlyphSets = LRUCache(maxSize=2)
+        glyphs = await font.getGlyphs(glyphNames + ["nonexistent"])
+        assert expectedGlyphs == glyphs
+        assert len(font.variationGlyphSets) <= 2
@@ -0,0 +1,101 @@
+import pytest
+from fontTools.ufoLib.glifLib import readGlyphFromString
+
+from fontra.backends.designspace import UFOGlyph
+from fontra.backends.ufo_utils import readGlyphFast
+from fontra.core.path import PackedPathPointPen
+
+testGLIF = b"""<?xml version='1.0' encoding='UTF-8'?>
+<glyph name="test" format="2">
+  <advance width="500.5"/>
+  <unicode hex="0041"/>
+  <unicode hex="0061"/>
+  <unicode hex="0041"/>
+  <image fileName="image.png" xOffset="10" color="1,0,0,1"/>
+  <guideline name="g" x="10" y="20.5" angle="90"/>
+  <anchor name="top" x="250" y="700"/>
+  <outline>
+    <contour identifier="c0">
+      <point x="0" y="0" type="line" name="first"/>
+      <point x="0" y="100" type="line" identifier="p1"/>
+      <point x="50.5" y="150"/>
+      <point x="100" y="150"/>
+      <point x="150" y="100" type="curve" smooth="yes"/>
+    </contour>
+    <contour>
+      <point x="0" y="0" type="move"/>
+      <point x="20" y="30"/>
+      <point x="50" y="50" type="qcurve"/>
+    </contour>
+    <contour>
+      <point x="0" y="0"/>
+      <point x="10" y="30"/>
+      <point x="100" y="0" type="qcurve" smooth="yes"/>
+    </contour>
+    <contour>
+      <point x="0" y="0"/>
+      <point x="10" y="10"/>
+      <point x="20" y="0"/>
+    </contour>
+    <contour>
+    </contour>
+    <component base="a" xOffset="100" yScale="2"/>
+    <component base="b"/>
+  </outline>
+  <note>
+    Some
+    note
+  </note>
+  <lib>
+    <dict>
+      <key>com.example.key</key>
+      <array>
+        <integer>1</integer>
+        <string>two</string>
+        <real>3.5</real>
+        <true/>
+        <false/>
+        <data>AAEC</data>
+        <dict/>
+      </array>
+    </dict>
+  </lib>
+</glyph>
+"""
+
+
+def readGlyphGlifLib(data):
+    glyph = UFOGlyph()
+    pen = PackedPathPointPen()
+    readGlyphFromString(data, glyph, pen, validate=False)
+    return glyph, pen.getPath(), pen.components
+
+
+def test_readGlyphFast():
+    expectedGlyph, expectedPath, expectedComponents = readGlyphGlifLib(testGLIF)
+    # glifLib sets the glyph name as well, we don't
+    del expectedGlyph.name
+
+    glyph = UFOGlyph()
+    path, components = readGlyphFast(testGLIF, glyph)
+    assert path == expectedPath
+    assert components == expectedComponents
+    assert glyph == expectedGlyph
+    assert glyph.note == "Some\nnote"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        testGLIF.replace(b'format="2"', b'format="1"'),
+        testGLIF.replace(b'format="2"', b'format="2" formatMinor="1"'),
+        testGLIF.replace(b'type="line" name="first"', b'type="bad"'),
+        testGLIF.replace(b'x="0" y="100"', b'y="100"'),
+        testGLIF.replace(b'<advance width="500.5"/>', b"<unknown/>"),
+        testGLIF.replace(b"</glyph>", b""),
+    ],
+)
+def test_readGlyphFast_unsupported(data):
+    glyph = UFOGlyph()
+    assert readGlyphFast(data, glyph) is None
+    assert glyph == UFOGlyph()
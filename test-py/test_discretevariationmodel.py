@@ -2,7 +2,14 @@ import pytest
 from fontTools.misc.vector import Vector
 
 from fontra.core.classes import DiscreteFontAxis, FontAxis
-from fontra.core.discretevariationmodel import DiscreteVariationModel, ErrorDescription
+from fontra.core.discretevariationmodel import (
+    DiscreteVariationModel,
+    ErrorDescription,
+    NearestLocationFinder,
+    clearVariationModelCache,
+    findNearestLocationIndex,
+    getVariationModelCacheStats,
+)
 
 testAxes = [
     FontAxis(
@@ -175,3 +182,80 @@ def test_discreteVariationModel_no_italics(location, expectedResult, expectedErr
     result = model.interpolateFromDeltas(location, deltas)
     assert result.instance == expectedResult
     assert result.errors == expectedErrors
+
+
+def test_variationModelCache():
+    clearVariationModelCache()
+    model1 = DiscreteVariationModel(testLocations, testAxes)
+    model2 = DiscreteVariationModel(testLocations, testAxes)
+    for model in [model1, model2]:
+        deltas = model.getDeltas([Vector(s) for s in testSourceData])
+        result = model.interpolateFromDeltas({"Weight": 550}, deltas)
+        assert result.instance == [50, 0]
+
+    assert (
+        model1._getModel((("Italic", 0),))[0] is model2._getModel((("Italic", 0),))[0]
+    )
+
+    stats = getVariationModelCacheStats()
+    assert stats["numModels"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hitRate"] == 0.5
+    assert stats["estimatedMemorySize"] > 0
+
+
+def test_variationModelCache_subModels():
+    clearVariationModelCache()
+    model = DiscreteVariationModel(testLocations, testAxes)
+    sourceData = [Vector(s) for s in testSourceData]
+    sourceData[1] = None
+    for i in range(2):
+        deltas = model.getDeltas(sourceData)
+        result = model.interpolateFromDeltas({"Weight": 550}, deltas)
+        assert result.instance == [0, 0]
+
+    stats = getVariationModelCacheStats()
+    # The full model and the sub-model without the {"Weight": 700} source
+    assert stats["numModels"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+nearestLocationTestLocations = [
+    {},
+    {"a": 1},
+    {"b": 1},
+    {"a": 1, "b": 1},
+    {"a": -0.5, "c": 0.5},
+]
+
+
+@pytest.mark.parametrize(
+    "targetLocation, expectedIndex",
+    [
+        ({"a": 0, "b": 0}, 0),
+        ({"a": 0.8, "b": 0.1}, 1),
+        ({"a": 0.1, "b": 0.8}, 2),
+        ({"a": 0.6, "b": 0.6}, 3),
+        ({"a": -0.6, "b": 0, "c": 0.6}, 4),
+        # "c" is ignored when not in the target location
+        ({"a": -0.3, "b": 0, "c": 0}, 0),
+        ({"a": -0.3, "b": 0}, 4),
+        # "d" is not in any of the locations
+        ({"a": 0.8, "b": 0.1, "d": 1}, 1),
+    ],
+)
+def test_nearestLocationFinder(targetLocation, expectedIndex):
+    finder = NearestLocationFinder(nearestLocationTestLocations)
+    assert (
+        findNearestLocationIndex(targetLocation, nearestLocationTestLocations)
+        == expectedIndex
+    )
+    assert finder.findNearestIndex(targetLocation) == expectedIndex
+    # Cached result
+    assert finder.findNearestIndex(targetLocation) == expectedIndex
+
+
+def test_nearestLocationFinder_empty():
+    assert NearestLocationFinder([]).findNearestIndex({"a": 1}) is None
@@ -0,0 +1,67 @@
+from dataclasses import replace
+
+import pytest
+from fontTools.misc.transform import DecomposedTransform
+
+from fontra.core.classes import Anchor, Component, Guideline, StaticGlyph
+from fontra.core.flatglyph import flattenGlyph, flattenGlyphs
+from fontra.core.path import ContourInfo, PackedPath, PointType
+
+
+def makeTestGlyph(offset=0, **kwargs):
+    glyph = StaticGlyph(
+        path=PackedPath(
+            coordinates=[v + offset for v in [0, 0, 0, 100, 100, 100]],
+            pointTypes=[PointType.ON_CURVE] * 3,
+            contourInfo=[ContourInfo(endPoint=2, isClosed=True)],
+        ),
+        components=[
+            Component(
+                name="base",
+                transformation=DecomposedTransform(translateX=10 + offset),
+                location={"b": 0.5 + offset, "a": 0.25},
+            )
+        ],
+        xAdvance=500 + offset,
+        anchors=[Anchor(name="top", x=250 + offset, y=700)],
+        guidelines=[Guideline(name="g", x=offset, y=10, angle=90)],
+    )
+    return replace(glyph, **kwargs)
+
+
+def test_flattenGlyph_roundTrip():
+    glyph = makeTestGlyph()
+    template, values = flattenGlyph(glyph)
+    assert len(values) == 6 + 1 + 9 + 2 + 2 + 3
+    assert template.unflatten(values) == glyph
+
+
+def test_flattenGlyph_unflatten():
+    template, values = flattenGlyph(makeTestGlyph())
+    _, otherValues = flattenGlyph(makeTestGlyph(offset=10))
+    assert template.unflatten(values + (otherValues - values) * 0.5) == makeTestGlyph(
+        offset=5
+    )
+
+
+@pytest.mark.parametrize(
+    "otherGlyph",
+    [
+        makeTestGlyph(yAdvance=1000),
+        makeTestGlyph(anchors=[Anchor(name="bottom", x=0, y=0)]),
+        makeTestGlyph(components=[Component(name="other")]),
+        makeTestGlyph(
+            components=[Component(name="base", location={"a": 0.5, "c": 0.5})]
+        ),
+        makeTestGlyph(
+            path=PackedPath(
+                coordinates=[0, 0, 100, 100],
+                pointTypes=[PointType.ON_CURVE] * 2,
+                contourInfo=[ContourInfo(endPoint=1, isClosed=True)],
+            )
+        ),
+    ],
+)
+def test_flattenGlyphs_incompatible(otherGlyph):
+    assert flattenGlyphs([makeTestGlyph(), makeTestGlyph(offset=10)]) is not None
+    assert flattenGlyphs([makeTestGlyph(), otherGlyph]) is None
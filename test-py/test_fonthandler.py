@@ -1,13 +1,15 @@
 import asyncio
 import logging
+import os
 import pathlib
 import shutil
 from contextlib import aclosing
 
 import pytest
+from fontTools.ufoLib import UFOReaderWriter
 
 from fontra.backends.designspace import DesignspaceBackend
-from fontra.core.fonthandler import FontHandler
+from fontra.core.fonthandler import FontHandler, collectKerningPairChanges
 
 mutatorSansDir = pathlib.Path(__file__).resolve().parent / "data" / "mutatorsans"
 
@@ -310,3 +312,99 @@ async def test_getKerning(testFontHandler):
 
 def firstLayerItem(glyph):
     return next(iter(glyph.layers.items()))
+
+
+@pytest.mark.parametrize(
+    "change, expectedPairs",
+    [
+        (
+            {"p": ["kerning", "kern", "values", "T", "@A"], "f": "=", "a": [2, -100]},
+            {"kern": {("T", "@A")}},
+        ),
+        (
+            {
+                "p": ["kerning", "kern"],
+                "c": [
+                    {"p": ["values", "T"], "f": "=", "a": ["V", [1, 2, 3, 4, 5]]},
+                    {"p": ["values", "T"], "f": "d", "a": ["W"]},
+                    {"p": ["values"], "f": "d", "a": ["X"]},
+                ],
+            },
+            {"kern": {("T", "V"), ("T", "W"), ("X", None)}},
+        ),
+        (
+            {
+                "c": [
+                    {"p": ["glyphs", "A"], "f": "=", "a": ["name", "A"]},
+                    {"p": ["kerning", "kern", "values", "T"], "f": "d", "a": ["V"]},
+                ],
+            },
+            {"kern": {("T", "V")}},
+        ),
+        (
+            {"p": ["kerning", "kern", "groupsSide1"], "f": "=", "a": ["A", ["A"]]},
+            None,
+        ),
+        (
+            {"p": ["kerning", "kern", "sourceIdentifiers"], "f": "+", "a": [0, "x"]},
+            None,
+        ),
+        ({"p": ["kerning"], "f": "d", "a": ["kern"]}, None),
+    ],
+)
+def test_collectKerningPairChanges(change, expectedPairs):
+    assert collectKerningPairChanges(change) == expectedPairs
+
+
+async def test_fontHandler_editKerningValue(tmp_path, monkeypatch):
+    for fn in mutatorFiles:
+        srcPath = mutatorSansDir / fn
+        if srcPath.is_dir():
+            shutil.copytree(srcPath, tmp_path / fn)
+        else:
+            shutil.copy(srcPath, tmp_path / fn)
+
+    writtenKerningPaths = []
+
+    def writeKerning(self, kerning, validate=None):
+        writtenKerningPaths.append(self.fs.getsyspath("/"))
+        return originalWriteKerning(self, kerning, validate)
+
+    originalWriteKerning = UFOReaderWriter.writeKerning
+    monkeypatch.setattr(UFOReaderWriter, "writeKerning", writeKerning)
+
+    fontHandler = FontHandler(DesignspaceBackend.fromPath(tmp_path / dsFileName))
+    async with aclosing(fontHandler):
+        await fontHandler.startTasks()
+        kerning = await fontHandler.getKerning(connection=None)
+        kernTable = kerning["kern"]
+        sourceIndex = 2
+        sourceIdentifier = kernTable.sourceIdentifiers[sourceIndex]
+        oldValue = kernTable.values["T"]["@A"][sourceIndex]
+
+        change = {
+            "p": ["kerning", "kern", "values", "T", "@A"],
+            "f": "=",
+            "a": [sourceIndex, -100],
+        }
+        rollbackChange = {
+            "p": ["kerning", "kern", "values", "T", "@A"],
+            "f": "=",
+            "a": [sourceIndex, oldValue],
+        }
+        await fontHandler.editFinal(
+            change, rollbackChange, "Test edit", False, connection=None
+        )
+        await fontHandler.finishWriting()
+
+    # Only the kerning of the affected source was written
+    dsSource = fontHandler.backend.dsSources.findItem(identifier=sourceIdentifier)
+    assert [os.path.normpath(p) for p in writtenKerningPaths] == [
+        os.path.normpath(dsSource.layer.path)
+    ]
+
+    reopenedBackend = DesignspaceBackend.fromPath(tmp_path / dsFileName)
+    reopenedKerning = await reopenedBackend.getKerning()
+    expectedValues = list(kernTable.values["T"]["@A"])
+    expectedValues[sourceIndex] = -100
+    assert reopenedKerning["kern"].values["T"]["@A"] == expectedValues
@@ -1,6 +1,12 @@
+import os
+import pathlib
+
 import pytest
 
-from fontra.core.glyphdependencies import GlyphDependencies
+from fontra.core.glyphdependencies import (
+    GlyphDependencies,
+    readComponentInfoIncrementally,
+)
 
 
 @pytest.mark.parametrize(
@@ -34,3 +40,69 @@ def test_glyphdependencies(updates, expectedUsedBy, expectedMadeOf):
         deps.update(glyphName, componentNames)
     assert expectedUsedBy == deps.usedBy
     assert expectedMadeOf == deps.madeOf
+
+
+def test_getUsedByRecursively():
+    deps = GlyphDependencies()
+    deps.update("Aacute", ["A", "acute"])
+    deps.update("Aacute.sc", ["Aacute"])
+    deps.update("Eacute", ["E", "acute"])
+    assert deps.getUsedByRecursively("A") == {"Aacute", "Aacute.sc"}
+    assert deps.getUsedByRecursively("acute") == {"Aacute", "Aacute.sc", "Eacute"}
+    assert deps.getUsedByRecursively("Aacute.sc") == set()
+
+
+def test_readComponentInfoIncrementally(tmp_path):
+    glyphsDir = tmp_path / "glyphs"
+    glyphsDir.mkdir()
+    cachePath = tmp_path / "cache" / "deps.json"
+    glyphData = {
+        "A": "",
+        "Aacute": "A acute",
+        "Adieresis": "A dieresis",
+    }
+    glyphPaths = {}
+    for glyphName, data in glyphData.items():
+        glyphPath = glyphsDir / f"{glyphName}.txt"
+        glyphPath.write_text(data)
+        glyphPaths[glyphName] = os.fspath(glyphPath)
+
+    parsedGlyphs = []
+
+    def readComponentNames(glyphName):
+        parsedGlyphs.append(glyphName)
+        return pathlib.Path(glyphPaths[glyphName]).read_text().split()
+
+    expectedComponentInfo = {"Aacute": {"A", "acute"}, "Adieresis": {"A", "dieresis"}}
+
+    componentInfo = readComponentInfoIncrementally(
+        glyphPaths, readComponentNames, cachePath
+    )
+    assert componentInfo == expectedComponentInfo
+    assert parsedGlyphs == ["A", "Aacute", "Adieresis"]
+    assert cachePath.exists()
+
+    # Nothing changed: nothing is parsed
+    parsedGlyphs.clear()
+    componentInfo = readComponentInfoIncrementally(
+        glyphPaths, readComponentNames, cachePath
+    )
+    assert componentInfo == expectedComponentInfo
+    assert parsedGlyphs == []
+
+    # Only the modified glyph is parsed
+    pathlib.Path(glyphPaths["Aacute"]).write_text("A acutecomb")
+    componentInfo = readComponentInfoIncrementally(
+        glyphPaths, readComponentNames, cachePath
+    )
+    assert componentInfo["Aacute"] == {"A", "acutecomb"}
+    assert parsedGlyphs == ["Aacute"]
+
+    # Deleted glyphs are dropped
+    parsedGlyphs.clear()
+    del glyphPaths["Adieresis"]
+    componentInfo = readComponentInfoIncrementally(
+        glyphPaths, readComponentNames, cachePath
+    )
+    assert componentInfo == {"Aacute": {"A", "acutecomb"}}
+    assert parsedGlyphs == []
@@ -525,29 +525,29 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((2.02188947796526, 114.44248589396727), "line", False, "test-name"),
+                ((2.021889477965267, 114.44248589396727), "line", False, "test-name"),
                 {},
             ),
             (
                 "addPoint",
-                ((298.9376689130037, 475.11570144436826), "line", False, None),
+                ((298.93766891300373, 475.1157014443683), "line", False, None),
                 {"identifier": "test-identifier"},
             ),
             (
                 "addPoint",
-                ((250.6543270564456, 483.6293573324498), "line", False, None),
+                ((250.6543270564456, 483.62935733244984), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
             ("beginPath", (), {}),
             (
                 "addPoint",
-                ((36.94006021365214, 196.77967457268454), "line", False, None),
+                ((36.940060213652146, 196.77967457268454), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((223.78536451437924, 163.83380620578296), "line", False, None),
+                ((223.78536451437918, 163.83380620578296), "line", False, None),
                 {},
             ),
             (
@@ -557,7 +557,7 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((58.92577449936642, 234.86004875623456), "line", False, None),
+                ((58.925774499366426, 234.86004875623456), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
@@ -569,39 +569,39 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((222.8227346564206, 75.50933952577302), "line", False, None),
+                ((222.82273465642064, 75.509339525773), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((351.9819728503015, 465.7625594873224), "line", False, None),
+                ((351.9819728503015, 465.76255948732245), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((289.59540369796736, 476.7629948627134), "line", False, None),
+                ((289.59540369796736, 476.76299486271347), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
             ("beginPath", (), {}),
             (
                 "addPoint",
-                ((243.16222620971098, 435.5098008676184), "line", False, None),
+                ((243.16222620971098, 435.5098008676185), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((302.7640816921785, 425.00038564577267), "line", False, None),
+                ((302.7640816921785, 425.0003856457727), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((328.6712245493213, 469.87287335328926), "line", False, None),
+                ((328.6712245493214, 469.8728733532893), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((269.0693690668538, 480.382288575135), "line", False, None),
+                ((269.0693690668538, 480.3822885751351), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
@@ -613,12 +613,12 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((522.1845334668569, 267.2812134714493), "line", False, None),
+                ((522.184533466857, 267.2812134714493), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((542.6968355311285, 280.9818419783232), "line", False, None),
+                ((542.6968355311285, 280.98184197832313), "line", False, None),
                 {},
             ),
             (
@@ -628,7 +628,7 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((635.9667775150534, 372.1816653876062), "line", False, None),
+                ((635.9667775150534, 372.18166538760613), "line", False, None),
                 {},
             ),
             (
@@ -643,29 +643,29 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((505.0421836303484, 395.57106728257884), "line", False, None),
+                ((505.0421836303484, 395.5710672825789), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
             ("beginPath", (), {}),
             (
                 "addPoint",
-                ((340.6464215090458, -47.82393177752656), "line", False, None),
+                ((340.6464215090458, -47.82393177752658), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((466.8478484379359, -25.5712152060554), "line", False, None),
+                ((466.84784843793597, -25.5712152060554), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((477.3224877982471, 15.693289543226811), "line", False, None),
+                ((477.32248779824715, 15.693289543226797), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((507.8306312017506, 25.452425380683934), "line", False, None),
+                ((507.8306312017505, 25.452425380683948), "line", False, None),
                 {},
             ),
             (
@@ -675,17 +675,17 @@ penTestData = [
             ),
             (
                 "addPoint",
-                ((449.0698602755021, 219.82208518555004), "line", False, None),
+                ((449.06986027550215, 219.82208518555007), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((443.1310925992931, 186.14166003253254), "line", False, None),
+                ((443.13109259929314, 186.14166003253257), "line", False, None),
                 {},
             ),
             (
                 "addPoint",
-                ((379.93605818796544, 174.9986704190156), "line", False, None),
+                ((379.93605818796544, 174.99867041901564), "line", False, None),
                 {},
             ),
             ("endPath", (), {}),
@@ -722,6 +722,120 @@ async def test_anchorInterpolation(instancer):
     _ = glyphInstancer.instantiate({"Weight": 400})
 
 
+async def test_instanceCache(instancer):
+    glyphInstancer = await instancer.getGlyphInstancer("A", True)
+    instance1 = glyphInstancer.instantiate({"weight": 500})
+    instance2 = glyphInstancer.instantiate({"weight": 500, "width": 0})
+    assert (glyphInstancer.instanceCacheHits, glyphInstancer.instanceCacheMisses) == (
+        1,
+        1,
+    )
+    assert instance1.glyph == instance2.glyph
+    assert instance1.parentLocation == {"weight": 500}
+    assert instance2.parentLocation == {"weight": 500, "width": 0}
+
+    instance3 = glyphInstancer.instantiate({"weight": 600})
+    assert instance3.glyph != instance1.glyph
+    assert glyphInstancer.instanceCacheMisses == 2
+
+    # Each instance has its own copy of the cached glyph
+    assert instance1.glyph is not instance2.glyph
+    instance1.glyph.path.coordinates[0] += 10
+    instance1.glyph.xAdvance = 0
+    instance4 = glyphInstancer.instantiate({"weight": 500})
+    assert instance4.glyph == instance2.glyph
+    assert instance4.glyph != instance1.glyph
+
+    instancer.dropGlyphInstancerFromCache("A")
+    assert not glyphInstancer._instanceCache
+    assert glyphInstancer is not await instancer.getGlyphInstancer("A")
+
+
+async def test_glyphInstancerCacheSize(testFont):
+    instancer = FontInstancer(testFont, glyphInstancerCacheSize=2)
+    for glyphName in ["A", "B", "C"]:
+        await instancer.getGlyphInstancer(glyphName, True)
+    assert list(instancer.glyphInstancers) == ["B", "C"]
+
+
+async def test_invalidateGlyph(instancer):
+    for glyphName in ["nestedcomponents", "B"]:
+        await instancer.getGlyphInstancer(glyphName, True)
+    glyphInstancer = await instancer.getGlyphInstancer("nestedcomponents")
+    await glyphInstancer.instantiate({}).getDecomposedPath()
+    assert {"nestedcomponents", "varcotest1", "varcotest2", "A", "B"} == set(
+        instancer.glyphInstancers
+    )
+
+    instancer.invalidateGlyph("A")
+    assert {"varcotest2", "B"} == set(instancer.glyphInstancers)
+
+    instancer.invalidateGlyph("B")
+    assert {"varcotest2"} == set(instancer.glyphInstancers)
+
+
+async def test_decomposedPathCache(instancer, testFont):
+    paths = []
+    for glyphName in ["Aacute", "Adieresis"]:
+        glyphInstancer = await instancer.getGlyphInstancer(glyphName)
+        paths.append(
+            await glyphInstancer.instantiate({"weight": 500}).getDecomposedPath()
+        )
+    # "A" is shared between both glyphs, "dot" is used twice in "dieresis"
+    assert instancer.decomposedPathCacheMisses == 4
+    assert instancer.decomposedPathCacheHits == 2
+    # Cache hits don't instantiate the component glyph
+    instancerA = await instancer.getGlyphInstancer("A")
+    assert instancerA.instanceCacheHits + instancerA.instanceCacheMisses == 1
+
+    uncachedInstancer = FontInstancer(testFont, decomposedPathCacheSize=0)
+    for glyphName, path in zip(["Aacute", "Adieresis"], paths):
+        glyphInstancer = await uncachedInstancer.getGlyphInstancer(glyphName)
+        uncachedPath = await glyphInstancer.instantiate(
+            {"weight": 500}
+        ).getDecomposedPath()
+        assert path.coordinates == pytest.approx(uncachedPath.coordinates)
+        assert path.pointTypes == uncachedPath.pointTypes
+        assert path.contourInfo == uncachedPath.contourInfo
+
+    instancer.invalidateGlyph("A")
+    assert {key[0] for key in instancer._decomposedPathCache} == {
+        "acute",
+        "dieresis",
+        "dot",
+    }
+
+
+async def test_instantiateMany(instancer, testFont):
+    glyphNames = ["A", "B", "period"]
+    locations = [{"weight": 100 * i, "width": 50 * i} for i in range(1, 9)]
+    instances = await instancer.instantiateMany(
+        glyphNames, locations, coordSystem=LocationCoordinateSystem.USER
+    )
+    assert list(instances) == glyphNames
+
+    referenceInstancer = FontInstancer(testFont)
+    for glyphName in glyphNames:
+        glyphInstancer = await referenceInstancer.getGlyphInstancer(glyphName)
+        assert [instance.glyph for instance in instances[glyphName]] == [
+            glyphInstancer.instantiate(
+                location, coordSystem=LocationCoordinateSystem.USER
+            ).glyph
+            for location in locations
+        ]
+
+
+async def test_instantiateMany_sharedScalars(instancer):
+    glyphInstancer1 = await instancer.getGlyphInstancer("C")
+    glyphInstancer2 = await instancer.getGlyphInstancer("V")
+    locations = [{"weight": 300}, {"weight": 600}, {"weight": 600, "width": 0}]
+    scalarsCache: dict = {}
+    glyphInstancer1.instantiateMany(locations, scalarsCache=scalarsCache)
+    assert len(scalarsCache) == 2
+    glyphInstancer2.instantiateMany(locations, scalarsCache=scalarsCache)
+    assert len(scalarsCache) == 2
+
+
 testData_FontSourcesInstancer = [
     (
         {},
@@ -0,0 +1,199 @@
+import io
+import os
+import pathlib
+from contextlib import aclosing
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from PIL import Image
+
+from fontra.backends import getFileSystemBackend
+from fontra.core.fonthandler import FontHandler
+from fontra.core.server import FontraServer
+from fontra.core.thumbnails import (
+    FontHandlerReader,
+    GlyphThumbnailRenderer,
+    ThumbnailDiskCache,
+)
+from fontra.filesystem.projectmanager import FileSystemProjectManager
+
+dataDir = pathlib.Path(__file__).resolve().parent / "data"
+commonFontsDir = pathlib.Path(__file__).parent.parent / "test-common" / "fonts"
+
+
+@pytest.fixture
+def testFontHandler():
+    backend = getFileSystemBackend(commonFontsDir / "MutatorSans.fontra")
+    return FontHandler(backend)
+
+
+def decodeImage(data):
+    return Image.open(io.BytesIO(data))
+
+
+async def test_thumbnail(testFontHandler, tmpdir):
+    cacheDir = pathlib.Path(tmpdir)
+    async with aclosing(testFontHandler):
+        renderer = GlyphThumbnailRenderer(
+            FontHandlerReader(testFontHandler), ThumbnailDiskCache(cacheDir)
+        )
+        thumbnail = await renderer.getThumbnail("A", {"weight": 500}, 48)
+        assert thumbnail is not None
+
+        image = decodeImage(thumbnail.data)
+        assert image.format == "PNG"
+        assert image.size == (48, 48)
+        alpha = image.getchannel("A")
+        minAlpha, maxAlpha = alpha.getextrema()
+        assert minAlpha == 0
+        assert maxAlpha == 255
+
+        cachedFiles = list(cacheDir.glob("*/*.png"))
+        assert [p.stem for p in cachedFiles] == [thumbnail.key]
+
+        # A different size or location gives a different key
+        assert await renderer.getThumbnailKey("A", {"weight": 500}, 32) != (
+            thumbnail.key
+        )
+        assert await renderer.getThumbnailKey("A", {"weight": 900}, 48) != (
+            thumbnail.key
+        )
+
+        assert await renderer.getThumbnail("no-such-glyph", {}, 48) is None
+
+
+async def test_thumbnail_cache(testFontHandler, tmpdir):
+    cacheDir = pathlib.Path(tmpdir)
+    async with aclosing(testFontHandler):
+        renderer = GlyphThumbnailRenderer(
+            FontHandlerReader(testFontHandler), ThumbnailDiskCache(cacheDir)
+        )
+        thumbnail = await renderer.getThumbnail("B", {}, 32)
+        assert thumbnail is not None
+
+        # Overwrite the cached file, to check that it is used
+        cachePath = cacheDir / thumbnail.key[:2] / f"{thumbnail.key}.png"
+        cachePath.write_bytes(b"cached")
+        cachedThumbnail = await renderer.getThumbnail("B", {}, 32)
+        assert cachedThumbnail is not None
+        assert cachedThumbnail.key == thumbnail.key
+        assert cachedThumbnail.data == b"cached"
+
+
+async def test_thumbnail_componentChange(testFontHandler, tmpdir):
+    async with aclosing(testFontHandler):
+        renderer = GlyphThumbnailRenderer(
+            FontHandlerReader(testFontHandler),
+            ThumbnailDiskCache(pathlib.Path(tmpdir)),
+        )
+        thumbnail = await renderer.getThumbnail("Aacute", {}, 32)
+        assert thumbnail is not None
+
+        # Modify a component glyph, as an edit would do: the key must change
+        glyph = await testFontHandler.getGlyph("acute")
+        for layer in glyph.layers.values():
+            layer.glyph.path.coordinates[0] += 100
+
+        newThumbnail = await renderer.getThumbnail("Aacute", {}, 32)
+        assert newThumbnail is not None
+        assert newThumbnail.key != thumbnail.key
+        assert newThumbnail.data != thumbnail.data
+
+
+async def test_thumbnail_snapshot(testFontHandler, tmpdir):
+    async with aclosing(testFontHandler):
+        renderer = GlyphThumbnailRenderer(
+            FontHandlerReader(testFontHandler),
+            ThumbnailDiskCache(pathlib.Path(tmpdir)),
+        )
+        snapshot = await renderer.getSnapshot("Aacute", {}, 32)
+        assert snapshot is not None
+        assert ["A", "Aacute", "acute"] == sorted(snapshot.glyphs)
+
+        # Edit a component glyph after taking the snapshot: the thumbnail
+        # rendered from the snapshot must not reflect the edit
+        glyph = await testFontHandler.getGlyph("acute")
+        for layer in glyph.layers.values():
+            layer.glyph.path.coordinates[0] += 100
+
+        thumbnail = await renderer.getThumbnailFromSnapshot(snapshot)
+        assert thumbnail.key == snapshot.key
+        editedThumbnail = await renderer.getThumbnail("Aacute", {}, 32)
+        assert editedThumbnail is not None
+        assert editedThumbnail.key != snapshot.key
+        assert editedThumbnail.data != thumbnail.data
+
+
+async def test_thumbnail_cachePruning(tmpdir):
+    cacheDir = pathlib.Path(tmpdir)
+    diskCache = ThumbnailDiskCache(cacheDir, maxSize=1000)
+    keys = [f"{i:02}{'x' * 62}" for i in range(12)]
+    for key in keys[:10]:
+        await diskCache.put(key, b"-" * 100)
+    assert len(list(cacheDir.glob("*/*.png"))) == 10
+
+    # Reading a thumbnail marks it as recently used
+    for i, key in enumerate(keys[:10]):
+        path = cacheDir / key[:2] / f"{key}.png"
+        os.utime(path, (1000 + i, 1000 + i))
+    assert await diskCache.get(keys[0]) is not None
+
+    await diskCache.put(keys[10], b"-" * 100)
+    remainingKeys = sorted(p.stem for p in cacheDir.glob("*/*.png"))
+    assert sum(p.stat().st_size for p in cacheDir.glob("*/*.png")) <= 800
+    # The least recently used thumbnails were deleted
+    assert [key for key in keys[:11] if key not in remainingKeys] == keys[1:4]
+
+
+@pytest.fixture
+async def thumbnailClient(tmpdir):
+    server = FontraServer(
+        host="localhost",
+        httpPort=0,
+        projectManager=FileSystemProjectManager(commonFontsDir),
+        thumbnailCacheDir=pathlib.Path(tmpdir),
+    )
+    server.setup()
+    async with TestClient(TestServer(server.httpApp)) as client:
+        yield client
+
+
+async def test_thumbnailHandler(thumbnailClient):
+    params = {"project": "MutatorSans.fontra", "glyph": "A", "size": "40"}
+    response = await thumbnailClient.get("/thumbnail", params=params)
+    assert response.status == 200
+    assert response.content_type == "image/png"
+    assert decodeImage(await response.read()).size == (40, 40)
+    etag = response.headers["ETag"]
+
+    response = await thumbnailClient.get(
+        "/thumbnail", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status == 304
+    assert response.headers["ETag"] == etag
+
+    response = await thumbnailClient.get(
+        "/thumbnail", params=params | {"location": '{"weight": 900}'}
+    )
+    assert response.status == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize(
+    "params, expectedStatus",
+    [
+        ({"location": "not json"}, 400),
+        ({"location": "[1, 2]"}, 400),
+        ({"location": '{"weight": "bold"}'}, 400),
+        ({"size": "big"}, 400),
+        ({"size": "0"}, 400),
+        ({"size": "100000"}, 400),
+        ({"glyph": ""}, 400),
+        ({"glyph": "no-such-glyph"}, 404),
+        ({"project": "NoSuchFont.fontra"}, 403),
+    ],
+)
+async def test_thumbnailHandler_errors(thumbnailClient, params, expectedStatus):
+    params = {"project": "MutatorSans.fontra", "glyph": "A"} | params
+    response = await thumbnailClient.get("/thumbnail", params=params)
+    assert response.status == expectedStatus
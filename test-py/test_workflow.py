@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import pathlib
 import shutil
 import subprocess
+from collections import Counter
 
 import pytest
 import yaml
@@ -13,7 +15,8 @@ from fontra.core.path import PackedPath
 from fontra.core.protocols import ReadableFontBackend
 from fontra.workflow.actions import FilterActionProtocol, getActionClass
 from fontra.workflow.actions import glyph as _  # noqa  for test_scaleAction
-from fontra.workflow.workflow import Workflow, substituteStrings
+from fontra.workflow.actions.base import SharedGlyphReads
+from fontra.workflow.workflow import Workflow, processOutputs, substituteStrings
 
 dataDir = pathlib.Path(__file__).resolve().parent / "data"
 workflowDataDir = dataDir / "workflow"
@@ -1652,6 +1655,153 @@ async def test_workflow_actions(
     assert expectedLog == record_tuples
 
 
+class GlyphReadCounter:
+    def __init__(self, backend):
+        self.backend = backend
+        self.glyphReadCounts = Counter()
+
+    def __getattr__(self, attrName):
+        return getattr(self.backend, attrName)
+
+    async def getGlyph(self, glyphName):
+        self.glyphReadCounts[glyphName] += 1
+        return await self.backend.getGlyph(glyphName)
+
+
+async def test_processOutputs_parallel(testFontraFont, tmpdir, monkeypatch):
+    # Don't let the cache of recent glyphs hide what concurrent reads share
+    monkeypatch.setattr(SharedGlyphReads, "recentGlyphsCacheSize", 1)
+    tmpdir = pathlib.Path(tmpdir)
+    config = yaml.safe_load(
+        """
+        steps:
+        - filter: scale
+          scaleFactor: 2
+        - fork:
+          steps:
+          - output: fontra-write
+            destination: output1.fontra
+        - output: fontra-write
+          destination: output2.fontra
+        """
+    )
+    input = GlyphReadCounter(testFontraFont)
+    workflow = Workflow(config=config, parentDir=pathlib.Path())
+
+    async with workflow.endPoints(input, maxParallelOutputs=2) as endPoints:
+        await processOutputs(endPoints.outputs, tmpdir, maxParallelOutputs=2)
+
+    # The outputs share the scaled glyphs
+    glyphMap = await testFontraFont.getGlyphMap()
+    assert set(glyphMap) == set(input.glyphReadCounts)
+    assert {1} == set(input.glyphReadCounts.values())
+
+    assert directoryTreeToList(tmpdir / "output1.fontra") == directoryTreeToList(
+        tmpdir / "output2.fontra"
+    )
+
+
+async def test_sharedGlyphReads_copies(testFontraFont):
+    sharedGlyphReads = SharedGlyphReads()
+
+    async with sharedGlyphReads.connect(GlyphReadCounter(testFontraFont)):
+        concurrentGlyphs = await asyncio.gather(
+            sharedGlyphReads.getGlyph("A"), sharedGlyphReads.getGlyph("A")
+        )
+        recentGlyph = await sharedGlyphReads.getGlyph("A")
+        glyphs = [*concurrentGlyphs, recentGlyph]
+        assert sharedGlyphReads.input.glyphReadCounts["A"] == 1
+        assert all(glyph == glyphs[0] for glyph in glyphs)
+        assert len({id(glyph) for glyph in glyphs}) == len(glyphs)
+
+        # Modifying a glyph doesn't affect other requests
+        for layer in glyphs[0].layers.values():
+            layer.glyph.xAdvance += 100
+        assert await sharedGlyphReads.getGlyph("A") == glyphs[1]
+
+
+singleOutputConfig = """
+steps:
+- filter: scale
+  scaleFactor: 2
+- output: fontra-write
+  destination: output1.fontra
+- filter: scale
+  scaleFactor: 2
+"""
+
+forkedOutputsConfig = """
+steps:
+- filter: scale
+  scaleFactor: 2
+- fork:
+  steps:
+  - output: fontra-write
+    destination: output1.fontra
+- output: fontra-write
+  destination: output2.fontra
+"""
+
+
+@pytest.mark.parametrize(
+    "configSource, maxParallelOutputs, expectedSharedInputs",
+    [
+        (singleOutputConfig, 1, [False]),
+        (singleOutputConfig, 4, [False]),
+        (forkedOutputsConfig, 1, [False, False]),
+        (forkedOutputsConfig, 2, [True, True]),
+    ],
+)
+async def test_sharedGlyphReadsInsertion(
+    testFontraFont, configSource, maxParallelOutputs, expectedSharedInputs
+):
+    config = yaml.safe_load(configSource)
+    workflow = Workflow(config=config, parentDir=pathlib.Path())
+
+    async with workflow.endPoints(
+        testFontraFont, maxParallelOutputs=maxParallelOutputs
+    ) as endPoints:
+        sharedInputs = [
+            isinstance(output.input, SharedGlyphReads) for output in endPoints.outputs
+        ]
+        assert expectedSharedInputs == sharedInputs
+
+
+class BlockingGlyphReader:
+    def __init__(self, backend):
+        self.backend = backend
+        self.cancelledGlyphReads = []
+
+    def __getattr__(self, attrName):
+        return getattr(self.backend, attrName)
+
+    async def getGlyph(self, glyphName):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelledGlyphReads.append(glyphName)
+            raise
+
+
+async def test_sharedGlyphReads_aclose(testFontraFont):
+    input = BlockingGlyphReader(testFontraFont)
+    sharedGlyphReads = SharedGlyphReads()
+
+    async with sharedGlyphReads.connect(input):
+        request = asyncio.create_task(sharedGlyphReads.getGlyph("A"))
+        await asyncio.sleep(0)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        # The shared read outlives the cancelled request
+        assert ["A"] == list(sharedGlyphReads._pendingGlyphs)
+        assert [] == input.cancelledGlyphReads
+
+        await sharedGlyphReads.aclose()
+        assert ["A"] == input.cancelledGlyphReads
+        assert not sharedGlyphReads._pendingGlyphs
+
+
 @pytest.mark.parametrize(
     "sourceDict, substitutions, expectedDict",
     [